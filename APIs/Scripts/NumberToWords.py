@@ -0,0 +1,196 @@
+import re
+from functools import lru_cache
+
+# Offline Sinhala number verbalizer.
+#
+# Every number is read the way it is spoken: small numbers have a standalone
+# form (විස්ස, දෙක) and a prefix form that is glued to whatever follows
+# (විසි, දෙ), e.g. 22000 -> විසිදෙදහස. Large numbers use දහස් up to 99,999,
+# ලක්ෂ up to 999,999 and මිලියන / බිලියන / ට්‍රිලියන above that. Years are
+# read as plain cardinals (2024 -> දෙදහස් විසිහතර).
+
+ZERO = "බිංදුව"
+MINUS = "සෘණ"
+DECIMAL_POINT = "දශම"
+PERCENT = "සියයට"
+
+UNITS = {
+    1: "එක", 2: "දෙක", 3: "තුන", 4: "හතර", 5: "පහ", 6: "හය", 7: "හත", 8: "අට", 9: "නවය",
+    10: "දහය", 11: "එකොළහ", 12: "දොළහ", 13: "දහතුන", 14: "දාහතර",
+    15: "පහළොව", 16: "දාසය", 17: "දාහත", 18: "දහඅට", 19: "දහනවය",
+}
+
+UNIT_PREFIXES = {
+    1: "එක්", 2: "දෙ", 3: "තුන්", 4: "හාර", 5: "පන්", 6: "හය", 7: "හත්", 8: "අට", 9: "නව",
+    10: "දස", 11: "එකොළොස්", 12: "දොළොස්", 13: "දහතුන්", 14: "දාහතර",
+    15: "පහළොස්", 16: "දාසය", 17: "දාහත්", 18: "දහඅට", 19: "දහනව",
+}
+
+# Ordinals keep the full stem for a few numbers (හතරවැනි, පස්වැනි, දහවැනි)
+ORDINAL_PREFIXES = {**UNIT_PREFIXES, 4: "හතර", 5: "පස්", 10: "දහ"}
+FIRST = "පළමු"
+ORDINAL_SUFFIX = "වැනි"
+
+TENS = {2: "විස්ස", 3: "තිහ", 4: "හතළිහ", 5: "පනහ", 6: "හැට", 7: "හැත්තෑව", 8: "අසූව", 9: "අනූව"}
+TENS_PREFIXES = {2: "විසි", 3: "තිස්", 4: "හතළිස්", 5: "පනස්", 6: "හැට", 7: "හැත්තෑ", 8: "අසූ", 9: "අනූ"}
+
+HUNDRED_PREFIXES = {1: "එක", 2: "දෙ", 3: "තුන්", 4: "හාර", 5: "පන්", 6: "හය", 7: "හත්", 8: "අට", 9: "නව"}
+
+# (value, form used when more words follow, form used at the end)
+SCALES = [
+    (10**12, "ට්‍රිලියන", "ට්‍රිලියනය"),
+    (10**9, "බිලියන", "බිලියනය"),
+    (10**6, "මිලියන", "මිලියනය"),
+    (10**5, "ලක්ෂ", "ලක්ෂය"),
+    (10**3, "දහස්", "දහස"),
+]
+
+CURRENCIES = {
+    "Rs": ("රුපියල්", "ශත"),
+    "රු": ("රුපියල්", "ශත"),
+    "LKR": ("රුපියල්", "ශත"),
+    "$": ("ඩොලර්", "ශත"),
+}
+
+NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+ORDINAL_PATTERN = re.compile(r"(\d+)\s*(වැනි|වෙනි|වන)")
+CURRENCY_PATTERN = re.compile(r"(Rs|රු|LKR|\$)\.?\s*(\d{1,3}(?:,\d{3})+|\d+)(?:\.(\d{1,2}))?(?!\d)")
+PERCENT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+THOUSANDS_PATTERN = re.compile(r"\d{1,3}(?:,\d{3})+")
+
+
+def _below_hundred(n, terminal, ordinal=False):
+    prefixes = ORDINAL_PREFIXES if ordinal else UNIT_PREFIXES
+    if n < 20:
+        return UNITS[n] if terminal else prefixes[n]
+    tens, units = divmod(n, 10)
+    if units == 0:
+        return TENS[tens] if terminal else TENS_PREFIXES[tens]
+    return TENS_PREFIXES[tens] + (UNITS[units] if terminal else prefixes[units])
+
+
+def _below_thousand(n, terminal, ordinal=False):
+    hundreds, rest = divmod(n, 100)
+    words = []
+    if hundreds:
+        words.append(HUNDRED_PREFIXES[hundreds] + ("සියය" if terminal and rest == 0 else "සිය"))
+    if rest:
+        words.append(_below_hundred(rest, terminal, ordinal))
+    return " ".join(words)
+
+
+@lru_cache(maxsize=8192)
+def _cardinal(n, terminal=True, ordinal=False):
+    """
+    Spells out a non-negative integer. With `terminal=False` the last word is
+    returned in its prefix form so it can be joined with a following word.
+    """
+    if n == 0:
+        return ZERO
+    words = []
+    for value, combining, final in SCALES:
+        if n >= value:
+            count, n = divmod(n, value)
+            count_words = _cardinal(count, terminal=False)
+            scale = final if terminal and n == 0 else combining
+            words.append(count_words + scale if count < 100 else f"{count_words} {scale}")
+    if n:
+        words.append(_below_thousand(n, terminal, ordinal))
+    return " ".join(words)
+
+
+def cardinal_to_sinhala(number):
+    """Spells out an integer, e.g. 1254 -> එක්දහස් දෙසිය පනස්හතර."""
+    number = int(number)
+    if number < 0:
+        return f"{MINUS} {_cardinal(-number)}"
+    return _cardinal(number)
+
+
+def ordinal_to_sinhala(number, suffix=ORDINAL_SUFFIX):
+    """Spells out an ordinal, e.g. 1 -> පළමුවැනි, 21 -> විසිඑක්වැනි."""
+    number = int(number)
+    if number == 1:
+        return FIRST + suffix
+    return _cardinal(number, terminal=False, ordinal=True) + suffix
+
+
+def digits_to_sinhala(digits):
+    """Reads a digit string one digit at a time, e.g. phone numbers."""
+    return " ".join(UNITS.get(int(digit), ZERO) for digit in digits)
+
+
+def decimal_to_sinhala(number):
+    """Spells out a decimal number, e.g. 12.05 -> දොළොස් දශම බිංදුව පහ."""
+    whole, _, fraction = str(number).replace(",", "").partition(".")
+    negative = whole.startswith("-")
+    whole = _cardinal(int(whole.lstrip("-") or 0), terminal=False)
+    words = f"{whole} {DECIMAL_POINT} {digits_to_sinhala(fraction)}" if fraction else whole
+    return f"{MINUS} {words}" if negative else words
+
+
+def currency_to_sinhala(amount, currency="Rs"):
+    """Spells out a money amount, e.g. Rs. 1500.50 -> රුපියල් එක්දහස් පන්සියය ශත පනහ."""
+    unit, subunit = CURRENCIES[currency]
+    whole, _, cents = str(amount).replace(",", "").partition(".")
+    words = f"{unit} {_cardinal(int(whole or 0))}"
+    if cents and int(cents):
+        words += f" {subunit} {_cardinal(int(cents.ljust(2, '0')[:2]))}"
+    return words
+
+
+@lru_cache(maxsize=8192)
+def number_to_sinhala(number):
+    """
+    Converts a single number token to Sinhala words.
+
+    Handles plain integers, negative numbers, thousands separators (1,500),
+    decimals (3.14) and numbers with leading zeros. Short zero-padded values
+    such as days and minutes (06) are read as numbers, longer ones such as
+    phone numbers (0771234567) are read digit by digit.
+    Raises ValueError if the token is not a number.
+    """
+    token = str(number).strip()
+    negative = token.startswith("-")
+    token = token.lstrip("-")
+    if not re.fullmatch(r"\d+(?:[.,]\d+)*", token):
+        raise ValueError(f"Not a number: {number}")
+
+    if THOUSANDS_PATTERN.fullmatch(token) or re.fullmatch(r"\d{1,3}(?:,\d{3})+\.\d+", token):
+        token = token.replace(",", "")
+    if "," in token or token.count(".") > 1:
+        # Lists and dotted dates, read every part on its own
+        words = ", ".join(
+            " ".join(number_to_sinhala(part) for part in group.split(".")) for group in token.split(",")
+        )
+    elif "." in token:
+        words = decimal_to_sinhala(token)
+    elif len(token) > 2 and token.startswith("0"):
+        words = digits_to_sinhala(token)
+    else:
+        words = _cardinal(int(token))
+    return f"{MINUS} {words}" if negative else words
+
+
+def expand_symbols(text):
+    """
+    Replaces money amounts (`Rs. 250`, `$12.50`) and percentages (`12.5%`)
+    with words. Run this before symbols are stripped from the text.
+    """
+    text = CURRENCY_PATTERN.sub(
+        lambda match: currency_to_sinhala(
+            match.group(2) + (f".{match.group(3)}" if match.group(3) else ""), match.group(1)
+        ),
+        text,
+    )
+    return PERCENT_PATTERN.sub(lambda match: f"{PERCENT} {number_to_sinhala(match.group(1))}", text)
+
+
+def expand_numbers(text):
+    """
+    Replaces every number in a Sinhala sentence with words: money amounts,
+    ordinals (`2 වැනි`, `3 වන`), percentages, decimals and cardinals.
+    """
+    text = expand_symbols(text)
+    text = ORDINAL_PATTERN.sub(lambda match: ordinal_to_sinhala(match.group(1), match.group(2)), text)
+    return NUMBER_PATTERN.sub(lambda match: number_to_sinhala(match.group(0)), text)
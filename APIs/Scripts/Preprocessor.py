@@ -1,3 +1,4 @@
+import os
 import re
 import logging
 from selenium import webdriver
@@ -6,10 +7,16 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from datetime import datetime
+from Scripts.NumberToWords import number_to_sinhala, expand_symbols, expand_numbers
+from Scripts.Transliterator import transliterate
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Set TTS_ONLINE_TRANSLITERATION=true to romanize through pitaka.lk instead of
+# the local transliterator, e.g. to cross-check its output
+USE_ONLINE_TRANSLITERATION = os.environ.get("TTS_ONLINE_TRANSLITERATION", "false").lower() in ["true", "1", "yes"]
+
 # Sinhala month mapping
 SINHALA_MONTHS = {
     "01": "ජනවාරි",
@@ -108,36 +115,26 @@ def normalize_sinhala_text(text, driver):
 
 def convert_number_to_sinhala(driver, number):
     """
-    Converts a number to Sinhala words using the TrackerDisk website.
+    Converts a number to Sinhala words with the offline NumberToWords engine.
+    `driver` is no longer used and is only kept so existing callers keep working.
     """
     try:
-        driver.get("https://trackerdisk.com/calculators/conversions/numbers-to-sinhala-words")
-
-        input_field = WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.NAME, "input-number"))
-        )
-        input_field.clear()
-        input_field.send_keys(str(number))
-
-        convert_button = driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
-        convert_button.click()
-
-        output_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "number-to-word"))
-        )
-
-        WebDriverWait(driver, 10).until(
-            lambda d: output_field.text.strip() or output_field.get_attribute("value").strip()
-        )
-
-        sinhala_words = output_field.get_attribute("value") or output_field.text.strip()
-        return sinhala_words
-
-    except Exception as e:
+        return number_to_sinhala(number)
+    except ValueError as e:
         logging.error(f"Error converting number {number} to Sinhala words: {e}")
         return number  # Return original number if conversion fails
 
 def text_to_roman(driver, text):
+    """
+    Converts Sinhala text to Roman script with the local transliterator.
+    Falls back to the pitaka.lk converter only when online transliteration
+    is enabled and a WebDriver is given.
+    """
+    if USE_ONLINE_TRANSLITERATION and driver is not None:
+        return text_to_roman_online(driver, text)
+    return transliterate(text)
+
+def text_to_roman_online(driver, text):
     """
     Converts Sinhala text to Roman script using Selenium and an online tool.
     """
@@ -164,10 +161,12 @@ def preprocess_sinhala_text(driver, text):
     """
     Preprocesses Sinhala text by:
     - Handling dates and months in Sinhala
-    - Converting numbers to Sinhala words
+    - Converting numbers, ordinals, decimals and money amounts to Sinhala words
     - Normalizing text
     - Converting to Roman script
     """
+    text = expand_symbols(text)
+
     if contains_date_or_time(text):
         text = map_month_to_sinhala(text)
 
@@ -176,11 +175,7 @@ def preprocess_sinhala_text(driver, text):
 
     normalized_text = normalize_sinhala_text(text, driver)
 
-    numbers_in_text = re.findall(r"\b\d+\b", normalized_text)
-    for number in numbers_in_text:
-        sinhala_word = convert_number_to_sinhala(driver, number)
-        if sinhala_word:
-            normalized_text = normalized_text.replace(f" {number} ", f" {sinhala_word} ")
+    normalized_text = expand_numbers(normalized_text)
 
     roman_text = text_to_roman(driver, normalized_text)
 
@@ -1,9 +1,18 @@
+import time
 import logging
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from routes.text_processing import TextProcessingRouter
 from routes.ModelInference import ModelInferenceRouter
 from routes.AudioEnhancing import AudioEnhancingRouter
+from routes.AudioFiles import AudioFilesRouter
+from services.model_registry import model_registry, PRELOAD_SPEAKERS
+from services.webdriver_manager import webdriver_pool
+from services.clone_jobs import clone_job_queue
+from services.audio_store import audio_store
+from services import metrics
+from Scripts.Preprocessor import USE_ONLINE_TRANSLITERATION
 
 app = FastAPI()
 
@@ -14,15 +23,85 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Sample-Rate", "X-Cache", "X-Processing-Time", metrics.TRACE_HEADER, metrics.TRACE_ID_HEADER],
 )
 
+def route_label(request: Request) -> str:
+    """
+    Route template of the request (e.g. /api/clone-jobs/{job_id}) so metrics
+    aren't split per job id. The matched route doesn't know the router prefix,
+    which is recovered from the request path.
+    """
+    route = request.scope.get("route")
+    if route is None:
+        return "unmatched"
+    path = request.scope["path"]
+    for idx, char in enumerate(path):
+        if char == "/" and route.path_regex.match(path[idx:]):
+            return path[:idx] + route.path_format
+    return route.path_format
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    # Every stage the request runs through is recorded on this trace
+    trace = metrics.RequestTrace(request.headers.get(metrics.TRACE_ID_HEADER))
+    start_time = time.perf_counter()
+    with metrics.tracing(trace):
+        response = await call_next(request)
+
+    route_path = route_label(request)
+    metrics.requests_total.inc(method=request.method, route=route_path, status=response.status_code)
+    metrics.request_seconds.observe(time.perf_counter() - start_time, method=request.method, route=route_path)
+
+    # Streaming responses only carry the stages that ran before the first chunk
+    if metrics.TRACE_HEADER_ENABLED:
+        response.headers[metrics.TRACE_ID_HEADER] = trace.trace_id
+        if trace.stages:
+            response.headers[metrics.TRACE_HEADER] = trace.header_value()
+    return response
+
+@app.on_event("startup")
+def load_tts_models():
+    # Load the TTS checkpoints once so requests don't pay the cold start
+    model_registry.preload(PRELOAD_SPEAKERS)
+    print(f"Resident TTS models: {model_registry.resident_speakers()}")
+
+@app.on_event("startup")
+def warm_webdrivers():
+    # Browsers are only needed for the online scraping path
+    if USE_ONLINE_TRANSLITERATION:
+        webdriver_pool.warm()
+        print(f"WebDriver pool: {webdriver_pool.stats()}")
+
+@app.on_event("startup")
+def start_audio_store():
+    # Generated audio is only kept for a while, drop it once it expires
+    audio_store.start_sweeper()
+
+@app.on_event("shutdown")
+def stop_audio_store():
+    audio_store.close()
+
+@app.on_event("shutdown")
+def close_webdrivers():
+    webdriver_pool.close()
+
+@app.on_event("shutdown")
+def stop_clone_jobs():
+    clone_job_queue.shutdown()
+
 @app.get("/")
 def read_root():
     print("Root endpoint accessed")
     return {"message": "Welcome to Sinhala Text Processing API!"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def read_metrics():
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
+
 # Include the routers
 app.include_router(TextProcessingRouter, prefix="/api")
 app.include_router(ModelInferenceRouter, prefix="/api")
 app.include_router(AudioEnhancingRouter, prefix="/api")
+app.include_router(AudioFilesRouter, prefix="/api")
 
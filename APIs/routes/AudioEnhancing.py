@@ -1,11 +1,12 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
-from services.denoise_service import clean_audio_service
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
+from services.denoise_service import clean_audio_service, denoise_wav_bytes
 from pydantic import BaseModel
 
 AudioEnhancingRouter = APIRouter()
 
 class AudioInput(BaseModel):
+    # A file path, or the ID / URL of audio returned by an earlier request
     file_path: str
 
 @AudioEnhancingRouter.post("/clean_audio")
@@ -18,7 +19,24 @@ def cleanAudio(input_data: AudioInput):
         return JSONResponse(content={
             "status": "success",
             "message": result['message'],
-            "download_path": result['download_path']
+            "download_path": result['download_path'],
+            "audio_id": result['audio_id'],
+            "audio_url": result['audio_url'],
         })
     else:
         return JSONResponse(content={"status": "error", "message": result['message']}, status_code=500)
+
+@AudioEnhancingRouter.post("/clean_audio/raw")
+async def cleanAudioRaw(request: Request):
+    """
+    Cleans WAV audio sent as the request body and returns the cleaned WAV
+    directly, without storing anything on disk.
+    """
+    audio = await request.body()
+    if not audio:
+        raise HTTPException(status_code=400, detail="Request body must contain WAV audio")
+    try:
+        cleaned_audio = denoise_wav_bytes(audio)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Exception occurred: {str(e)}")
+    return Response(content=cleaned_audio, media_type="audio/wav")
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+from services.audio_store import audio_store
+
+AudioFilesRouter = APIRouter()
+
+def get_stored_audio(audio_id: str):
+    stored = audio_store.get(audio_id)
+    if stored is None:
+        raise HTTPException(status_code=404, detail=f"Audio {audio_id} not found or expired")
+    return stored
+
+@AudioFilesRouter.get("/audio/{audio_id}")
+def read_audio(audio_id: str):
+    stored = get_stored_audio(audio_id)
+    return FileResponse(stored.path, media_type=stored.media_type, filename=f"{audio_id}.{stored.extension}")
+
+@AudioFilesRouter.delete("/audio/{audio_id}")
+def delete_audio(audio_id: str):
+    stored = get_stored_audio(audio_id)
+    audio_store.delete(audio_id)
+    return {"status": "success", "message": "Audio deleted", "audio_id": stored.audio_id}
+
+@AudioFilesRouter.get("/audio")
+def audio_store_stats():
+    return audio_store.stats()
@@ -1,9 +1,16 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse, FileResponse, Response
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
+from typing import Optional
+from concurrent.futures import CancelledError
 import time
 import logging
 from services.tts_model import TTSModel
-from services.VoiceClone import VoiceCloner
+from services.synthesis_cache import synthesis_cache
+from services.audio_store import audio_store
+from TTS.utils.audio.encoders import StreamingAudioEncoder
+from services.clone_jobs import clone_job_queue, QueueFullError, SUCCEEDED, CANCELLED, FINISHED_STATES
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -14,6 +21,17 @@ ModelInferenceRouter = APIRouter()
 class ModelInput(BaseModel):
     preprocessed_text: str
     speakerID: str
+    # wav, pcm, flac, mp3, ogg or opus. Compressed formats are much smaller on the wire.
+    audio_format: str = "wav"
+    sample_rate: Optional[int] = None
+    bitrate: Optional[int] = None  # kbps, mp3 and opus only
+
+def make_encoder(input_data: ModelInput, sample_rate: int) -> StreamingAudioEncoder:
+    """Validates the requested output options, a bad combination is a 400."""
+    try:
+        return StreamingAudioEncoder(input_data.audio_format, sample_rate, input_data.sample_rate, input_data.bitrate)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e).replace(" [!] ", ""))
 
 class VoiceCloningInput(BaseModel):
     ReferenceWAV: str
@@ -27,6 +45,7 @@ def infer_tts(input_data: ModelInput):
     preprocessed_text = input_data.preprocessed_text
     
     print("Audio synthesize started")
+    tts_model = None
     try:
         # Pass speakerID and preprocessed_text dynamically
         tts_model = TTSModel(speakerID, preprocessed_text)
@@ -35,8 +54,10 @@ def infer_tts(input_data: ModelInput):
 
         logger.info(f"TTS model loaded for speaker: {speakerID}")
 
+        make_encoder(input_data, tts_model.model.synthesizer.output_sample_rate)
+
         # Generate speech with the provided data
-        response = tts_model.generate_speech()
+        response = tts_model.generate_speech(input_data.audio_format, input_data.sample_rate, input_data.bitrate)
         
         response["processing_time"] = round(time.time() - start_time, 2)
 
@@ -45,32 +66,144 @@ def infer_tts(input_data: ModelInput):
 
         return response
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("TTS inference error")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
-
-@ModelInferenceRouter.post("/Clone-tts")
-def clone_tts(input_data: VoiceCloningInput):
+    finally:
+        if tts_model is not None:
+            tts_model.close()
+
+@ModelInferenceRouter.post("/infer-tts/audio")
+def infer_tts_audio(input_data: ModelInput):
+    """
+    Returns the synthesized speech in the response body instead of a path,
+    so nothing is written to disk.
+    """
     start_time = time.time()
-    print("Voice Cloning started")
+    print("Audio synthesize started")
     try:
-        # Correct the initialization of VoiceCloner to use the right parameters
-        voice_cloner = VoiceCloner(referenceWAV=input_data.TargetWAV, targetWAV=input_data.ReferenceWAV)
-        if not voice_cloner:
-            raise HTTPException(status_code=500, detail="Failed to load Voice Cloner model.")
+        tts_model = TTSModel(input_data.speakerID, input_data.preprocessed_text)
+    except Exception as e:
+        logger.exception("TTS inference error")
+        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
-        # Removed the incorrect reference to input_data.speakerID
-        response = voice_cloner.clone_speech()
-        response["processing_time"] = round(time.time() - start_time, 2)
+    try:
+        encoder = make_encoder(input_data, tts_model.model.synthesizer.output_sample_rate)
+        audio, cached = tts_model.synthesize_audio(input_data.audio_format, input_data.sample_rate, input_data.bitrate)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("TTS inference error")
+        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+    finally:
+        tts_model.close()
+
+    return Response(
+        content=audio,
+        media_type=encoder.media_type,
+        headers={
+            "X-Sample-Rate": str(encoder.output_sample_rate),
+            "X-Cache": "HIT" if cached else "MISS",
+            "X-Processing-Time": str(round(time.time() - start_time, 2)),
+        },
+    )
+
+@ModelInferenceRouter.post("/infer-tts/stream")
+def infer_tts_stream(input_data: ModelInput):
+    print("Streaming audio synthesize started")
+    try:
+        tts_model = TTSModel(input_data.speakerID, input_data.preprocessed_text)
+    except Exception as e:
+        logger.exception("TTS inference error")
+        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
-        if response["status"] == "error":
-            raise HTTPException(status_code=500, detail=response["message"])
+    # Chunks are encoded as the sentences are synthesized
+    try:
+        encoder = make_encoder(input_data, tts_model.model.synthesizer.output_sample_rate)
+    except HTTPException:
+        tts_model.close()
+        raise
+    # The model is given back when the stream ends, or after the response if it was never iterated
+    return StreamingResponse(
+        tts_model.stream_speech(encoder),
+        media_type=encoder.media_type,
+        headers={"X-Sample-Rate": str(encoder.output_sample_rate)},
+        background=BackgroundTask(tts_model.close),
+    )
+
+@ModelInferenceRouter.get("/infer-tts/cache")
+def synthesis_cache_stats():
+    if synthesis_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **synthesis_cache.stats()}
+
+def submit_clone_job(input_data: VoiceCloningInput):
+    try:
+        return clone_job_queue.submit(referenceWAV=input_data.TargetWAV, targetWAV=input_data.ReferenceWAV)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "10"})
 
-        return response
+def get_clone_job(job_id: str):
+    job = clone_job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Voice cloning job {job_id} not found")
+    return job
 
-    except Exception as e:
-        logger.exception("Voice Cloning inference error")
-        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+@ModelInferenceRouter.post("/Clone-tts")
+def clone_tts(input_data: VoiceCloningInput):
+    """
+    Blocking voice cloning kept for existing clients. The conversion runs on
+    the shared clone worker pool, so it is bounded like the async jobs.
+    """
+    print("Voice Cloning started")
+    job = submit_clone_job(input_data)
+    try:
+        job.future.result()
+    except CancelledError:
+        # cancelled through /clone-jobs/{id}, or dropped from the queue on shutdown
+        raise HTTPException(status_code=500, detail=f"An error occurred: {job.error or CANCELLED}")
+
+    response = job.to_dict()
+    if job.status != SUCCEEDED:
+        raise HTTPException(status_code=500, detail=f"An error occurred: {job.error or job.status}")
+
+    response["status"] = "success"
+    response["message"] = "Voice cloning completed successfully"
+    return response
+
+@ModelInferenceRouter.post("/clone-jobs", status_code=202)
+def create_clone_job(input_data: VoiceCloningInput):
+    job = submit_clone_job(input_data)
+    return job.to_dict()
+
+@ModelInferenceRouter.get("/clone-jobs")
+def clone_jobs_stats():
+    return clone_job_queue.stats()
+
+@ModelInferenceRouter.get("/clone-jobs/{job_id}")
+def clone_job_status(job_id: str):
+    return get_clone_job(job_id).to_dict()
+
+@ModelInferenceRouter.get("/clone-jobs/{job_id}/result")
+def clone_job_result(job_id: str):
+    job = get_clone_job(job_id)
+    if job.status not in FINISHED_STATES:
+        raise HTTPException(status_code=409, detail=f"Voice cloning job {job_id} is still {job.status}")
+    if job.status != SUCCEEDED:
+        raise HTTPException(status_code=410, detail=f"Voice cloning job {job_id} {job.status}: {job.error}")
+    stored = audio_store.get(job.result["audio_id"])
+    if stored is None:
+        raise HTTPException(status_code=410, detail=f"Audio of voice cloning job {job_id} has expired")
+    return FileResponse(stored.path, media_type=stored.media_type, filename=f"{job_id}.wav")
+
+@ModelInferenceRouter.delete("/clone-jobs/{job_id}")
+def cancel_clone_job(job_id: str):
+    job = clone_job_queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Voice cloning job {job_id} not found")
+    return job.to_dict()
 
 # # Example usage
 # if __name__ == "__main__":
@@ -1,10 +1,13 @@
 import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List
 
-from services.webdriver_manager import WebDriverManager
-from Scripts.Preprocessor import preprocess_sinhala_text
+from services.webdriver_manager import webdriver_pool
+from services.metrics import stage
+from Scripts.Preprocessor import preprocess_sinhala_text, USE_ONLINE_TRANSLITERATION
 
 TextProcessingRouter = APIRouter()
 
@@ -15,11 +18,24 @@ class TextInput(BaseModel):
 class BatchTextInput(BaseModel):
     texts: List[str]
 
-try:
-    driver = WebDriverManager.get_driver()
-    print("Web Driver loaded successfully")
-except Exception as e:
-    print("Error occured with Loading web Driver")
+@contextmanager
+def preprocessing_driver():
+    """
+    Checks out a WebDriver from the pool when the online scraping path is
+    enabled. The local preprocessing pipeline doesn't need a browser.
+    """
+    if not USE_ONLINE_TRANSLITERATION:
+        yield None
+        return
+
+    with webdriver_pool.driver() as driver:
+        if driver is None:
+            raise HTTPException(status_code=503, detail="No WebDriver instance available for text processing.")
+        yield driver
+
+def preprocess_single(text: str):
+    with preprocessing_driver() as driver, stage("preprocess"):
+        return preprocess_sinhala_text(driver, text)
 
 # Optimized version of the preprocess function for a single text
 @TextProcessingRouter.post("/preprocess")
@@ -28,85 +44,63 @@ def preprocess_text(input_data: TextInput):
     API endpoint to preprocess a single Sinhala text.
     """
     print("Text Preprocessing pipeline started")
-    # Initialize the WebDriver instance
-    driver = WebDriverManager.get_driver()
-
-    if driver is None:
-        raise HTTPException(status_code=500, detail="Failed to initialize WebDriver instance for text processing.")
-
     start_time = time.time()  # Start time for processing
 
     try:
         # Process the input text
-        processed_text = preprocess_sinhala_text(driver, input_data.text)
+        processed_text = preprocess_single(input_data.text)
         if hasattr(processed_text, 'error'):  # Check if there is an error attribute
             raise HTTPException(status_code=400, detail=processed_text.error)
-        
+
         end_time = time.time()  # End time for processing
         processing_time = end_time - start_time  # Calculate elapsed time
 
-        try:
-            WebDriverManager.close_driver()
-            print("WebDriver closed successfully.")
-        except Exception as e:
-            print(f"Error closing WebDriver: {e}")
-
         return {
-            "original_text": input_data.text, 
+            "original_text": input_data.text,
             "processed_text": processed_text,
             "processing_time_seconds": processing_time
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An error occurred during processing: {str(e)}")
 
-# Sequential processing of batch texts
+def preprocess_batch_item(text: str):
+    try:
+        # Process the individual text
+        processed_text = preprocess_single(text)
+        if hasattr(processed_text, 'error'):  # Check if there is an error attribute
+            return {"original_text": text, "error": processed_text.error}
+        return {"original_text": text, "processed_text": processed_text}
+    except HTTPException as e:
+        return {"original_text": text, "error": e.detail}
+    except Exception as e:
+        return {"original_text": text, "error": str(e)}
+
+# Batch processing, fanned out across the WebDriver pool
 @TextProcessingRouter.post("/batch-preprocess")
 def batch_preprocess_text(input_data: BatchTextInput):
     """
-    API endpoint to preprocess multiple Sinhala texts in batch sequentially.
+    API endpoint to preprocess multiple Sinhala texts in batch.
     """
     print("Batch Preprocessing pipeline started")
-    processed_texts = []
     start_time = time.time()  # Start time for batch processing
     print(f"Processing {len(input_data.texts)} texts...")
-    
-    # Initialize the WebDriver once for the entire batch
-    driver = WebDriverManager.get_driver()
 
-    if driver is None:
-        raise HTTPException(status_code=500, detail="Failed to initialize WebDriver instance for batch processing.")
-    
-    try:
-        # Process each text sequentially
-        for text in input_data.texts:
-            try:
-                # Process the individual text
-                processed_text = preprocess_sinhala_text(driver, text)
-                if hasattr(processed_text, 'error'):  # Check if there is an error attribute
-                    processed_texts.append({"original_text": text, "error": processed_text.error})
-                else:
-                    processed_texts.append({"original_text": text, "processed_text": processed_text})
-            except Exception as e:
-                processed_texts.append({"original_text": text, "error": str(e)})
-
-    finally:
-        # Close the WebDriver after processing all texts
-        WebDriverManager.close_driver()
+    if USE_ONLINE_TRANSLITERATION:
+        # Every worker holds one pooled driver at a time, results keep the input order
+        with ThreadPoolExecutor(max_workers=webdriver_pool.size) as executor:
+            processed_texts = list(executor.map(preprocess_batch_item, input_data.texts))
+    else:
+        processed_texts = [preprocess_batch_item(text) for text in input_data.texts]
 
     end_time = time.time()  # End time for batch processing
     processing_time = end_time - start_time  # Calculate elapsed time for the batch
 
-    try:
-        WebDriverManager.close_driver()
-        print("WebDriver closed successfully.")
-    except Exception as e:
-        print(f"Error closing WebDriver: {e}")
-
-
     # Return the original and processed texts with the processing time
     return {
-        # "original_texts": input_data.texts, 
+        # "original_texts": input_data.texts,
         "processed_texts": processed_texts,
         "batch_processing_time_seconds": processing_time
     }
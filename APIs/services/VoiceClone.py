@@ -1,7 +1,10 @@
 import os
-import subprocess
+import io
+import threading
 import logging
-import torch
+from TTS.utils.synthesizer import Synthesizer
+from services.metrics import stage
+from services.audio_store import audio_store
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -14,59 +17,87 @@ YELLOW = "\033[33m"
 RESET = "\033[0m"  
 BLUE = "\033[94m"
 
+VC_MODEL_PATH = os.environ.get("TTS_VC_MODEL_PATH", "E:/UOM/FYP/TTSx/Model/VoiceConversionModel/model_file.pth")
+VC_CONFIG_PATH = os.environ.get("TTS_VC_CONFIG_PATH", "E:/UOM/FYP/TTSx/Model/VoiceConversionModel/config.json")
+VC_LANGUAGE = "en"
+
+class ResidentVoiceConverter:
+    """
+    Keeps the voice conversion checkpoint loaded between requests instead of
+    starting a new `tts` process, which reloads the model, for every clone.
+    """
+
+    def __init__(self, model_path: str = VC_MODEL_PATH, config_path: str = VC_CONFIG_PATH, use_cuda: bool = False):
+        self.model_path = model_path
+        self.config_path = config_path
+        self.use_cuda = use_cuda
+        self._synthesizer = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Synthesizer:
+        with self._lock:
+            if self._synthesizer is None:
+                if not os.path.exists(self.model_path) or not os.path.exists(self.config_path):
+                    logger.error(f"Model file {self.model_path} or {self.config_path} not found")
+                    raise FileNotFoundError("Model file not found")
+                logger.info("Loading voice conversion model")
+                self._synthesizer = Synthesizer(
+                    tts_checkpoint=self.model_path, tts_config_path=self.config_path, use_cuda=self.use_cuda
+                )
+            return self._synthesizer
+
+    def convert(self, reference_wav: str, speaker_wav: str, language: str = VC_LANGUAGE):
+        """Speaks the content of `reference_wav` in the voice of `speaker_wav`."""
+        synthesizer = self.get()
+        return synthesizer.tts(reference_wav=reference_wav, speaker_wav=speaker_wav, language_name=language)
+
+voice_converter = ResidentVoiceConverter()
+
 class VoiceCloner:
     def __init__(self, referenceWAV: str, targetWAV: str):
-        self.referenceWAV = referenceWAV  
-        self.targetWAV = targetWAV
+        # Either may be a file path or the ID of audio generated earlier
+        self.referenceWAV = audio_store.resolve(referenceWAV)
+        self.targetWAV = audio_store.resolve(targetWAV)
         self.model = self.load_model()
 
     def load_model(self):
-        self.model_path = f"E:/UOM/FYP/TTSx/Model/VoiceConversionModel/model_file.pth"
-        self.config_path = f"E:/UOM/FYP/TTSx/Model/VoiceConversionModel/config.json"
-        self.out_path = f"E:/UOM/FYP/TTSx/UI/ttsx/public/Audios/FinalInference.wav"
-
-        if not os.path.exists(self.model_path) or not os.path.exists(self.config_path):
-            logger.error(f"Model file {self.model_path} or {self.config_path} not found")
-            raise FileNotFoundError("Model file not found")
+        self.model_path = voice_converter.model_path
+        self.config_path = voice_converter.config_path
 
         try:
-            # Load the model
-            torch.load(self.model_path, map_location="cpu", weights_only=True)
+            # Loaded once and shared by every clone request
+            return voice_converter.get()
+        except FileNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise Exception(f"Failed to load TTS model: {str(e)}")
 
-    def clone_speech(self):
-        try:    
-            command = (
-                f'tts --reference_wav "{self.referenceWAV}" '
-                f'--model_path "{self.model_path}" '
-                f'--config_path "{self.config_path}" '
-                f'--speaker_wav "{self.targetWAV}" '
-                f'--out_path "{self.out_path}" '
-                f'--language_idx "en" ' 
-            )
+    def clone_wav_bytes(self) -> bytes:
+        """Returns the cloned speech as WAV bytes, encoded in memory."""
+        with stage("voice_conversion"):
+            wav = voice_converter.convert(self.referenceWAV, self.targetWAV)
+        buffer = io.BytesIO()
+        with stage("wav_encode"):
+            self.model.save_wav(wav, buffer)
+        return buffer.getvalue()
 
-            print(f"{BLUE}\nExecuted: {command} Successfully\n{RESET}")
-            result = os.system(command)
-            
-            if result != 0:
-                raise Exception(f"Command failed with exit code {result}")
+    def clone_speech(self, audio_id: str = None):
+        """
+        Clones the voice and keeps the result in the temporary audio store
+        under audio_id (a new ID when not given).
+        """
+        try:
+            audio = self.clone_wav_bytes()
+            with stage("file_write"):
+                stored = audio_store.put(audio, "wav", audio_id)
 
-            if os.path.exists(self.out_path):
-                logger.info(f"Audio saved to: {self.out_path}")
-                return {
-                    "status": "success",
-                    "message": "Voice cloning completed successfully",
-                    "audio_path": self.out_path,
-                }
-            else:
-                logger.error("Failed to clone voice, output file not found.")
-                return {
-                    "status": "error",
-                    "message": "Failed to clone voice",
-                    "audio_path": None,
-                }
+            logger.info(f"Audio saved to: {stored.path}")
+            return {
+                "status": "success",
+                "message": "Voice cloning completed successfully",
+                **stored.to_dict(),
+            }
         except Exception as e:
             logger.error(f"Error during voice cloning: {e}")
             return {
@@ -0,0 +1,168 @@
+import os
+import re
+import time
+import uuid
+import tempfile
+import threading
+import logging
+
+from TTS.utils.audio.encoders import AUDIO_FORMATS
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+AUDIO_STORE_DIR = os.environ.get("TTS_AUDIO_STORE_DIR", os.path.join(tempfile.gettempdir(), "tts_audio_store"))
+AUDIO_TTL_SECONDS = float(os.environ.get("TTS_AUDIO_TTL_SECONDS", "900"))
+
+_AUDIO_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+# Name of the files written by `AudioStore.put`
+_STORED_FILE_PATTERN = re.compile(r"^[0-9a-f]{32}\.(" + "|".join(map(re.escape, AUDIO_FORMATS)) + r")$")
+
+
+class StoredAudio:
+    def __init__(self, audio_id: str, path: str, extension: str, expires_at: float):
+        self.audio_id = audio_id
+        self.path = path
+        self.extension = extension
+        self.expires_at = expires_at
+
+    @property
+    def url(self):
+        return f"/api/audio/{self.audio_id}"
+
+    @property
+    def media_type(self):
+        audio_format = AUDIO_FORMATS.get(self.extension)
+        return audio_format.media_type if audio_format is not None else "application/octet-stream"
+
+    def to_dict(self):
+        return {"audio_id": self.audio_id, "audio_path": self.path, "audio_url": self.url, "expires_at": self.expires_at}
+
+
+class AudioStore:
+    """
+    Short-lived storage of generated audio, one file per request ID.
+
+    Every request gets its own file, so concurrent requests can't overwrite
+    each other's output. A client can fetch the audio by ID until `ttl`
+    seconds have passed. After that the file is removed by the next cleanup.
+    Cleanup runs on every `put`, and every `ttl / 4` seconds on a background
+    thread once `start_sweeper` was called.
+    """
+
+    def __init__(self, root: str = AUDIO_STORE_DIR, ttl: float = AUDIO_TTL_SECONDS):
+        self.root = root
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sweeper = None
+        os.makedirs(self.root, exist_ok=True)
+
+    @staticmethod
+    def new_id() -> str:
+        return uuid.uuid4().hex
+
+    def path_for(self, audio_id: str, extension: str = "wav") -> str:
+        if not _AUDIO_ID_PATTERN.match(audio_id):
+            raise ValueError(f"Invalid audio id: {audio_id}")
+        return os.path.join(self.root, f"{audio_id}.{extension}")
+
+    def put(self, data: bytes, extension: str = "wav", audio_id: str = None) -> StoredAudio:
+        """Writes the audio under a new (or the given) request ID."""
+        self.cleanup()
+        audio_id = audio_id or self.new_id()
+        path = self.path_for(audio_id, extension)
+
+        # Write to a temp file first so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        stored = StoredAudio(audio_id, path, extension, time.time() + self.ttl)
+        with self._lock:
+            self._entries[audio_id] = stored
+        return stored
+
+    def get(self, audio_id: str):
+        """Returns the StoredAudio for the ID, or None if it is unknown or expired."""
+        with self._lock:
+            stored = self._entries.get(audio_id)
+        if stored is None or stored.expires_at < time.time() or not os.path.exists(stored.path):
+            return None
+        return stored
+
+    def read(self, audio_id: str):
+        stored = self.get(audio_id)
+        if stored is None:
+            return None
+        with open(stored.path, "rb") as f:
+            return f.read()
+
+    def delete(self, audio_id: str):
+        with self._lock:
+            stored = self._entries.pop(audio_id, None)
+        if stored is not None:
+            self._remove(stored.path)
+        return stored
+
+    def resolve(self, reference: str):
+        """
+        Path of the audio a client refers to. Accepts an audio ID, an
+        /api/audio/<id> URL or a plain file path, for older clients.
+        """
+        audio_id = reference.rstrip("/").rsplit("/", 1)[-1]
+        stored = self.get(audio_id) if _AUDIO_ID_PATTERN.match(audio_id) else None
+        return stored.path if stored is not None else reference
+
+    def cleanup(self):
+        """Deletes every expired entry. Returns the number of files removed."""
+        now = time.time()
+        with self._lock:
+            expired = [audio_id for audio_id, stored in self._entries.items() if stored.expires_at < now]
+            removed = [self._entries.pop(audio_id) for audio_id in expired]
+        for stored in removed:
+            self._remove(stored.path)
+        return len(removed)
+
+    def start_sweeper(self):
+        """Cleans up expired audio in the background, even when no new audio is stored."""
+        if self._sweeper is not None:
+            return
+        self._purge_leftovers()
+        interval = max(1.0, self.ttl / 4)
+
+        def sweep():
+            while not self._stop.wait(interval):
+                self.cleanup()
+
+        self._sweeper = threading.Thread(target=sweep, name="audio-store-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def close(self):
+        self._stop.set()
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "ttl_seconds": self.ttl, "root": self.root}
+
+    def _purge_leftovers(self):
+        # Files from a previous run aren't in the index and could never be fetched again. Only the store's own
+        # files are removed, in case the directory is shared with something else.
+        with self._lock:
+            known = {os.path.basename(stored.path) for stored in self._entries.values()}
+        for name in os.listdir(self.root):
+            if name not in known and _STORED_FILE_PATTERN.match(name):
+                self._remove(os.path.join(self.root, name))
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+audio_store = AudioStore()
@@ -0,0 +1,218 @@
+import os
+import queue
+import threading
+import time
+import logging
+
+import numpy as np
+from TTS.tts.models.vits import Vits
+from TTS.utils.synthesizer import SENTENCE_SILENCE
+from services.metrics import RequestTrace, current_trace, tracing
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_WINDOW_MS = float(os.environ.get("TTS_BATCH_WINDOW_MS", "20"))
+MAX_BATCH_SIZE = int(os.environ.get("TTS_MAX_BATCH_SIZE", "8"))
+
+
+class _PendingRequest:
+    def __init__(self, text: str, speaker_name: str = None):
+        self.text = text
+        self.speaker_name = speaker_name
+        # Stages run on the batcher thread and are copied back to the request's trace
+        self.trace = current_trace()
+        # Set by `InferenceBatcher._prepare` before the request is batched
+        self.sentences = None
+        self.speaker_id = None
+        self.done = threading.Event()
+        self.wav = None
+        self.error = None
+
+
+class InferenceBatcher:
+    """
+    Micro-batching scheduler in front of a resident VITS model.
+
+    Concurrent `submit` calls are collected for up to `window_ms` (or until
+    `max_batch_size` requests are waiting), their sentences are padded into one
+    batch and run through a single `Vits.inference` call. Every request gets
+    back only its own waveform. A request that can't be synthesized fails on
+    its own, the other requests of its batch are still served.
+    """
+
+    def __init__(self, synthesizer, window_ms: float = BATCH_WINDOW_MS, max_batch_size: int = MAX_BATCH_SIZE):
+        self.synthesizer = synthesizer
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self.supports_batching = isinstance(synthesizer.tts_model, Vits) and synthesizer.vocoder_model is None
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name="tts-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str, speaker_name: str = None):
+        """Queues the text for synthesis and blocks until its waveform is ready."""
+        request = _PendingRequest(text, speaker_name)
+        # Checked and queued under the lock so no request lands behind the stop sentinel of `close`
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Batcher is closed")
+            self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.wav
+
+    def queue_depth(self):
+        """Number of requests waiting for the next batch."""
+        return self._queue.qsize()
+
+    def close(self):
+        """
+        Stops the worker thread. The batch being served is finished, requests
+        still waiting in the queue fail.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending = []
+            while True:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._queue.put(None)
+        for request in pending:
+            request.error = RuntimeError("Batcher is closed")
+            request.done.set()
+
+    def _run(self):
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+            batch = [request]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._queue.put(None)
+                    break
+                batch.append(request)
+            self._serve(batch)
+
+    def _serve(self, batch):
+        batch_trace = RequestTrace()
+        try:
+            with tracing(batch_trace):
+                requests = batch
+                if self.supports_batching:
+                    requests = [request for request in batch if self._prepare(request)]
+                    if len(requests) > 1:
+                        try:
+                            self._synthesize_batch(requests)
+                            requests = []
+                        except Exception:
+                            # Retried one by one, so only the request that broke the batch gets the error
+                            logger.exception("Batched TTS inference error, retrying the requests one by one")
+                for request in requests:
+                    self._synthesize_alone(request)
+        finally:
+            for request in batch:
+                # Every request in the batch waited for the whole forward pass
+                if request.trace is not None:
+                    request.trace.merge(batch_trace)
+                request.done.set()
+
+    def _synthesize_alone(self, request):
+        try:
+            if self.supports_batching:
+                self._synthesize_batch([request])
+            else:
+                request.wav = self.synthesizer.tts(request.text, speaker_name=request.speaker_name)
+        except Exception as e:
+            logger.exception("TTS inference error")
+            request.error = e
+
+    def _prepare(self, request) -> bool:
+        """
+        Splits the request into sentences and resolves its speaker. Returns
+        False, with the request's error set, when it can't be synthesized.
+        """
+        try:
+            sentences = [sentence for sentence in self.synthesizer.split_into_sentences(request.text) if sentence.strip()]
+            if not sentences:
+                raise ValueError("Empty text")
+            speaker_id = self._speaker_id(request.speaker_name)
+        except Exception as e:
+            request.error = e
+            return False
+        request.sentences = sentences
+        request.speaker_id = speaker_id
+        return True
+
+    def _speaker_id(self, speaker_name: str = None):
+        """
+        Speaker ID of a multi-speaker model. Without a name the model's first
+        speaker is used, the registry's checkpoints each serve a single voice.
+        """
+        speaker_manager = getattr(self.synthesizer.tts_model, "speaker_manager", None)
+        if speaker_manager is None or not speaker_manager.name_to_id:
+            return None
+        if speaker_name in speaker_manager.name_to_id:
+            return speaker_manager.name_to_id[speaker_name]
+        if speaker_name is None or len(speaker_manager.name_to_id) == 1:
+            return list(speaker_manager.name_to_id.values())[0]
+        raise ValueError(f"Unknown speaker: {speaker_name}")
+
+    def _synthesize_batch(self, batch):
+        """Synthesizes the prepared requests in shared forward passes and sets their waveforms."""
+        synthesizer = self.synthesizer
+
+        # Flatten the sentences of every request into one list
+        sentences = []
+        for request_idx, request in enumerate(batch):
+            for sentence in request.sentences:
+                sentences.append((request_idx, sentence, request.speaker_id))
+
+        # Reuse sentences the resident model already synthesized
+        sentence_cache = synthesizer.sentence_cache
+        sentence_wavs = [None] * len(sentences)
+        cache_keys = [None] * len(sentences)
+        if sentence_cache is not None:
+            settings = synthesizer.inference_settings()
+            for idx, (_, sentence, speaker_id) in enumerate(sentences):
+                cache_keys[idx] = sentence_cache.make_key(sentence, speaker_id, settings=settings)
+                sentence_wavs[idx] = sentence_cache.get(cache_keys[idx])
+        misses = [idx for idx, wav in enumerate(sentence_wavs) if wav is None]
+
+        # Sorted by token length so each forward pass pads as little as possible,
+        # run by the synthesizer's backend (torch or ONNX Runtime)
+        speaker_ids = [sentences[idx][2] for idx in misses]
+        wavs = synthesizer._synthesize_batch(  # pylint: disable=protected-access
+            [sentences[idx][1] for idx in misses],
+            speaker_ids=None if not misses or speaker_ids[0] is None else speaker_ids,
+            batch_size=self.max_batch_size,
+        )
+        for idx, wav in zip(misses, wavs):
+            sentence_wavs[idx] = wav
+            if cache_keys[idx] is not None:
+                sentence_cache.put(cache_keys[idx], wav)
+
+        # Stitch the sentences back together per request
+        parts = [[] for _ in batch]
+        silence = np.zeros(SENTENCE_SILENCE, dtype=np.float32)
+        for (request_idx, _, _), wav in zip(sentences, sentence_wavs):
+            parts[request_idx] += [wav, silence]
+        for request, wav_parts in zip(batch, parts):
+            request.wav = np.concatenate(wav_parts)
@@ -0,0 +1,174 @@
+import os
+import time
+import uuid
+import threading
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from services.VoiceClone import VoiceCloner
+from services.audio_store import audio_store
+from services import metrics
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Conversions are memory hungry, keep the number that run at once small
+CLONE_WORKERS = int(os.environ.get("TTS_CLONE_WORKERS", "1"))
+MAX_PENDING_CLONE_JOBS = int(os.environ.get("TTS_MAX_PENDING_CLONE_JOBS", "16"))
+CLONE_JOB_RETENTION_SECONDS = float(os.environ.get("TTS_CLONE_JOB_RETENTION_SECONDS", "3600"))
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class QueueFullError(Exception):
+    """Raised when too many clone jobs are already waiting."""
+
+
+class CloneJob:
+    def __init__(self, referenceWAV: str, targetWAV: str):
+        self.job_id = uuid.uuid4().hex
+        self.referenceWAV = referenceWAV
+        self.targetWAV = targetWAV
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.cancel_requested = False
+        self.future = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def to_dict(self):
+        processing_time = None
+        if self.started_at is not None:
+            processing_time = round((self.finished_at or time.time()) - self.started_at, 2)
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "audio_path": self.result["audio_path"] if self.status == SUCCEEDED else None,
+            "audio_url": self.result["audio_url"] if self.status == SUCCEEDED else None,
+            "error": self.error,
+            "processing_time": processing_time,
+            "created_at": self.created_at,
+        }
+
+
+class CloneJobQueue:
+    """
+    Runs voice cloning jobs in the background on a bounded worker pool.
+
+    `submit` returns immediately with a job whose status can be polled. At
+    most `workers` conversions run at once, all sharing the resident voice
+    conversion model, and at most `max_pending` jobs may wait or run before
+    new submissions are rejected. Finished jobs are forgotten after
+    `retention` seconds.
+    """
+
+    def __init__(self, workers: int = CLONE_WORKERS, max_pending: int = MAX_PENDING_CLONE_JOBS, retention: float = CLONE_JOB_RETENTION_SECONDS):
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="voice-clone")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, referenceWAV: str, targetWAV: str) -> CloneJob:
+        job = CloneJob(referenceWAV, targetWAV)
+        with self._lock:
+            self._prune()
+            if self.pending() >= self.max_pending:
+                raise QueueFullError(f"{self.max_pending} voice cloning jobs are already pending")
+            self._jobs[job.job_id] = job
+            job.future = self._executor.submit(self._run, job)
+        logger.info(f"Voice cloning job {job.job_id} queued")
+        return job
+
+    def get(self, job_id: str):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str):
+        """
+        Cancels a job. Queued jobs never start; a running conversion can't be
+        interrupted, so its result is discarded when it finishes.
+        Returns the job, or None if it doesn't exist.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED_STATES:
+                return job
+            job.cancel_requested = True
+            if job.future.cancel():
+                job.status = CANCELLED
+                job.finished_at = time.time()
+        logger.info(f"Voice cloning job {job_id} cancelled")
+        return job
+
+    def pending(self):
+        return sum(1 for job in self._jobs.values() if job.status in (QUEUED, RUNNING))
+
+    def stats(self):
+        with self._lock:
+            counts = {state: 0 for state in (QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED)}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return {"workers": self.workers, "max_pending": self.max_pending, **counts}
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: CloneJob):
+        with self._lock:
+            if job.cancel_requested:
+                # cancelled after the executor picked it up, too late for `future.cancel()`
+                job.status = CANCELLED
+                job.finished_at = time.time()
+                return
+            job.status = RUNNING
+            job.started_at = time.time()
+
+        try:
+            result = VoiceCloner(referenceWAV=job.referenceWAV, targetWAV=job.targetWAV).clone_speech(audio_id=job.job_id)
+            error = result["message"] if result["status"] == "error" else None
+        except Exception as e:
+            logger.exception(f"Voice cloning job {job.job_id} failed")
+            result, error = None, str(e)
+
+        with self._lock:
+            job.finished_at = time.time()
+            if job.cancel_requested:
+                job.status = CANCELLED
+                if result and result.get("audio_id"):
+                    audio_store.delete(result["audio_id"])
+            elif error is not None:
+                job.status = FAILED
+                job.error = error
+            else:
+                job.status = SUCCEEDED
+                job.result = result
+
+    def _prune(self):
+        now = time.time()
+        for job_id in list(self._jobs.keys()):
+            job = self._jobs[job_id]
+            if job.status in FINISHED_STATES and now - job.finished_at > self.retention:
+                del self._jobs[job_id]
+                if job.result:
+                    audio_store.delete(job.result["audio_id"])
+
+
+clone_job_queue = CloneJobQueue()
+
+metrics.registry.gauge(
+    "tts_clone_jobs",
+    "Voice cloning jobs known to the queue, by state.",
+    ["state"],
+    lambda: [({"state": state}, count) for state, count in clone_job_queue.stats().items() if state in (QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED)],
+)
@@ -1,26 +1,20 @@
 import os
+import io
 import noisereduce as nr
 from scipy.io import wavfile
 import numpy as np
+from services.metrics import stage
+from services.audio_store import audio_store
 
-def clean_audio_service(input_path: str) -> dict:
-    try:
-        if not os.path.exists(input_path):
-            return {
-                "status": "error",
-                "message": f"Input file not found: {input_path}"
-            }
-
-        # Define output path
-        base_dir = os.path.dirname(input_path)
-        output_filename = "E:/UOM/FYP/TTSx/UI/client/public/Audios/cleaned_audio.wav"
-        output_path = os.path.join(base_dir, output_filename)
-
-        # Read audio
-        print(f"Processing {os.path.basename(input_path)}...")
-        rate, data = wavfile.read(input_path)
+def denoise_wav_bytes(audio: bytes) -> bytes:
+    """
+    Denoises and amplifies WAV audio held in memory and returns the cleaned
+    audio as WAV bytes.
+    """
+    rate, data = wavfile.read(io.BytesIO(audio))
 
-        # Denoise
+    # Denoise
+    with stage("denoise"):
         reduced_noise = nr.reduce_noise(
             y=data,
             sr=rate,
@@ -34,23 +28,48 @@ def clean_audio_service(input_path: str) -> dict:
             device="cuda"  # change to "cpu" if no GPU available
         )
 
-        # Amplify
-        increased_volume = reduced_noise * 2
-        dtype = data.dtype
-        if np.issubdtype(dtype, np.integer):
-            info = np.iinfo(dtype)
-            increased_volume = np.clip(increased_volume, info.min, info.max)
-        else:
-            increased_volume = np.clip(increased_volume, -1.0, 1.0)
+    # Amplify
+    increased_volume = reduced_noise * 2
+    dtype = data.dtype
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        increased_volume = np.clip(increased_volume, info.min, info.max)
+    else:
+        increased_volume = np.clip(increased_volume, -1.0, 1.0)
+
+    buffer = io.BytesIO()
+    with stage("wav_encode"):
+        wavfile.write(buffer, rate, increased_volume.astype(dtype))
+    return buffer.getvalue()
+
+def clean_audio_service(input_path: str) -> dict:
+    """
+    Cleans the audio at input_path, which may also be the ID or URL of audio
+    in the temporary audio store. The result is stored under a new ID.
+    """
+    try:
+        input_path = audio_store.resolve(input_path)
+        if not os.path.exists(input_path):
+            return {
+                "status": "error",
+                "message": f"Input file not found: {input_path}"
+            }
+
+        # Read audio
+        print(f"Processing {os.path.basename(input_path)}...")
+        with open(input_path, "rb") as f:
+            cleaned_audio = denoise_wav_bytes(f.read())
 
         # Save
-        wavfile.write(output_path, rate, increased_volume.astype(dtype))
-        print(f"Saved denoised audio to {output_path}")
+        with stage("file_write"):
+            stored = audio_store.put(cleaned_audio, "wav")
+        print(f"Saved denoised audio to {stored.path}")
 
         return {
             "status": "success",
             "message": "Audio cleaned successfully.",
-            "download_path": output_path
+            "download_path": stored.path,
+            **stored.to_dict(),
         }
 
     except Exception as e:
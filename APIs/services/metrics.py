@@ -0,0 +1,318 @@
+import os
+import time
+import uuid
+import bisect
+import threading
+import contextvars
+from contextlib import contextmanager
+
+# Adds a Server-Timing style header with the per-stage latencies to every response
+TRACE_HEADER_ENABLED = os.environ.get("TTS_TRACE_HEADER", "true").lower() in ["true", "1", "yes"]
+TRACE_HEADER = "X-TTS-Trace"
+TRACE_ID_HEADER = "X-Trace-Id"
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+RTF_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 5.0)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """
+    Base of the metric types. A metric built with a `callback` is read when
+    /metrics is scraped instead of being updated in place; the callback
+    returns a list of (labels, value) pairs. This exposes numbers other
+    components already keep, such as queue sizes.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), callback=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key):
+        return dict(zip(self.labelnames, key))
+
+    def samples(self):
+        """Yields (name, labels, value) for the exposition format."""
+        if self.callback is not None:
+            for labels, value in self.callback():
+                yield self.name, labels, value
+            return
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield self.name, self._labels(key), value
+
+
+class Counter(_Metric):
+    """Monotonically increasing value, e.g. the number of cache hits."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, e.g. a queue depth."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets, e.g. latencies."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[key] = (counts, total + value)
+
+    def samples(self):
+        with self._lock:
+            values = [(key, list(counts), total) for key, (counts, total) in self._values.items()]
+        for key, counts, total in values:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, total
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered in the Prometheus text exposition format.
+    Kept in-house so the API doesn't need the prometheus_client package.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=(), callback=None) -> Counter:
+        return self._register(Counter(name, documentation, labelnames, callback))
+
+    def gauge(self, name: str, documentation: str, labelnames=(), callback=None) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class RequestTrace:
+    """Stage latencies of one request, summed when a stage runs several times."""
+
+    def __init__(self, trace_id: str = None):
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float):
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def merge(self, other: "RequestTrace"):
+        for stage, seconds in other.stages.items():
+            self.add(stage, seconds)
+
+    def header_value(self) -> str:
+        """Stages in Server-Timing syntax, e.g. `text_encoder;dur=12.5, flow;dur=3.1`."""
+        with self._lock:
+            return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in self.stages.items())
+
+
+_current_trace = contextvars.ContextVar("tts_request_trace", default=None)
+
+
+def current_trace():
+    """The trace of the request being served on this thread, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def tracing(trace: RequestTrace):
+    """Makes `trace` the current trace for the duration of the block."""
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+registry = MetricsRegistry()
+
+stage_seconds = registry.histogram(
+    "tts_stage_duration_seconds", "Time spent in each stage of the TTS pipeline.", ["stage"]
+)
+requests_total = registry.counter(
+    "tts_http_requests_total", "HTTP requests served, by route and status code.", ["method", "route", "status"]
+)
+request_seconds = registry.histogram(
+    "tts_http_request_duration_seconds", "End to end latency of HTTP requests.", ["method", "route"]
+)
+cache_lookups = registry.counter(
+    "tts_cache_lookups_total", "Cache lookups, by cache and result (hit or miss).", ["cache", "result"]
+)
+real_time_factor = registry.histogram(
+    "tts_real_time_factor", "Synthesis time divided by the duration of the generated audio.", ["speaker"], RTF_BUCKETS
+)
+
+
+def observe_stage(stage: str, seconds: float):
+    stage_seconds.observe(seconds, stage=stage)
+    trace = current_trace()
+    if trace is not None:
+        trace.add(stage, seconds)
+
+
+@contextmanager
+def stage(name: str):
+    """Times the block as a pipeline stage and adds it to the current trace."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(name, time.perf_counter() - start)
+
+
+# Vits submodules and the stage each of them is reported as
+VITS_STAGES = {
+    "text_encoder": "text_encoder",
+    "duration_predictor": "duration_predictor",
+    "flow": "flow",
+    "waveform_decoder": "hifigan_decoder",
+}
+
+
+# Vits methods running the whole model with the other backends, whose submodules never run
+BACKEND_STAGES = {
+    "onnx": "inference_onnx_batch",
+    "torchscript": "inference_torchscript_batch",
+}
+
+
+def instrument_model(tts_model, backend: str = "torch"):
+    """
+    Reports the tokenizer and the Vits submodules as pipeline stages. Timing
+    uses forward hooks, so the model code itself is untouched. On CUDA the
+    device is synchronized before a stage is closed, otherwise the time of
+    asynchronous kernels would be attributed to the next stage.
+
+    The onnx and torchscript backends run the model as a single graph, so it
+    is reported as one `<backend>_inference` stage instead of the submodules.
+    """
+    tokenizer = getattr(tts_model, "tokenizer", None)
+    if tokenizer is not None and not getattr(tokenizer, "_stage_timed", False):
+        text_to_ids = tokenizer.text_to_ids
+
+        def timed_text_to_ids(*args, **kwargs):
+            with stage("tokenization"):
+                return text_to_ids(*args, **kwargs)
+
+        tokenizer.text_to_ids = timed_text_to_ids
+        tokenizer._stage_timed = True
+
+    if backend in BACKEND_STAGES:
+        _time_method(tts_model, BACKEND_STAGES[backend], f"{backend}_inference")
+        return
+
+    for attribute, stage_name in VITS_STAGES.items():
+        module = getattr(tts_model, attribute, None)
+        if module is None or getattr(module, "_stage_timed", False):
+            continue
+        _time_module(module, stage_name)
+        module._stage_timed = True
+
+
+def _time_method(model, method_name: str, stage_name: str):
+    method = getattr(model, method_name, None)
+    if method is None or getattr(method, "_stage_timed", False):
+        return
+
+    def timed_method(*args, **kwargs):
+        with stage(stage_name):
+            return method(*args, **kwargs)
+
+    timed_method._stage_timed = True
+    setattr(model, method_name, timed_method)
+
+
+def _time_module(module, stage_name: str):
+    import torch
+
+    starts = threading.local()
+
+    def _synchronize():
+        param = next(module.parameters(), None)
+        if param is not None and param.is_cuda:
+            torch.cuda.synchronize(param.device)
+
+    def pre_hook(_module, _inputs):
+        _synchronize()
+        starts.__dict__.setdefault("stack", []).append(time.perf_counter())
+
+    def post_hook(_module, _inputs, _outputs):
+        _synchronize()
+        observe_stage(stage_name, time.perf_counter() - starts.stack.pop())
+
+    module.register_forward_pre_hook(pre_hook)
+    module.register_forward_hook(post_hook)
@@ -0,0 +1,222 @@
+import os
+import threading
+import logging
+from collections import OrderedDict
+
+import torch
+from TTS.utils.synthesizer import Synthesizer
+from services.batcher import InferenceBatcher
+from services import metrics
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Where the fine-tuned checkpoints live. Each speaker has its own folder holding
+# `best_model.pth` and `config.json` (e.g. Model/LJ_Dinithi/best_model.pth).
+MODEL_ROOT = os.environ.get("TTS_MODEL_ROOT", "E:/UOM/FYP/TTSx/Model")
+DEFAULT_SPEAKER = os.environ.get("TTS_DEFAULT_SPEAKER", "LJ_Dinithi")
+MAX_RESIDENT_MODELS = int(os.environ.get("TTS_MAX_RESIDENT_MODELS", "2"))
+PRELOAD_SPEAKERS = [s for s in os.environ.get("TTS_PRELOAD_SPEAKERS", DEFAULT_SPEAKER).split(",") if s]
+# Number of synthesized sentences each resident model keeps for reuse (0 disables it)
+SENTENCE_CACHE_SIZE = int(os.environ.get("TTS_SENTENCE_CACHE_SIZE", "256"))
+USE_CUDA = os.environ.get("TTS_USE_CUDA", "false").lower() in ["true", "1", "yes"] and torch.cuda.is_available()
+# Runtime of the models: "torch", "onnx" to run them in ONNX Runtime (needs the onnxruntime package), or
+# "torchscript" to run their traced inference. With "onnx" each checkpoint is exported next to it, e.g.
+# best_model.onnx, the first time it is loaded. With "torchscript" the traced models are cached in
+# TTS_TORCHSCRIPT_CACHE_DIR, by checkpoint hash.
+BACKEND = os.environ.get("TTS_BACKEND", "torch")
+TORCHSCRIPT_CACHE_DIR = os.environ.get("TTS_TORCHSCRIPT_CACHE_DIR") or None
+# ONNX Runtime threads per model, 0 lets ONNX Runtime pick them
+ONNX_INTRA_OP_THREADS = int(os.environ.get("TTS_ONNX_INTRA_OP_THREADS", "0"))
+ONNX_INTER_OP_THREADS = int(os.environ.get("TTS_ONNX_INTER_OP_THREADS", "0"))
+# With the "onnx" backend, serve the int8 model made by Scripts/QuantizeModel.py (best_model.int8.onnx) when a
+# speaker folder has one
+ONNX_INT8 = os.environ.get("TTS_ONNX_INT8", "false").lower() in ["true", "1", "yes"]
+# Token lengths every model synthesizes once when it is loaded, so the first requests don't pay for the first runs
+# of the model (empty disables it)
+WARMUP_TOKEN_LENGTHS = [int(n) for n in os.environ.get("TTS_WARMUP_TOKEN_LENGTHS", "32,64,128,256").split(",") if n]
+
+
+class ResidentModel:
+    """A loaded checkpoint kept in memory between requests."""
+
+    def __init__(self, speakerID: str, model_path: str, config_path: str, synthesizer: Synthesizer, checkpoint_path: str = None):
+        self.speakerID = speakerID
+        self.model_path = model_path
+        self.config_path = config_path
+        # The checkpoint actually served, e.g. best_model.int8.onnx instead of best_model.pth
+        self.checkpoint_path = checkpoint_path or model_path
+        self.synthesizer = synthesizer
+        self.batcher = InferenceBatcher(synthesizer)
+        # Requests holding the model, see `ModelRegistry.release`
+        self.refs = 0
+        self.evicted = False
+
+
+class ModelRegistry:
+    """
+    Long-lived registry of `Synthesizer` instances keyed by speakerID.
+
+    Checkpoints are loaded once and served in-process. At most `max_resident`
+    checkpoints are kept in memory; the least recently used one is evicted
+    when a new one has to be loaded. Every `get` must be paired with a
+    `release`, an evicted model is only closed once no request holds it.
+    """
+
+    def __init__(self, model_root: str, max_resident: int = 2, default_speaker: str = DEFAULT_SPEAKER, use_cuda: bool = False, backend: str = "torch"):
+        self.model_root = model_root
+        self.max_resident = max(1, max_resident)
+        self.default_speaker = default_speaker
+        self.use_cuda = use_cuda
+        self.backend = backend
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading_locks = {}
+
+    def resolve(self, speakerID: str) -> str:
+        """
+        Maps a speakerID coming from the client to a checkpoint folder.
+        Unknown ids (e.g. "default") fall back to the default speaker.
+        """
+        if speakerID and os.path.isdir(os.path.join(self.model_root, speakerID)):
+            return speakerID
+        return self.default_speaker
+
+    def model_paths(self, speakerID: str):
+        model_dir = os.path.join(self.model_root, speakerID)
+        return os.path.join(model_dir, "best_model.pth"), os.path.join(model_dir, "config.json")
+
+    def get(self, speakerID: str) -> ResidentModel:
+        """
+        Returns the resident model for the given speaker, loading it on first use.
+        The caller holds the model until it calls `release`.
+        """
+        key = self.resolve(speakerID)
+
+        with self._lock:
+            if key in self._models:
+                return self._acquire(key)
+            loading_lock = self._loading_locks.setdefault(key, threading.Lock())
+
+        # Load outside the registry lock so other speakers keep being served
+        with loading_lock:
+            with self._lock:
+                if key in self._models:
+                    return self._acquire(key)
+
+            try:
+                model = self._load(key)
+
+                with self._lock:
+                    self._models[key] = model
+                    self._acquire(key)
+                    while len(self._models) > self.max_resident:
+                        evicted, evicted_model = self._models.popitem(last=False)
+                        evicted_model.evicted = True
+                        # Requests still holding it close it when they release it
+                        if evicted_model.refs == 0:
+                            evicted_model.batcher.close()
+                        logger.info(f"Evicted TTS model for speaker: {evicted}")
+            finally:
+                # also after a failed load, so the lock of a speaker that can't be loaded isn't kept
+                with self._lock:
+                    self._loading_locks.pop(key, None)
+        return model
+
+    def _acquire(self, key: str) -> ResidentModel:
+        # Called with the registry lock held
+        model = self._models[key]
+        self._models.move_to_end(key)
+        model.refs += 1
+        return model
+
+    def release(self, model: ResidentModel):
+        """Gives back a model returned by `get`, closing it if it was evicted in the meantime."""
+        with self._lock:
+            model.refs -= 1
+            close = model.evicted and model.refs == 0
+        if close:
+            model.batcher.close()
+
+    def _load(self, speakerID: str) -> ResidentModel:
+        model_path, config_path = self.model_paths(speakerID)
+        if not os.path.exists(model_path) or not os.path.exists(config_path):
+            logger.error(f"Model file {model_path} or {config_path} not found")
+            raise FileNotFoundError("Model file not found")
+
+        tts_checkpoint = model_path
+        if self.backend == "onnx" and ONNX_INT8:
+            int8_path = os.path.join(os.path.dirname(model_path), "best_model.int8.onnx")
+            if os.path.exists(int8_path):
+                tts_checkpoint = int8_path
+            else:
+                logger.warning(f"No int8 model {int8_path}, serving the fp32 model of speaker {speakerID}")
+
+        logger.info(f"Loading TTS model for speaker: {speakerID} ({self.backend} backend)")
+        synthesizer = Synthesizer(
+            tts_checkpoint=tts_checkpoint,
+            tts_config_path=config_path,
+            use_cuda=self.use_cuda,
+            sentence_cache_size=SENTENCE_CACHE_SIZE,
+            backend=self.backend,
+            onnx_intra_op_threads=ONNX_INTRA_OP_THREADS,
+            onnx_inter_op_threads=ONNX_INTER_OP_THREADS,
+            torchscript_cache_dir=TORCHSCRIPT_CACHE_DIR,
+        )
+        if WARMUP_TOKEN_LENGTHS:
+            timings = synthesizer.warmup(WARMUP_TOKEN_LENGTHS)
+            logger.info(f"Warmed up the model of speaker {speakerID} in {sum(timings.values()):.2f}s")
+        metrics.instrument_model(synthesizer.tts_model, self.backend)
+        return ResidentModel(speakerID, model_path, config_path, synthesizer, tts_checkpoint)
+
+    def preload(self, speakerIDs):
+        """Loads the given speakers up front, e.g. at application startup."""
+        for speakerID in speakerIDs[: self.max_resident]:
+            try:
+                self.release(self.get(speakerID))
+            except Exception as e:
+                logger.error(f"Failed to preload TTS model for speaker {speakerID}: {e}")
+
+    def resident_speakers(self):
+        with self._lock:
+            return list(self._models.keys())
+
+    def resident_models(self):
+        with self._lock:
+            return list(self._models.values())
+
+    def clear(self):
+        with self._lock:
+            for model in self._models.values():
+                model.batcher.close()
+            self._models.clear()
+
+
+model_registry = ModelRegistry(MODEL_ROOT, MAX_RESIDENT_MODELS, DEFAULT_SPEAKER, USE_CUDA, BACKEND)
+
+
+def _batcher_queue_depth():
+    return [({"speaker": model.speakerID}, model.batcher.queue_depth()) for model in model_registry.resident_models()]
+
+
+def _sentence_cache_lookups():
+    samples = []
+    for model in model_registry.resident_models():
+        sentence_cache = model.synthesizer.sentence_cache
+        if sentence_cache is not None:
+            samples.append(({"speaker": model.speakerID, "result": "hit"}, sentence_cache.hits))
+            samples.append(({"speaker": model.speakerID, "result": "miss"}, sentence_cache.misses))
+    return samples
+
+
+metrics.registry.gauge(
+    "tts_batcher_queue_depth", "Synthesis requests waiting for the next batch.", ["speaker"], _batcher_queue_depth
+)
+metrics.registry.gauge("tts_resident_models", "TTS checkpoints loaded in memory.", callback=lambda: [({}, len(model_registry.resident_models()))])
+metrics.registry.counter(
+    "tts_sentence_cache_lookups_total",
+    "Sentence cache lookups of the resident models, by result. Resets when a model is evicted.",
+    ["speaker", "result"],
+    _sentence_cache_lookups,
+)
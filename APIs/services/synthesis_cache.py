@@ -0,0 +1,196 @@
+import os
+import re
+import json
+import hashlib
+import tempfile
+import threading
+import logging
+from collections import OrderedDict
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.environ.get("TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "tts_synthesis_cache"))
+CACHE_MAX_MB = float(os.environ.get("TTS_CACHE_MAX_MB", "512"))
+CACHE_ENABLED = os.environ.get("TTS_CACHE_ENABLED", "true").lower() in ["true", "1", "yes"]
+
+_checkpoint_hashes = {}
+_checkpoint_hashes_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Collapses whitespace so trivially different prompts share an entry. Case
+    and Unicode forms are kept, the tokenizer tells them apart.
+    """
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def checkpoint_hash(path: str) -> str:
+    """
+    SHA-256 of a checkpoint file. Hashing a large checkpoint takes a while, so
+    the result is memoized per path, size and modification time.
+    """
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime)
+    with _checkpoint_hashes_lock:
+        if memo_key in _checkpoint_hashes:
+            return _checkpoint_hashes[memo_key]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+
+    with _checkpoint_hashes_lock:
+        _checkpoint_hashes[memo_key] = digest.hexdigest()
+    return _checkpoint_hashes[memo_key]
+
+
+def inference_settings(synthesizer) -> dict:
+    """The model parameters that change the synthesized audio for a given text."""
+    return {
+        **synthesizer.inference_settings(),
+        "sample_rate": synthesizer.output_sample_rate,
+        # torch, ONNX Runtime and TorchScript don't give bit-identical audio
+        "backend": synthesizer.backend,
+    }
+
+
+class SynthesisCache:
+    """
+    Content-addressed cache of encoded audio.
+
+    Entries are keyed by a hash of the normalized text, the speaker, the
+    checkpoint hash and the inference settings, and stored as files under
+    `cache_dir`. An in-memory LRU index tracks the entries; the least recently
+    used ones are deleted once the cache grows past `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_bytes: int = int(CACHE_MAX_MB * 1024 * 1024), extension: str = "wav"):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.extension = extension
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._index = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(text: str, speaker: str, checkpoint: str, settings: dict = None) -> str:
+        payload = json.dumps(
+            {"text": normalize_text(text), "speaker": speaker, "checkpoint": checkpoint, "settings": settings or {}},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.{self.extension}")
+
+    def get(self, key: str):
+        """Returns the cached bytes for the key, or None on a miss."""
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+            self._index.move_to_end(key)
+
+        try:
+            with open(self.path_for(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            # The file was removed behind our back, forget about it
+            with self._lock:
+                self._size -= self._index.pop(key, 0)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes):
+        """Stores the bytes under the key and evicts old entries if needed."""
+        if len(data) > self.max_bytes:
+            return
+
+        # Write to a temp file first so readers never see a partial entry
+        path = self.path_for(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._size -= self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._size += len(data)
+            evicted = self._evict()
+
+        for evicted_key in evicted:
+            try:
+                os.remove(self.path_for(evicted_key))
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._index),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._index.keys())
+            self._index.clear()
+            self._size = 0
+        for key in keys:
+            try:
+                os.remove(self.path_for(key))
+            except OSError:
+                pass
+
+    def _evict(self):
+        evicted = []
+        while self._size > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._size -= size
+            self.evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def _load_index(self):
+        """Rebuilds the index from disk, oldest accessed files first."""
+        entries = []
+        suffix = f".{self.extension}"
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith(".tmp"):
+                os.remove(path)  # Left over from an interrupted write
+            elif name.endswith(suffix):
+                stat = os.stat(path)
+                entries.append((stat.st_atime, name[: -len(suffix)], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+        for key in self._evict():
+            os.remove(self.path_for(key))
+        if self._index:
+            logger.info(f"Synthesis cache loaded {len(self._index)} entries ({self._size} bytes) from {self.cache_dir}")
+
+
+synthesis_cache = SynthesisCache() if CACHE_ENABLED else None
@@ -1,10 +1,14 @@
 import os
-import subprocess
 import sys
 import io
-from TTS.api import TTS
-import torch
-import subprocess
+import time
+import threading
+import soundfile as sf
+from services.model_registry import model_registry
+from services.synthesis_cache import synthesis_cache, checkpoint_hash, inference_settings
+from services.metrics import stage, cache_lookups, real_time_factor
+from services.audio_store import audio_store
+from TTS.utils.audio.encoders import StreamingAudioEncoder, encode_audio
 
 # ANSI escape codes for text color
 RED = "\033[31m"
@@ -16,6 +20,11 @@ BLUE = "\033[94m"
 # Set the default encoding to UTF-8 for better handling of Unicode characters
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+def decode_wav(audio: bytes):
+    """Reads WAV bytes back into float samples and their sample rate."""
+    wav, sample_rate = sf.read(io.BytesIO(audio), dtype="float32")
+    return wav, sample_rate
+
 class TTSModel:
     def __init__(self, speakerID: str, preprocessed_text: str):
         """
@@ -24,64 +33,107 @@ class TTSModel:
         """
         self.speakerID = speakerID  # Store speakerID
         self.preprocessed_text = preprocessed_text
+        self._close_lock = threading.Lock()
         self.model = self.load_model()
 
     def load_model(self):
         """
-        Load the pre-trained TTS model using Coqui TTS based on the speakerID.
-        Here, you should modify this to select the appropriate model file.
+        Fetch the resident TTS model for the speakerID from the model registry.
+        The checkpoint is only read from disk the first time the speaker is used.
         """
-        # self.model_path = f"E:/UOM/FYP/TTSx/Model/{self.speakerID}/best_model.pth"
-        # self.config_path = f"E:/UOM/FYP/TTSx/Model/{self.speakerID}/config.json"
-        self.model_path = f"E:/UOM/FYP/TTSx/Model/LJ_Dinithi/best_model.pth"
-        self.config_path = f"E:/UOM/FYP/TTSx/Model/LJ_Dinithi/config.json"
-        self.out_path = f"E:/UOM/FYP/TTSx/UI/client/public/Audios/InitialInference.wav"
-    
         try:
-            # Check if the model and config files exist
-            if not os.path.exists(self.model_path) or not os.path.exists(self.config_path):
-                print(f"Model file {self.model_path} or {self.config_path} not found")
-                raise FileNotFoundError("Model file not found")
-            
-            # Avoid the torch.load warning by setting weights_only=True
-            torch.load(self.model_path, map_location="cpu", weights_only=True)
-
+            model = model_registry.get(self.speakerID)
         except FileNotFoundError as e:
             raise Exception(f"Failed to load TTS model: {str(e)}")
 
-    def generate_speech(self):
+        self.model_path = model.model_path
+        self.config_path = model.config_path
+        return model
+
+    def close(self):
+        """
+        Gives the resident model back to the registry once the request is
+        done with it. Safe to call more than once.
+        """
+        with self._close_lock:
+            model, self.model = self.model, None
+        if model is not None:
+            model_registry.release(model)
+
+    def cache_key(self):
+        """Key of this request in the synthesis cache."""
+        return synthesis_cache.make_key(
+            self.preprocessed_text,
+            self.model.speakerID,
+            checkpoint_hash(self.model.checkpoint_path),
+            inference_settings(self.model.synthesizer),
+        )
+
+    def synthesize_wav_bytes(self):
+        """
+        Returns the synthesized speech as WAV bytes, served from the synthesis
+        cache when the same text was already generated with this checkpoint.
+        """
+        cache_key = self.cache_key() if synthesis_cache is not None else None
+        if cache_key is not None:
+            audio = synthesis_cache.get(cache_key)
+            cache_lookups.inc(cache="synthesis", result="miss" if audio is None else "hit")
+            if audio is not None:
+                print(f"{BLUE}\nSynthesis cache hit{RESET}")
+                return audio, True
+
+        # Concurrent requests for the same model are batched together
+        start_time = time.perf_counter()
+        wav = self.model.batcher.submit(self.preprocessed_text)
+        self.observe_real_time_factor(wav, time.perf_counter() - start_time)
+        buffer = io.BytesIO()
+        with stage("wav_encode"):
+            self.model.synthesizer.save_wav(wav, buffer)
+        audio = buffer.getvalue()
+
+        if cache_key is not None:
+            synthesis_cache.put(cache_key, audio)
+        return audio, False
+
+    def observe_real_time_factor(self, wav, synthesis_time: float):
+        duration = len(wav) / self.model.synthesizer.output_sample_rate
+        if duration > 0:
+            real_time_factor.observe(synthesis_time / duration, speaker=self.model.speakerID)
+
+    def synthesize_audio(self, audio_format: str = "wav", sample_rate: int = None, bitrate: int = None):
+        """
+        Returns (bytes, cached) with the speech encoded in memory as
+        audio_format (wav, pcm, flac, mp3, ogg or opus), without touching the
+        disk. The synthesis cache holds WAV, other formats are encoded from it.
+        """
+        audio, cached = self.synthesize_wav_bytes()
+        if audio_format == "wav" and sample_rate is None and bitrate is None:
+            return audio, cached
+
+        wav, wav_sample_rate = decode_wav(audio)
+        with stage("encode"):
+            audio = encode_audio(wav, wav_sample_rate, audio_format, sample_rate, bitrate)
+        return audio, cached
+
+    def generate_speech(self, audio_format: str = "wav", sample_rate: int = None, bitrate: int = None):
         """
         Generates speech from the input text using the loaded TTS model.
-        Returns the audio as bytes (e.g., WAV format).
+        The audio is kept in the temporary audio store under a new request ID,
+        so concurrent requests never share an output file.
         """
         
-        try:    
-            # Construct and execute the command
-            command = (
-                f'tts --text "{self.preprocessed_text}" '
-                f'--model_path "{self.model_path}" '
-                f'--config_path "{self.config_path}" '
-                f'--out_path "{self.out_path}" '
-                # f'--speaker_id "{speaker_id}"' 
-            )
-
-            print(f"{BLUE}\nExecuted: {command} Successfully\n{RESET}")
-
-            os.system(command)    
-            
-            if os.path.exists(self.out_path):
-                print(f"{GREEN}\nAudio saved to: {self.out_path}\n{RESET}")
-                return {
-                    "status": "success",
-                    "message": "TTS generation completed successfully",
-                    "audio_path": self.out_path,
-                }
-            else:
-                return {
-                    "status": "error",
-                    "message": "TTS failed; output file not created",
-                    "audio_path": None,
-                }
+        try:
+            audio, cached = self.synthesize_audio(audio_format, sample_rate, bitrate)
+            with stage("file_write"):
+                stored = audio_store.put(audio, audio_format)
+
+            print(f"{GREEN}\nAudio saved to: {stored.path}\n{RESET}")
+            return {
+                "status": "success",
+                "message": "TTS generation completed successfully",
+                **stored.to_dict(),
+                "cached": cached,
+            }
         except Exception as e:
             print(f"{RED}\nError encountered with checkpoint {self.model_path}: {e}\n{RESET}")
             return {
@@ -91,6 +143,26 @@ class TTSModel:
                 "logs": None
             }
 
+    def stream_speech(self, encoder: StreamingAudioEncoder):
+        """
+        Synthesizes the text sentence by sentence and yields each encoded
+        chunk as soon as it is ready, so playback can start after the first
+        sentence.
+        """
+        try:
+            for sentence in self.model.synthesizer.split_into_sentences(self.preprocessed_text):
+                # Each sentence still goes through the batcher so it shares forward passes with other requests
+                start_time = time.perf_counter()
+                wav = self.model.batcher.submit(sentence)
+                self.observe_real_time_factor(wav, time.perf_counter() - start_time)
+                with stage("encode"):
+                    chunk = encoder.encode(wav)
+                if chunk:
+                    yield chunk
+            yield encoder.finish()
+        finally:
+            self.close()
+
 # # Example usage
 # if __name__ == "__main__":
 #     speaker_id = "LJ_BaseModel_Oshadi"  
@@ -1,47 +1,179 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import WebDriverException
-import time
 
-class WebDriverManager:
-    _driver = None  # Singleton WebDriver instance
-
-    @classmethod
-    def get_driver(cls):
-        """
-        Returns a singleton instance of the WebDriver.
-        If it's not initialized, create a new one with retry logic.
-        """
-        if cls._driver is None:
-            retries = 3
-            for attempt in range(retries):
-                try:
-                    options = Options()
-                    options.add_argument("--headless")
-                    options.add_argument("--disable-gpu")
-                    options.add_argument("--no-sandbox")
-                    options.add_argument("--disable-dev-shm-usage")
-                    # options.add_argument("--enable-unsafe-swiftshader")  # Forces using SwiftShader for WebGL rendering
-                    cls._driver = webdriver.Chrome(options=options)
-
-                    # cls._driver.implicitly_wait(60)
-                    print("WebDriver initialized successfully.")
-                    break
-                except WebDriverException as e:
-                    print(f"Attempt {attempt + 1} failed: {e}")
-                    time.sleep(2)  # Wait before retrying
-            else:
-                print("Failed to initialize WebDriver after multiple attempts.")
-        return cls._driver
-
-    @classmethod
-    def close_driver(cls):
-        """Closes and resets the WebDriver instance."""
-        if cls._driver:
-            try:
-                cls._driver.quit()
-                print("WebDriver closed successfully.")
-            except Exception as e:
-                print(f"Error closing WebDriver: {e}")
-            finally:
-                cls._driver = None
+WEBDRIVER_POOL_SIZE = int(os.environ.get("TTS_WEBDRIVER_POOL_SIZE", "4"))
+WEBDRIVER_MAX_USES = int(os.environ.get("TTS_WEBDRIVER_MAX_USES", "50"))
+WEBDRIVER_CHECKOUT_TIMEOUT = float(os.environ.get("TTS_WEBDRIVER_CHECKOUT_TIMEOUT", "60"))
+
+
+def create_driver(retries: int = 3):
+    """
+    Starts a new headless Chrome instance with retry logic.
+    Returns None if Chrome could not be started.
+    """
+    for attempt in range(retries):
+        try:
+            options = Options()
+            options.add_argument("--headless")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            # options.add_argument("--enable-unsafe-swiftshader")  # Forces using SwiftShader for WebGL rendering
+            driver = webdriver.Chrome(options=options)
+            print("WebDriver initialized successfully.")
+            return driver
+        except WebDriverException as e:
+            print(f"Attempt {attempt + 1} failed: {e}")
+            time.sleep(2)  # Wait before retrying
+    print("Failed to initialize WebDriver after multiple attempts.")
+    return None
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class WebDriverPool:
+    """
+    Bounded pool of warm headless Chrome drivers.
+
+    A driver is used by one request at a time: `checkout` hands out an idle
+    driver (starting a new one while the pool is below `size`) and blocks
+    when all of them are busy. `checkin` returns it to the pool, replacing it
+    when it failed a health check or has served `max_uses` requests.
+    """
+
+    def __init__(self, size: int = WEBDRIVER_POOL_SIZE, max_uses: int = WEBDRIVER_MAX_USES, driver_factory=create_driver):
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.driver_factory = driver_factory
+        self._idle = []
+        self._drivers = {}
+        self._started = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def warm(self, count: int = None):
+        """Starts drivers up front so the first requests don't pay the Chrome startup."""
+        for _ in range(min(count or self.size, self.size)):
+            with self._condition:
+                if self._started >= self.size:
+                    return
+                self._started += 1
+            pooled = self._start()
+            if pooled is None:
+                return
+            self._release(pooled)
+
+    def checkout(self, timeout: float = WEBDRIVER_CHECKOUT_TIMEOUT):
+        """Returns a healthy driver, or None if none became available in time."""
+        deadline = time.monotonic() + timeout
+        while True:
+            pooled = None
+            with self._condition:
+                while True:
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        break
+                    if self._started < self.size:
+                        self._started += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self._condition.wait(remaining)
+
+            # Chrome is started outside the lock so other checkouts aren't blocked
+            if pooled is None:
+                pooled = self._start()
+                if pooled is None:
+                    return None
+
+            if self._is_healthy(pooled.driver):
+                pooled.uses += 1
+                return pooled.driver
+            print("Discarding unhealthy WebDriver.")
+            self._discard(pooled)
+
+    def checkin(self, driver, healthy: bool = True):
+        """Gives the driver back to the pool, recycling it if needed."""
+        pooled = self._drivers.get(id(driver))
+        if pooled is None:
+            return
+        if self._closed or not healthy or (self.max_uses and pooled.uses >= self.max_uses):
+            self._discard(pooled)
+        else:
+            self._release(pooled)
+
+    @contextmanager
+    def driver(self, timeout: float = WEBDRIVER_CHECKOUT_TIMEOUT):
+        """Checks out a driver for the duration of a `with` block."""
+        driver = self.checkout(timeout)
+        healthy = True
+        try:
+            yield driver
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            if driver is not None:
+                self.checkin(driver, healthy)
+
+    def stats(self):
+        with self._condition:
+            return {"size": self.size, "started": self._started, "idle": len(self._idle)}
+
+    def close(self):
+        """Quits every idle driver. Drivers that are checked out are quit on checkin."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._discard(pooled)
+
+    def _start(self):
+        driver = self.driver_factory()
+        if driver is None:
+            with self._condition:
+                self._started -= 1
+                self._condition.notify()
+            return None
+        pooled = _PooledDriver(driver)
+        self._drivers[id(driver)] = pooled
+        return pooled
+
+    def _release(self, pooled):
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    def _discard(self, pooled):
+        self._drivers.pop(id(pooled.driver), None)
+        try:
+            pooled.driver.quit()
+            print("WebDriver closed successfully.")
+        except Exception as e:
+            print(f"Error closing WebDriver: {e}")
+        finally:
+            with self._condition:
+                self._started -= 1
+                self._condition.notify()
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            driver.current_url  # Round trip to the browser, fails if it died
+            return True
+        except Exception:
+            return False
+
+
+webdriver_pool = WebDriverPool()
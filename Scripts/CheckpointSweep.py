@@ -0,0 +1,164 @@
+"""Score every checkpoint of a training run with MCD against ground-truth recordings.
+
+The model is built once from the first checkpoint and the weights of the next ones are loaded into it, so each
+checkpoint costs a state dict load and the synthesis of the test sentences in batches. The waveforms go straight
+to MCD scoring (see MCD.py) on a pool of worker processes while the next checkpoint is synthesized.
+
+Example:
+    python Scripts/CheckpointSweep.py --checkpoints_dir E:/UOM/FYP/TTSx/Model/LJ_Dinithi
+        --metadata_path E:/UOM/FYP/TTSx/Data/test_metadata.csv --ground_truth_dir E:/UOM/FYP/TTSx/Data/wavs
+"""
+import argparse
+import csv
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import librosa
+import numpy as np
+import torch
+
+from MCD import calculate_mcd, extract_mcep, wav_to_mcep
+from TTS.bin.synthesize_batch import load_sentences, make_batches, synthesize, write_wav
+from TTS.utils.synthesizer import Synthesizer
+
+# ANSI escape codes for text color
+RED = "\033[31m"
+GREEN = "\033[32m"
+YELLOW = "\033[33m"
+RESET = "\033[0m"
+BLUE = "\033[94m"
+
+# sample rate MCD.py compares the recordings at
+MCD_SAMPLE_RATE = 22050
+
+
+def checkpoint_step(file_name):
+    """Training step in a checkpoint name, e.g. 70000 for checkpoint_70000.pth, None for best_model.pth."""
+    match = re.search(r"(\d+)\.pth$", file_name)
+    return int(match.group(1)) if match else None
+
+
+def list_checkpoints(checkpoints_dir):
+    """Model checkpoints of a training folder, by training step."""
+    names = [
+        name
+        for name in os.listdir(checkpoints_dir)
+        if name.endswith(".pth") and name not in ("speakers.pth", "d_vectors.pth")
+    ]
+    return sorted(names, key=lambda name: (checkpoint_step(name) is None, checkpoint_step(name) or 0, name))
+
+
+def score(wav, sample_rate, ref_mcep):
+    """MCD of a synthesized waveform against the mel-cepstrum of its recording."""
+    if sample_rate != MCD_SAMPLE_RATE:
+        wav = librosa.resample(np.asarray(wav, dtype=np.float32), orig_sr=sample_rate, target_sr=MCD_SAMPLE_RATE)
+    return calculate_mcd(ref_mcep, wav_to_mcep(wav, sr=MCD_SAMPLE_RATE))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checkpoints_dir", required=True, help="Training folder with the .pth checkpoints")
+    parser.add_argument("--config_path", default=None, help="Model config, defaults to config.json in checkpoints_dir")
+    parser.add_argument("--metadata_path", required=True, help="Test sentences, id|text rows or a .jsonl file")
+    parser.add_argument("--ground_truth_dir", required=True, help="Recordings of the test sentences, <id>.wav")
+    parser.add_argument("--output_dir", default=None, help="Also save the synthesized wavs, one folder per checkpoint")
+    parser.add_argument("--table_path", default=None, help="CSV file for the results table")
+    parser.add_argument("--batch_size", type=int, default=16, help="Sentences synthesized per forward pass")
+    parser.add_argument("--num_workers", type=int, default=os.cpu_count(), help="Processes computing the MCD")
+    parser.add_argument("--lower", type=float, default=0, help="Sentences with an MCD out of [lower, upper] are")
+    parser.add_argument("--upper", type=float, default=7, help="left out of the filtered average, as in MCD.py")
+    parser.add_argument("--seed", type=int, default=0, help="Noise seed, the same for every checkpoint")
+    parser.add_argument("--use_cuda", action="store_true", help="Run the model on CUDA")
+    args = parser.parse_args()
+
+    config_path = args.config_path or os.path.join(args.checkpoints_dir, "config.json")
+    checkpoints = list_checkpoints(args.checkpoints_dir)
+    if not checkpoints:
+        print(f"{RED}No checkpoint found in {args.checkpoints_dir}{RESET}")
+        return
+
+    sentences = []
+    for sentence in load_sentences(args.metadata_path):
+        if os.path.exists(os.path.join(args.ground_truth_dir, f"{sentence.id}.wav")):
+            sentences.append(sentence)
+        else:
+            print(f"{YELLOW}No recording for {sentence.id}, skipping it.{RESET}")
+    print(f"{GREEN}Scoring {len(checkpoints)} checkpoints on {len(sentences)} sentences.{RESET}\n")
+
+    with ProcessPoolExecutor(max(1, args.num_workers)) as pool:
+        # the recordings are analysed once, while the model loads
+        ref_futures = {
+            sentence.id: pool.submit(
+                extract_mcep, os.path.join(args.ground_truth_dir, f"{sentence.id}.wav"), sr=MCD_SAMPLE_RATE
+            )
+            for sentence in sentences
+        }
+        synthesizer = Synthesizer(os.path.join(args.checkpoints_dir, checkpoints[0]), config_path, use_cuda=args.use_cuda)
+        ref_mceps = {sentence_id: future.result() for sentence_id, future in ref_futures.items()}
+        batches = make_batches(sentences, args.batch_size)
+
+        scores = {}
+        synthesis_times = {}
+        for idx, checkpoint in enumerate(checkpoints):
+            print(f"{BLUE}Synthesizing with {checkpoint}{RESET}")
+            start = time.time()
+            if idx > 0:
+                synthesizer.load_tts_checkpoint(os.path.join(args.checkpoints_dir, checkpoint))
+            # every checkpoint gets the same noise, so they differ by their weights only
+            torch.manual_seed(args.seed)
+            scores[checkpoint] = {}
+            for batch in batches:
+                for sentence, wav in zip(batch, synthesize(synthesizer, batch)):
+                    if args.output_dir:
+                        checkpoint_dir = os.path.join(args.output_dir, os.path.splitext(checkpoint)[0])
+                        os.makedirs(checkpoint_dir, exist_ok=True)
+                        write_wav(wav, os.path.join(checkpoint_dir, f"{sentence.id}.wav"), synthesizer.output_sample_rate)
+                    scores[checkpoint][sentence.id] = pool.submit(
+                        score, wav, synthesizer.output_sample_rate, ref_mceps[sentence.id]
+                    )
+            synthesis_times[checkpoint] = time.time() - start
+
+        rows = []
+        for checkpoint in checkpoints:
+            mcds = []
+            for sentence_id, future in scores[checkpoint].items():
+                try:
+                    mcds.append(future.result())
+                except Exception as e:
+                    print(f"{RED}Error scoring {sentence_id} of {checkpoint}: {e}{RESET}")
+            filtered = [mcd for mcd in mcds if args.lower <= mcd <= args.upper]
+            rows.append(
+                {
+                    "checkpoint": checkpoint,
+                    "step": checkpoint_step(checkpoint),
+                    "mean_mcd": float(np.mean(mcds)) if mcds else float("nan"),
+                    "filtered_mcd": float(np.mean(filtered)) if filtered else float("nan"),
+                    "num_filtered": len(filtered),
+                    "num_sentences": len(mcds),
+                    "synthesis_time": synthesis_times[checkpoint],
+                }
+            )
+
+    best = min(rows, key=lambda row: row["mean_mcd"] if not np.isnan(row["mean_mcd"]) else float("inf"))
+    print(f"\n{'checkpoint':<32} {'step':>8} {'MCD':>8} {'filtered':>9} {'kept':>7} {'time':>8}")
+    for row in rows:
+        line = (
+            f"{row['checkpoint']:<32} {row['step'] if row['step'] is not None else '-':>8} {row['mean_mcd']:>8.3f} "
+            f"{row['filtered_mcd']:>9.3f} {row['num_filtered']:>3}/{row['num_sentences']:<3} "
+            f"{row['synthesis_time']:>7.1f}s"
+        )
+        print(f"{GREEN}{line}{RESET}" if row is best else line)
+    print(f"\n{GREEN}Best checkpoint: {best['checkpoint']} (MCD {best['mean_mcd']:.3f} dB){RESET}")
+
+    if args.table_path:
+        with open(args.table_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"{GREEN}Table saved to {args.table_path}{RESET}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,11 @@ from scipy.spatial.distance import euclidean
 
 def extract_mcep(wav_path, sr=22050, order=24, alpha=0.58, eps=1e-8):
     x, _ = librosa.load(wav_path, sr=sr)
-    x = x.astype(np.float64)
+    return wav_to_mcep(x, sr=sr, order=order, alpha=alpha, eps=eps)
+
+def wav_to_mcep(x, sr=22050, order=24, alpha=0.58, eps=1e-8):
+    """Mel-cepstrum of a waveform already in memory, sampled at `sr`."""
+    x = np.asarray(x).astype(np.float64)
 
     _f0, timeaxis = pyworld.harvest(x, sr)
     sp = pyworld.cheaptrick(x, _f0, timeaxis, sr)
@@ -1,11 +1,8 @@
 import re
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from datetime import datetime
+from Transliterator import transliterate
+from NumberToWords import number_to_sinhala, expand_symbols, expand_numbers
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -108,66 +105,29 @@ def normalize_sinhala_text(text, driver):
 
 def convert_number_to_sinhala(driver, number):
     """
-    Converts a number to Sinhala words using the TrackerDisk website.
+    Converts a number to Sinhala words with the offline NumberToWords engine.
+    `driver` is no longer used and is only kept so existing callers keep working.
     """
     try:
-        driver.get("https://trackerdisk.com/calculators/conversions/numbers-to-sinhala-words")
-
-        input_field = WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.NAME, "input-number"))
-        )
-        input_field.clear()
-        input_field.send_keys(str(number))
-
-        convert_button = driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
-        convert_button.click()
-
-        output_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "number-to-word"))
-        )
-
-        WebDriverWait(driver, 10).until(
-            lambda d: output_field.text.strip() or output_field.get_attribute("value").strip()
-        )
-
-        sinhala_words = output_field.get_attribute("value") or output_field.text.strip()
-        return sinhala_words
-
-    except Exception as e:
+        return number_to_sinhala(number)
+    except ValueError as e:
         logging.error(f"Error converting number {number} to Sinhala words: {e}")
         return number  # Return original number if conversion fails
 
 def text_to_roman(driver, text):
-    """
-    Converts Sinhala text to Roman script using Selenium and an online tool.
-    """
-    try:
-        driver.get("https://pitaka.lk/tools/converter.html")
-        input_field = WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located((By.ID, "box1"))
-        )
-        output_field = driver.find_element(By.ID, "box2")
-        input_field.clear()
-        input_field.send_keys(text)
-
-        convert_button = driver.find_element(By.CSS_SELECTOR, 'div#output-buttons a.button[script="ro"]')
-        convert_button.click()
-
-        result = output_field.get_attribute("value")
-        return result if result else "Error"
-
-    except Exception as e:
-        logging.error(f"Error converting text to Roman: {text}\n{e}")
-        return "Error"
+    """Converts Sinhala text to Roman script with the local transliterator. `driver` is unused."""
+    return transliterate(text)
 
 def preprocess_sinhala_text(driver, text):
     """
     Preprocesses Sinhala text by:
     - Handling dates and months in Sinhala
-    - Converting numbers to Sinhala words
+    - Converting numbers, ordinals, decimals and money amounts to Sinhala words
     - Normalizing text
     - Converting to Roman script
     """
+    text = expand_symbols(text)
+
     if contains_date_or_time(text):
         text = map_month_to_sinhala(text)
 
@@ -176,11 +136,7 @@ def preprocess_sinhala_text(driver, text):
 
     normalized_text = normalize_sinhala_text(text, driver)
 
-    numbers_in_text = re.findall(r"\b\d+\b", normalized_text)
-    for number in numbers_in_text:
-        sinhala_word = convert_number_to_sinhala(driver, number)
-        if sinhala_word:
-            normalized_text = normalized_text.replace(f" {number} ", f" {sinhala_word} ")
+    normalized_text = expand_numbers(normalized_text)
 
     roman_text = text_to_roman(driver, normalized_text)
 
@@ -204,13 +160,7 @@ def process_sinhala_text(driver, input_text):
 
     return processed_text
 
-options = Options()
-options.add_argument("--headless")
-options.add_argument("--disable-gpu")
-
-driver = webdriver.Chrome(options=options)
-
-# Example Usage
+# Example Usage (no browser needed, numbers and romanization run locally)
 input_text = "සිවු වන සීනය 2024/12/06 12:54:23 සීනය සීනය/සීනය:"
-output_text = process_sinhala_text(driver, input_text)
+output_text = process_sinhala_text(None, input_text)
 print("Processed Text:", output_text)
@@ -0,0 +1,144 @@
+"""Quantize a VITS checkpoint to int8 for CPU inference and check the quality loss with MCD.
+
+The checkpoint is exported to ONNX and its convolutions and matrix products (text encoder, flow and HiFi-GAN
+decoder) are quantized to int8 by ONNX Runtime. Static quantization calibrates the activation ranges on a sample of
+the metadata sentences. The fp32 and int8 models then synthesize the test sentences without noise, so they differ by
+the quantization only, and the int8 waveforms are scored with MCD (see MCD.py) against the fp32 ones. The script
+exits with an error when the mean MCD is above --max_mcd.
+
+The int8 model is served with `Synthesizer(<model>.int8.onnx, config_path, backend="onnx")`, or by the API with
+TTS_BACKEND=onnx and TTS_ONNX_INT8=true.
+
+Example:
+    python Scripts/QuantizeModel.py --model_path E:/UOM/FYP/TTSx/Model/LJ_Dinithi/best_model.pth
+        --metadata_path E:/UOM/FYP/TTSx/Data/metadata.csv --num_calibration 100 --num_test 20
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import librosa
+import numpy as np
+
+from MCD import calculate_mcd, wav_to_mcep
+from TTS.bin.synthesize_batch import load_sentences, synthesize
+from TTS.utils.quantization import QUANTIZATION_MODES, calibration_feeds, quantize_onnx, quantized_model_path
+from TTS.utils.synthesizer import Synthesizer
+
+# ANSI escape codes for text color
+RED = "\033[31m"
+GREEN = "\033[32m"
+YELLOW = "\033[33m"
+RESET = "\033[0m"
+BLUE = "\033[94m"
+
+# sample rate MCD.py compares the recordings at
+MCD_SAMPLE_RATE = 22050
+
+
+def score(wav, ref_wav, sample_rate):
+    """MCD of the int8 waveform of a sentence against its fp32 waveform."""
+    if sample_rate != MCD_SAMPLE_RATE:
+        wav = librosa.resample(np.asarray(wav, dtype=np.float32), orig_sr=sample_rate, target_sr=MCD_SAMPLE_RATE)
+        ref_wav = librosa.resample(np.asarray(ref_wav, dtype=np.float32), orig_sr=sample_rate, target_sr=MCD_SAMPLE_RATE)
+    return calculate_mcd(wav_to_mcep(ref_wav, sr=MCD_SAMPLE_RATE), wav_to_mcep(wav, sr=MCD_SAMPLE_RATE))
+
+
+def timed_synthesis(synthesizer, sentences, batch_size):
+    """Waveforms of the sentences and the seconds it took, after a warm-up sentence."""
+    synthesize(synthesizer, sentences[:1])
+    wavs = []
+    start = time.time()
+    for idx in range(0, len(sentences), batch_size):
+        wavs.extend(synthesize(synthesizer, sentences[idx : idx + batch_size]))
+    return wavs, time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model_path", required=True, help="VITS checkpoint, .pth, or its ONNX export")
+    parser.add_argument("--config_path", default=None, help="Model config, defaults to config.json next to the model")
+    parser.add_argument("--metadata_path", required=True, help="Sentences to calibrate and test on, id|text rows or .jsonl")
+    parser.add_argument("--output_path", default=None, help="int8 model, defaults to <model>.int8.onnx")
+    parser.add_argument("--mode", default="static", choices=QUANTIZATION_MODES, help="Quantization of the activations")
+    parser.add_argument("--num_calibration", type=int, default=100, help="Sentences the activation ranges come from")
+    parser.add_argument("--num_test", type=int, default=20, help="Other sentences the MCD and speed are measured on")
+    parser.add_argument("--batch_size", type=int, default=1, help="Sentences synthesized per forward pass")
+    parser.add_argument("--max_mcd", type=float, default=1.0, help="Highest mean MCD (dB) against fp32 that passes")
+    parser.add_argument("--threads", type=int, default=0, help="ONNX Runtime intra-op threads, 0 lets it pick them")
+    parser.add_argument("--num_workers", type=int, default=os.cpu_count(), help="Processes computing the MCD")
+    parser.add_argument("--table_path", default=None, help="CSV file for the per sentence MCD")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the sentence sampling")
+    args = parser.parse_args()
+
+    config_path = args.config_path or os.path.join(os.path.dirname(args.model_path), "config.json")
+    onnx_path = os.path.splitext(args.model_path)[0] + ".onnx"
+    output_path = args.output_path or quantized_model_path(onnx_path, args.mode)
+
+    sentences = load_sentences(args.metadata_path)
+    random.Random(args.seed).shuffle(sentences)
+    test_sentences = sentences[: args.num_test]
+    # calibrate on other sentences than the test ones, unless the metadata is too small for both
+    calibration_sentences = sentences[args.num_test : args.num_test + args.num_calibration] or test_sentences
+
+    print(f"{BLUE}Loading the fp32 model{RESET}")
+    fp32 = Synthesizer(args.model_path, config_path, backend="onnx", onnx_intra_op_threads=args.threads)
+    speaker_manager = getattr(fp32.tts_model, "speaker_manager", None)
+    speaker_ids = None
+    if speaker_manager is not None and speaker_manager.name_to_id:
+        default_id = next(iter(speaker_manager.name_to_id.values()))
+        speaker_ids = [speaker_manager.name_to_id.get(s.speaker, default_id) for s in calibration_sentences]
+
+    print(f"{BLUE}Quantizing to {output_path} ({args.mode}, {len(calibration_sentences)} calibration sentences){RESET}")
+    feeds = calibration_feeds(fp32.tts_model, [s.text for s in calibration_sentences], speaker_ids=speaker_ids)
+    quantize_onnx(onnx_path, output_path, mode=args.mode, feeds=feeds)
+    int8 = Synthesizer(output_path, config_path, backend="onnx", onnx_intra_op_threads=args.threads)
+
+    # without noise both models see the same latents and differ by the quantization only
+    for synthesizer in (fp32, int8):
+        synthesizer.tts_model.inference_noise_scale = 0.0
+        synthesizer.tts_model.inference_noise_scale_dp = 0.0
+
+    print(f"{BLUE}Synthesizing {len(test_sentences)} test sentences{RESET}")
+    fp32_wavs, fp32_time = timed_synthesis(fp32, test_sentences, args.batch_size)
+    int8_wavs, int8_time = timed_synthesis(int8, test_sentences, args.batch_size)
+
+    sample_rate = fp32.output_sample_rate
+    with ProcessPoolExecutor(max(1, args.num_workers)) as pool:
+        futures = [pool.submit(score, wav, ref_wav, sample_rate) for wav, ref_wav in zip(int8_wavs, fp32_wavs)]
+        rows = []
+        for sentence, future in zip(test_sentences, futures):
+            try:
+                rows.append({"id": sentence.id, "mcd": float(future.result())})
+            except Exception as e:
+                print(f"{RED}Error scoring {sentence.id}: {e}{RESET}")
+
+    if not rows:
+        print(f"{RED}No sentence could be scored.{RESET}")
+        sys.exit(1)
+    for row in rows:
+        print(f"{row['id']:<32} {row['mcd']:>8.3f}")
+    mean_mcd = float(np.mean([row["mcd"] for row in rows]))
+    fp32_size, int8_size = os.path.getsize(onnx_path), os.path.getsize(output_path)
+    print(f"\nfp32: {fp32_time:.2f}s, {fp32_size / 2**20:.1f} MB")
+    print(f"int8: {int8_time:.2f}s, {int8_size / 2**20:.1f} MB, {fp32_time / max(int8_time, 1e-6):.2f}x speedup")
+
+    if args.table_path:
+        with open(args.table_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["id", "mcd"])
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"{GREEN}Table saved to {args.table_path}{RESET}")
+
+    if mean_mcd > args.max_mcd:
+        print(f"{RED}Mean MCD against fp32 {mean_mcd:.3f} dB is above {args.max_mcd} dB, the int8 model fails.{RESET}")
+        sys.exit(1)
+    print(f"{GREEN}Mean MCD against fp32 {mean_mcd:.3f} dB, the int8 model passes.{RESET}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import re
+import unicodedata
+
+# Offline Sinhala to Roman (ISO 15919) transliterator.
+#
+# Produces the same romanization as the pitaka.lk converter that was used to
+# build our training metadata (e.g. කුඹුර -> kumbura, සංඥාව -> saṁgnāva,
+# ක්‍ෂ -> kş), restricted to the characters in the VitsCharacters set of the
+# Sinhala recipe.
+
+VITS_CHARACTERS = " !'(),-.:;=?abcdefghijklmnoprstuvyæñāēīōśşūǣḍḥḷṁṅṇṉṛṝṭ"
+
+HAL = "්"  # al-lakuna
+ZWJ = "‍"  # joins yansaya, rakaransaya, repaya and touching letters
+ZWNJ = "‌"
+
+CONSONANTS = {
+    "ක": "k", "ඛ": "kh", "ග": "g", "ඝ": "gh", "ඞ": "ṅ", "ඟ": "ṉg",
+    "ච": "c", "ඡ": "ch", "ජ": "j", "ඣ": "jh", "ඤ": "ñ", "ඥ": "gn", "ඦ": "ṉj",
+    "ට": "ṭ", "ඨ": "ṭh", "ඩ": "ḍ", "ඪ": "ḍh", "ණ": "ṇ", "ඬ": "ṇḍ",
+    "ත": "t", "ථ": "th", "ද": "d", "ධ": "dh", "න": "n", "ඳ": "ṉd",
+    "ප": "p", "ඵ": "ph", "බ": "b", "භ": "bh", "ම": "m", "ඹ": "mb",
+    "ය": "y", "ර": "r", "ල": "l", "ව": "v",
+    "ශ": "ś", "ෂ": "ş", "ස": "s", "හ": "h", "ළ": "ḷ", "ෆ": "f",
+}
+
+VOWEL_SIGNS = {
+    "ා": "ā", "ැ": "æ", "ෑ": "ǣ", "ි": "i", "ී": "ī", "ු": "u", "ූ": "ū",
+    "ෘ": "ṛ", "ෲ": "ṝ", "ෟ": "ḷ", "ෳ": "ḷ",
+    "ෙ": "e", "ේ": "ē", "ෛ": "ai", "ො": "o", "ෝ": "ō", "ෞ": "au",
+    HAL: "",
+}
+
+INDEPENDENT_VOWELS = {
+    "අ": "a", "ආ": "ā", "ඇ": "æ", "ඈ": "ǣ", "ඉ": "i", "ඊ": "ī", "උ": "u", "ඌ": "ū",
+    "ඍ": "ṛ", "ඎ": "ṝ", "ඏ": "ḷ", "ඐ": "ḷ",
+    "එ": "e", "ඒ": "ē", "ඓ": "ai", "ඔ": "o", "ඕ": "ō", "ඖ": "au",
+    "ං": "ṁ", "ඃ": "ḥ", "ඁ": "ṁ",
+}
+
+# Latin letters that are missing from the model vocabulary
+LATIN_FALLBACKS = {"q": "k", "w": "v", "x": "ks", "z": "s"}
+
+# Consonants carry the inherent `a`; a vowel sign or al-lakuna that follows
+# replaces it. The marker lets one str.translate pass do the whole job.
+_SIGN = "\x00"
+
+_CHARACTER_TABLE = str.maketrans({
+    **{consonant: roman + "a" for consonant, roman in CONSONANTS.items()},
+    **{sign: _SIGN + roman for sign, roman in VOWEL_SIGNS.items()},
+    **INDEPENDENT_VOWELS,
+    **LATIN_FALLBACKS,
+    ZWJ: "",
+    ZWNJ: "",
+})
+_UNSUPPORTED_PATTERN = re.compile("[^" + re.escape(VITS_CHARACTERS) + "]")
+
+
+def transliterate(text, strict=True):
+    """
+    Converts Sinhala text to Roman script.
+
+    Every consonant gets the inherent `a` unless it is followed by a vowel
+    sign or the al-lakuna. Zero width joiners only change how a conjunct is
+    drawn (ක්‍ෂ, ප්‍ර, ව්‍ය, ර්‍ය), so they are dropped after the al-lakuna has
+    removed the inherent vowel. With `strict=True` anything outside
+    `VITS_CHARACTERS` is removed from the output.
+    """
+    # Two part vowel signs (ෙ + ා) are stored both composed and decomposed
+    text = unicodedata.normalize("NFC", text)
+    text = text.lower().translate(_CHARACTER_TABLE)
+    text = text.replace("a" + _SIGN, "").replace(_SIGN, "")
+    if strict:
+        text = _UNSUPPORTED_PATTERN.sub("", text)
+    return text
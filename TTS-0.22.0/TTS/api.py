@@ -24,6 +24,7 @@ class TTS(nn.Module):
         vocoder_config_path: str = None,
         progress_bar: bool = True,
         gpu=False,
+        backend: str = "torch",
     ):
         """🐸TTS python interface that allows to load and use the released models.
 
@@ -47,6 +48,10 @@ class TTS(nn.Module):
             >>> tts.tts_to_file("C'est le clonage de la voix.", speaker_wav="my/cloning/audio.wav", language="fr", file_path="thisisit.wav")
             >>> tts.tts_to_file("Isso é clonagem de voz.", speaker_wav="my/cloning/audio.wav", language="pt", file_path="thisisit.wav")
 
+        Example running a VITS model in ONNX Runtime:
+            >>> tts = TTS(model_path="/path/to/best_model.pth", config_path="/path/to/config.json", backend="onnx")
+            >>> tts.tts_to_file(text="This is a test.", file_path="output.wav")
+
         Example Fairseq TTS models (uses ISO language codes in https://dl.fbaipublicfiles.com/mms/tts/all-tts-languages.html):
             >>> tts = TTS(model_name="tts_models/eng/fairseq/vits", progress_bar=False, gpu=True)
             >>> tts.tts_to_file("This is a test.", file_path="output.wav")
@@ -59,6 +64,8 @@ class TTS(nn.Module):
             vocoder_config_path (str, optional): Path to the vocoder config. Defaults to None.
             progress_bar (bool, optional): Whether to pring a progress bar while downloading a model. Defaults to True.
             gpu (bool, optional): Enable/disable GPU. Some models might be too slow on CPU. Defaults to False.
+            backend (str, optional): Runtime of the TTS model, `torch`, `onnx` to run a VITS model in ONNX Runtime or
+                `torchscript` to run its traced inference. See `Synthesizer`. Defaults to `torch`.
         """
         super().__init__()
         self.manager = ModelManager(models_file=self.get_models_file_path(), progress_bar=progress_bar, verbose=False)
@@ -66,6 +73,7 @@ class TTS(nn.Module):
         self.synthesizer = None
         self.voice_converter = None
         self.model_name = ""
+        self.backend = backend
         if gpu:
             warnings.warn("`gpu` will be deprecated. Please use `tts.to(device)` instead.")
 
@@ -185,6 +193,7 @@ class TTS(nn.Module):
             encoder_config=None,
             model_dir=model_dir,
             use_cuda=gpu,
+            backend=self.backend,
         )
 
     def load_tts_model_by_path(
@@ -210,6 +219,7 @@ class TTS(nn.Module):
             encoder_checkpoint=None,
             encoder_config=None,
             use_cuda=gpu,
+            backend=self.backend,
         )
 
     def _check_arguments(
@@ -0,0 +1,79 @@
+"""Measure the import time of the inference entry points.
+
+Every module is imported in a fresh interpreter with `python -X importtime`, the self time of the imported modules
+is summed by top level package and the slowest packages are reported. Packages that a VITS synthesizer never needs
+(phonemizer backends, number normalizers, plotting and dataframe libraries) are flagged when they get imported.
+
+Example:
+    python TTS/bin/benchmark_imports.py --modules TTS.api TTS.utils.synthesizer --runs 3
+"""
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULES = ["TTS.api", "TTS.utils.synthesizer", "TTS.bin.synthesize"]
+
+# imported on demand, only by the models, languages or tools using them
+LAZY_PACKAGES = ["gruut", "inflect", "pypinyin", "jamo", "g2pkk", "bangla", "matplotlib", "pandas", "transformers"]
+
+
+def import_times(module: str) -> Tuple[Dict[str, int], List[str]]:
+    """Import `module` in a new interpreter.
+
+    Returns:
+        Tuple[Dict[str, int], List[str]]: self import time in microseconds of every imported module, by name, and
+        the imported modules in import order.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f" [!] Failed to import {module}:\n{result.stderr}")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():
+            continue
+        times[name.strip()] = int(self_time)
+    return times, list(times)
+
+
+def by_package(times: Dict[str, int]) -> Dict[str, int]:
+    """Sum the module times by top level package, and by subpackage for 🐸TTS modules."""
+    packages = defaultdict(int)
+    for name, self_time in times.items():
+        parts = name.split(".")
+        packages[".".join(parts[:3]) if parts[0] == "TTS" else parts[0]] += self_time
+    return packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES, help="Modules to import.")
+    parser.add_argument("--runs", type=int, default=1, help="Imports per module, the fastest one is reported.")
+    parser.add_argument("--top", type=int, default=10, help="Number of packages reported per module.")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        runs = [import_times(module) for _ in range(args.runs)]
+        times, imported = min(runs, key=lambda run: sum(run[0].values()))
+        print(f" > {module}: {sum(times.values()) / 1e6:.2f}s, {len(imported)} modules")
+        for package, self_time in sorted(by_package(times).items(), key=lambda item: -item[1])[: args.top]:
+            print(f"   | > {package:<40} {self_time / 1e3:8.1f}ms")
+        unexpected = sorted({name.split(".")[0] for name in imported} & set(LAZY_PACKAGES))
+        if unexpected:
+            failed = True
+            print(f"   | > [!] Imported at startup: {', '.join(unexpected)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
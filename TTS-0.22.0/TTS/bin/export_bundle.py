@@ -0,0 +1,50 @@
+import argparse
+import time
+from argparse import RawTextHelpFormatter
+
+from TTS.utils.model_bundle import export_bundle, load_bundle
+from TTS.utils.synthesizer import Synthesizer
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="""Export a TTS checkpoint to an inference bundle that loads in a fraction of the time.
+
+                       The bundle holds the config, the tokenizer vocabulary, the speaker and language maps and the
+                       weights in the safetensors layout with weight norm folded. Pass the bundle folder as
+                       `--model_path` to `tts` or `tts-server`, no config is needed.\n\n
+                       Example run:
+                            python TTS/bin/export_bundle.py
+                                --model_path Model/LJ_Dinithi/best_model.pth
+                                --config_path Model/LJ_Dinithi/config.json
+                                --output_path Model/LJ_Dinithi/bundle
+                                --dtype fp16
+                    """,
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument("--model_path", type=str, required=True, help="Path to the model checkpoint.")
+    parser.add_argument("--config_path", type=str, required=True, help="Path to the model config file.")
+    parser.add_argument("--speakers_file_path", type=str, default=None, help="JSON file for multi-speaker model.")
+    parser.add_argument("--output_path", type=str, required=True, help="Folder of the bundle.")
+    parser.add_argument(
+        "--dtype",
+        type=str,
+        default="fp32",
+        choices=["fp32", "fp16"],
+        help="Precision of the stored weights. fp16 halves the size, weights are cast to fp32 when loaded.",
+    )
+    args = parser.parse_args()
+
+    start = time.time()
+    synthesizer = Synthesizer(args.model_path, args.config_path, tts_speakers_file=args.speakers_file_path)
+    checkpoint_time = time.time() - start
+    export_bundle(synthesizer.tts_model, synthesizer.tts_config, args.output_path, args.dtype)
+    print(f" > Bundle written to {args.output_path}")
+
+    start = time.time()
+    load_bundle(args.output_path)
+    print(f" > Load time: checkpoint {checkpoint_time:.3f}s, bundle {time.time() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -128,6 +128,27 @@ If you don't specify any models, then it uses LJSpeech based English model.
 ```
 $ tts --out_path output/path/speech.wav --model_name "<language>/<dataset>/<model_name>" --source_wav <path/to/speaker/wav> --target_wav <path/to/reference/wav>
 ```
+
+### Daemon Mode
+
+- Keep a model loaded in the background:
+
+  ```
+  $ tts --serve --model_path path/to/model.pth --config_path path/to/config.json
+  ```
+
+- Later `tts` calls are forwarded to the daemon and skip loading the model. A call for another model makes the
+  daemon load it. Use `--use_daemon false` to synthesize in the calling process.
+
+  ```
+  $ tts --text "Text for TTS" --model_path path/to/model.pth --config_path path/to/config.json --out_path output/path/speech.wav
+  ```
+
+- Stop the daemon:
+
+  ```
+  $ tts --stop_daemon
+  ```
 """
 
 
@@ -314,8 +335,56 @@ def main():
         help="Voice dir for tortoise model",
     )
 
+    # daemon mode
+    parser.add_argument(
+        "--serve",
+        help="Keep the model loaded and synthesize the requests of other `tts` calls forwarded through a local socket.",
+        type=str2bool,
+        nargs="?",
+        const=True,
+        default=False,
+    )
+    parser.add_argument(
+        "--use_daemon",
+        help="Forward the request to a running `tts --serve` daemon if there is one. Defaults to True.",
+        type=str2bool,
+        nargs="?",
+        const=True,
+        default=True,
+    )
+    parser.add_argument(
+        "--daemon_address",
+        type=str,
+        default=None,
+        help="Unix socket path or `host:port` of the daemon. Defaults to $TTS_DAEMON_ADDRESS or a private "
+        "per-user socket in $XDG_RUNTIME_DIR or the temp folder (127.0.0.1:5054 on Windows).",
+    )
+    parser.add_argument(
+        "--daemon_max_models",
+        type=int,
+        default=1,
+        help="Models kept loaded by the daemon. A request for another model loads it and unloads the least recently "
+        "used one.",
+    )
+    parser.add_argument(
+        "--stop_daemon",
+        help="Stop the running `tts --serve` daemon.",
+        type=str2bool,
+        nargs="?",
+        const=True,
+        default=False,
+    )
+
     args = parser.parse_args()
 
+    if args.serve or args.stop_daemon:
+        from TTS.server import daemon
+
+        if args.stop_daemon:
+            sys.exit(0 if daemon.stop(args.daemon_address) else 1)
+        daemon.serve(args, load_synthesizer, run_synthesis)
+        return
+
     # print the description if either text or list_models is not set
     check_args = [
         args.text,
@@ -331,30 +400,22 @@ def main():
     if not any(check_args):
         parser.parse_args(["-h"])
 
+    if args.use_daemon:
+        # before the heavy imports, the daemon has them loaded already
+        from TTS.server import daemon
+
+        if daemon.forward(args):
+            return
+
     pipe_out = sys.stdout if args.pipe_out else None
 
     with contextlib.redirect_stdout(None if args.pipe_out else sys.stdout):
         # Late-import to make things load faster
-        from TTS.api import TTS
         from TTS.utils.manage import ModelManager
-        from TTS.utils.synthesizer import Synthesizer
 
         # load model manager
         path = Path(__file__).parent / "../.models.json"
         manager = ModelManager(path, progress_bar=args.progress_bar)
-        api = TTS()
-
-        tts_path = None
-        tts_config_path = None
-        speakers_file_path = None
-        language_ids_file_path = None
-        vocoder_path = None
-        vocoder_config_path = None
-        encoder_path = None
-        encoder_config_path = None
-        vc_path = None
-        vc_config_path = None
-        model_dir = None
 
         # CASE1 #list : list pre-trained TTS models
         if args.list_models:
@@ -372,122 +433,149 @@ def main():
             manager.model_info_by_full_name(model_query_full_name)
             sys.exit()
 
-        # CASE3: load pre-trained model paths
-        if args.model_name is not None and not args.model_path:
-            model_path, config_path, model_item = manager.download_model(args.model_name)
-            # tts model
-            if model_item["model_type"] == "tts_models":
-                tts_path = model_path
-                tts_config_path = config_path
-                if "default_vocoder" in model_item:
-                    args.vocoder_name = (
-                        model_item["default_vocoder"] if args.vocoder_name is None else args.vocoder_name
-                    )
-
-            # voice conversion model
-            if model_item["model_type"] == "voice_conversion_models":
-                vc_path = model_path
-                vc_config_path = config_path
-
-            # tts model with multiple files to be loaded from the directory path
-            if model_item.get("author", None) == "fairseq" or isinstance(model_item["model_url"], list):
-                model_dir = model_path
-                tts_path = None
-                tts_config_path = None
-                args.vocoder_name = None
-
-        # load vocoder
-        if args.vocoder_name is not None and not args.vocoder_path:
-            vocoder_path, vocoder_config_path, _ = manager.download_model(args.vocoder_name)
-
-        # CASE4: set custom model paths
-        if args.model_path is not None:
-            tts_path = args.model_path
-            tts_config_path = args.config_path
-            speakers_file_path = args.speakers_file_path
-            language_ids_file_path = args.language_ids_file_path
-
-        if args.vocoder_path is not None:
-            vocoder_path = args.vocoder_path
-            vocoder_config_path = args.vocoder_config_path
-
-        if args.encoder_path is not None:
-            encoder_path = args.encoder_path
-            encoder_config_path = args.encoder_config_path
-
-        device = args.device
-        if args.use_cuda:
-            device = "cuda"
-
-        # load models
-        synthesizer = Synthesizer(
-            tts_path,
-            tts_config_path,
-            speakers_file_path,
-            language_ids_file_path,
-            vocoder_path,
-            vocoder_config_path,
-            encoder_path,
-            encoder_config_path,
-            vc_path,
-            vc_config_path,
-            model_dir,
-            args.voice_dir,
-        ).to(device)
-
-        # query speaker ids of a multi-speaker model.
-        if args.list_speaker_idxs:
-            print(
-                " > Available speaker ids: (Set --speaker_idx flag to one of these values to use the multi-speaker model."
-            )
-            print(synthesizer.tts_model.speaker_manager.name_to_id)
-            return
-
-        # query langauge ids of a multi-lingual model.
-        if args.list_language_idxs:
-            print(
-                " > Available language ids: (Set --language_idx flag to one of these values to use the multi-lingual model."
-            )
-            print(synthesizer.tts_model.language_manager.name_to_id)
-            return
-
-        # check the arguments against a multi-speaker model.
-        if synthesizer.tts_speakers_file and (not args.speaker_idx and not args.speaker_wav):
-            print(
-                " [!] Looks like you use a multi-speaker model. Define `--speaker_idx` to "
-                "select the target speaker. You can list the available speakers for this model by `--list_speaker_idxs`."
-            )
-            return
-
-        # RUN THE SYNTHESIS
-        if args.text:
-            print(" > Text: {}".format(args.text))
-
-        # kick it
-        if tts_path is not None:
-            wav = synthesizer.tts(
-                args.text,
-                speaker_name=args.speaker_idx,
-                language_name=args.language_idx,
-                speaker_wav=args.speaker_wav,
-                reference_wav=args.reference_wav,
-                style_wav=args.capacitron_style_wav,
-                style_text=args.capacitron_style_text,
-                reference_speaker_name=args.reference_speaker_idx,
-            )
-        elif vc_path is not None:
-            wav = synthesizer.voice_conversion(
-                source_wav=args.source_wav,
-                target_wav=args.target_wav,
-            )
-        elif model_dir is not None:
-            wav = synthesizer.tts(
-                args.text, speaker_name=args.speaker_idx, language_name=args.language_idx, speaker_wav=args.speaker_wav
-            )
-
-        # save the results
-        print(" > Saving output to {}".format(args.out_path))
-        synthesizer.save_wav(wav, args.out_path, pipe_out=pipe_out)
+        synthesizer = load_synthesizer(args, manager)
+        run_synthesis(args, synthesizer, pipe_out)
+
+
+def load_synthesizer(args: argparse.Namespace, manager: "ModelManager" = None) -> "Synthesizer":
+    """Download the models selected by the command line arguments if needed and load them."""
+    # Late-import to make things load faster
+    from TTS.utils.manage import ModelManager
+    from TTS.utils.synthesizer import Synthesizer
+
+    if manager is None:
+        manager = ModelManager(Path(__file__).parent / "../.models.json", progress_bar=args.progress_bar)
+
+    tts_path = None
+    tts_config_path = None
+    speakers_file_path = None
+    language_ids_file_path = None
+    vocoder_path = None
+    vocoder_config_path = None
+    encoder_path = None
+    encoder_config_path = None
+    vc_path = None
+    vc_config_path = None
+    model_dir = None
+    vocoder_name = args.vocoder_name
+
+    # CASE3: load pre-trained model paths
+    if args.model_name is not None and not args.model_path:
+        model_path, config_path, model_item = manager.download_model(args.model_name)
+        # tts model
+        if model_item["model_type"] == "tts_models":
+            tts_path = model_path
+            tts_config_path = config_path
+            if "default_vocoder" in model_item:
+                vocoder_name = model_item["default_vocoder"] if vocoder_name is None else vocoder_name
+
+        # voice conversion model
+        if model_item["model_type"] == "voice_conversion_models":
+            vc_path = model_path
+            vc_config_path = config_path
+
+        # tts model with multiple files to be loaded from the directory path
+        if model_item.get("author", None) == "fairseq" or isinstance(model_item["model_url"], list):
+            model_dir = model_path
+            tts_path = None
+            tts_config_path = None
+            vocoder_name = None
+
+    # load vocoder
+    if vocoder_name is not None and not args.vocoder_path:
+        vocoder_path, vocoder_config_path, _ = manager.download_model(vocoder_name)
+
+    # CASE4: set custom model paths
+    if args.model_path is not None:
+        tts_path = args.model_path
+        tts_config_path = args.config_path
+        speakers_file_path = args.speakers_file_path
+        language_ids_file_path = args.language_ids_file_path
+
+    if args.vocoder_path is not None:
+        vocoder_path = args.vocoder_path
+        vocoder_config_path = args.vocoder_config_path
+
+    if args.encoder_path is not None:
+        encoder_path = args.encoder_path
+        encoder_config_path = args.encoder_config_path
+
+    device = args.device
+    if args.use_cuda:
+        device = "cuda"
+
+    # load models
+    return Synthesizer(
+        tts_path,
+        tts_config_path,
+        speakers_file_path,
+        language_ids_file_path,
+        vocoder_path,
+        vocoder_config_path,
+        encoder_path,
+        encoder_config_path,
+        vc_path,
+        vc_config_path,
+        model_dir,
+        args.voice_dir,
+    ).to(device)
+
+
+def run_synthesis(args: argparse.Namespace, synthesizer: "Synthesizer", pipe_out=None):
+    """Synthesize the request of the command line arguments with loaded models and save the output."""
+    # query speaker ids of a multi-speaker model.
+    if args.list_speaker_idxs:
+        print(
+            " > Available speaker ids: (Set --speaker_idx flag to one of these values to use the multi-speaker model."
+        )
+        print(synthesizer.tts_model.speaker_manager.name_to_id)
+        return
+
+    # query langauge ids of a multi-lingual model.
+    if args.list_language_idxs:
+        print(
+            " > Available language ids: (Set --language_idx flag to one of these values to use the multi-lingual model."
+        )
+        print(synthesizer.tts_model.language_manager.name_to_id)
+        return
+
+    # check the arguments against a multi-speaker model.
+    if synthesizer.tts_speakers_file and (not args.speaker_idx and not args.speaker_wav):
+        print(
+            " [!] Looks like you use a multi-speaker model. Define `--speaker_idx` to "
+            "select the target speaker. You can list the available speakers for this model by `--list_speaker_idxs`."
+        )
+        return
+
+    # RUN THE SYNTHESIS
+    if args.text:
+        print(" > Text: {}".format(args.text))
+
+    # kick it
+    if synthesizer.tts_checkpoint:
+        wav = synthesizer.tts(
+            args.text,
+            speaker_name=args.speaker_idx,
+            language_name=args.language_idx,
+            speaker_wav=args.speaker_wav,
+            reference_wav=args.reference_wav,
+            style_wav=args.capacitron_style_wav,
+            style_text=args.capacitron_style_text,
+            reference_speaker_name=args.reference_speaker_idx,
+        )
+    elif synthesizer.vc_checkpoint:
+        wav = synthesizer.voice_conversion(
+            source_wav=args.source_wav,
+            target_wav=args.target_wav,
+        )
+    else:
+        wav = synthesizer.tts(
+            args.text, speaker_name=args.speaker_idx, language_name=args.language_idx, speaker_wav=args.speaker_wav
+        )
+
+    # save the results
+    print(" > Saving output to {}".format(args.out_path))
+    synthesizer.save_wav(wav, args.out_path, pipe_out=pipe_out)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Synthesize every sentence of a metadata file in one process.
+
+Sentences are sorted by length and synthesized in padded batches, so a batch holds sentences of about the same
+length and little compute is spent on padding. Waveforms are written by a pool of writer threads while the next
+batch runs. Every sentence is written to `<output_path>/<id>.wav`, the naming `Scripts/MCD.py` expects, and the
+sentences whose file already exists are skipped, so an interrupted run restarts where it stopped.
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from argparse import RawTextHelpFormatter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from TTS.utils.audio.numpy_transforms import save_wav
+from TTS.utils.synthesizer import Synthesizer
+
+
+@dataclass
+class Sentence:
+    id: str
+    text: str
+    speaker: str = None
+
+
+def load_sentences(path: str, delimiter: str = "|") -> List[Sentence]:
+    """Read `id|text|speaker` rows from a CSV file or `{"id", "text", "speaker"}` objects from a JSONL file. The
+    speaker is optional."""
+    sentences = []
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    sentences.append(Sentence(str(item["id"]), item["text"], item.get("speaker")))
+        else:
+            for row in csv.reader(f, delimiter=delimiter, quoting=csv.QUOTE_NONE):
+                if len(row) < 2:
+                    continue
+                sentences.append(Sentence(row[0], row[1], row[2] if len(row) > 2 and row[2] else None))
+
+    ids = set()
+    for sentence in sentences:
+        if os.path.basename(sentence.id) != sentence.id or sentence.id in ("", ".", ".."):
+            raise ValueError(f" [!] Sentence id `{sentence.id}` can't be used as a file name.")
+        if sentence.id in ids:
+            raise ValueError(f" [!] Duplicate sentence id `{sentence.id}` in {path}.")
+        ids.add(sentence.id)
+    return sentences
+
+
+def make_batches(sentences: List[Sentence], batch_size: int) -> List[List[Sentence]]:
+    """Sort the sentences by length and cut them into batches, longest first so a lack of memory shows up early."""
+    sentences = sorted(sentences, key=lambda sentence: len(sentence.text), reverse=True)
+    return [sentences[idx : idx + batch_size] for idx in range(0, len(sentences), batch_size)]
+
+
+def synthesize(synthesizer: Synthesizer, sentences: List[Sentence], language_name: str = None) -> List[np.ndarray]:
+    """Synthesize a batch of sentences with `Synthesizer.tts_batch`, one forward pass per length bucket for VITS
+    models and one by one otherwise."""
+    speaker_manager = getattr(synthesizer.tts_model, "speaker_manager", None)
+    multi_speaker = speaker_manager is not None and speaker_manager.name_to_id
+    if multi_speaker:
+        for sentence in sentences:
+            if sentence.speaker and sentence.speaker not in speaker_manager.name_to_id:
+                raise ValueError(f" [!] Unknown speaker `{sentence.speaker}` for sentence `{sentence.id}`.")
+    return synthesizer.tts_batch(
+        [sentence.text for sentence in sentences],
+        speakers=[sentence.speaker for sentence in sentences] if multi_speaker else None,
+        language_name=language_name,
+        batch_size=len(sentences),
+    )
+
+
+def write_wav(wav: np.ndarray, path: str, sample_rate: int):
+    """Write through a temporary file so an interrupted run never leaves a truncated wav that looks done."""
+    tmp_path = path + ".tmp"
+    save_wav(wav=wav, path=tmp_path, sample_rate=sample_rate)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__
+        + """
+Example runs:
+    tts-batch --metadata_path metadata.csv --output_path eval_wavs
+        --model_path Model/LJ_Dinithi/best_model.pth --config_path Model/LJ_Dinithi/config.json
+
+    tts-batch --metadata_path sentences.jsonl --output_path eval_wavs --batch_size 32
+        --model_path path/to/model.pth --config_path path/to/config.json --speakers_file_path path/to/speakers.json
+""",
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--metadata_path",
+        type=str,
+        required=True,
+        help="Sentences to synthesize: `id|text|speaker` CSV rows, or a `.jsonl` file of {id, text, speaker} objects.",
+    )
+    parser.add_argument("--output_path", type=str, required=True, help="Folder of the output wav files.")
+    parser.add_argument("--model_path", type=str, required=True, help="Path to the model checkpoint or bundle.")
+    parser.add_argument("--config_path", type=str, default=None, help="Path to the model config file.")
+    parser.add_argument("--speakers_file_path", type=str, default=None, help="JSON file for multi-speaker model.")
+    parser.add_argument("--language_ids_file_path", type=str, default=None, help="JSON file for multi-lingual model.")
+    parser.add_argument(
+        "--language_idx", type=str, default=None, help="Language of every sentence for multi-lingual model."
+    )
+    parser.add_argument("--vocoder_path", type=str, default=None, help="Path to vocoder model file.")
+    parser.add_argument("--vocoder_config_path", type=str, default=None, help="Path to vocoder model config file.")
+    parser.add_argument("--delimiter", type=str, default="|", help="Column delimiter of CSV metadata files.")
+    parser.add_argument("--batch_size", type=int, default=16, help="Sentences synthesized per forward pass.")
+    parser.add_argument("--num_writers", type=int, default=4, help="Threads writing the wav files.")
+    parser.add_argument("--overwrite", action="store_true", help="Synthesize the sentences already written again.")
+    parser.add_argument("--use_cuda", action="store_true", help="Run the model on CUDA.")
+    args = parser.parse_args()
+
+    sentences = load_sentences(args.metadata_path, args.delimiter)
+    os.makedirs(args.output_path, exist_ok=True)
+    todo = [
+        sentence
+        for sentence in sentences
+        if args.overwrite or not os.path.isfile(os.path.join(args.output_path, f"{sentence.id}.wav"))
+    ]
+    print(f" > {len(sentences)} sentences, {len(sentences) - len(todo)} already written, {len(todo)} to synthesize.")
+    if not todo:
+        return
+
+    synthesizer = Synthesizer(
+        tts_checkpoint=args.model_path,
+        tts_config_path=args.config_path,
+        tts_speakers_file=args.speakers_file_path,
+        tts_languages_file=args.language_ids_file_path,
+        vocoder_checkpoint=args.vocoder_path,
+        vocoder_config=args.vocoder_config_path,
+        use_cuda=args.use_cuda,
+    )
+    batches = make_batches(todo, args.batch_size)
+    start = time.time()
+    audio_seconds = 0.0
+    pending = []
+    with ThreadPoolExecutor(max(1, args.num_writers)) as writers:
+        for idx, batch in enumerate(batches):
+            batch_start = time.time()
+            wavs = synthesize(synthesizer, batch, args.language_idx)
+            for sentence, wav in zip(batch, wavs):
+                path = os.path.join(args.output_path, f"{sentence.id}.wav")
+                pending.append(writers.submit(write_wav, wav, path, synthesizer.output_sample_rate))
+            batch_seconds = sum(len(wav) for wav in wavs) / synthesizer.output_sample_rate
+            audio_seconds += batch_seconds
+            print(
+                f" > Batch {idx + 1}/{len(batches)}: {len(batch)} sentences, "
+                f"real-time factor {(time.time() - batch_start) / max(batch_seconds, 1e-6):.3f}"
+            )
+            # surface write errors and keep the synthesized audio waiting for the writers bounded
+            while len(pending) > args.batch_size * 2:
+                pending.pop(0).result()
+        for future in pending:
+            future.result()
+
+    elapsed = time.time() - start
+    print(f" > {len(todo)} sentences, {audio_seconds:.1f}s of audio written in {elapsed:.1f}s to {args.output_path}")
+
+
+if __name__ == "__main__":
+    main()
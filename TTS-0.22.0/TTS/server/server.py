@@ -4,16 +4,20 @@ import io
 import json
 import os
 import sys
+import threading
 from pathlib import Path
-from threading import Lock
 from typing import Union
 from urllib.parse import parse_qs
 
-from flask import Flask, render_template, render_template_string, request, send_file
+import torch
+from flask import Flask, Response, render_template, render_template_string, request, send_file, stream_with_context
 
 from TTS.config import load_config
+from TTS.utils.audio.encoders import StreamingAudioEncoder
 from TTS.utils.manage import ModelManager
 from TTS.utils.synthesizer import Synthesizer
+from TTS.utils.synthesizer_pool import PoolBusyError
+from TTS.utils.voice_registry import Lease, Voice, VoiceRegistry
 
 
 def create_argparser():
@@ -57,6 +61,44 @@ def create_argparser():
     parser.add_argument("--use_cuda", type=convert_boolean, default=False, help="true to use CUDA.")
     parser.add_argument("--debug", type=convert_boolean, default=False, help="true to enable Flask debug mode.")
     parser.add_argument("--show_details", type=convert_boolean, default=False, help="Generate model detail page.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of requests synthesized in parallel. Each worker has its own model replica sharing the weights.",
+    )
+    parser.add_argument(
+        "--max_queue_size", type=int, default=16, help="Requests allowed to wait for a worker before answering 503."
+    )
+    parser.add_argument("--queue_timeout", type=float, default=60, help="Seconds a request waits for a worker.")
+    parser.add_argument(
+        "--threads_per_worker",
+        type=int,
+        default=None,
+        help="Torch CPU threads per worker. Defaults to the number of cores divided by the number of workers.",
+    )
+    parser.add_argument(
+        "--manifest_path",
+        type=str,
+        default=None,
+        help="JSON manifest of the models and voices to serve from one process, instead of a single model. "
+        "Models are loaded on first use.",
+    )
+    parser.add_argument(
+        "--memory_budget",
+        type=float,
+        default=None,
+        help="MB of model weights kept in memory with --manifest_path. Least recently used models are evicted.",
+    )
+    parser.add_argument(
+        "--idle_timeout", type=float, default=None, help="Seconds after which an unused model is evicted."
+    )
+    parser.add_argument(
+        "--asgi",
+        type=convert_boolean,
+        default=False,
+        help="true to serve with the ASGI app, which adds WebSocket streaming. Needs `pip install TTS[server]`.",
+    )
     return parser
 
 
@@ -83,7 +125,7 @@ if args.list_models:
     sys.exit()
 
 # CASE2: load pre-trained model paths
-if args.model_name is not None and not args.model_path:
+if args.manifest_path is None and args.model_name is not None and not args.model_path:
     model_path, config_path, model_item = manager.download_model(args.model_name)
     args.vocoder_name = model_item["default_vocoder"] if args.vocoder_name is None else args.vocoder_name
 
@@ -100,31 +142,68 @@ if args.vocoder_path is not None:
     vocoder_path = args.vocoder_path
     vocoder_config_path = args.vocoder_config_path
 
-# load models
-synthesizer = Synthesizer(
-    tts_checkpoint=model_path,
-    tts_config_path=config_path,
-    tts_speakers_file=speakers_file_path,
-    tts_languages_file=None,
-    vocoder_checkpoint=vocoder_path,
-    vocoder_config=vocoder_config_path,
-    encoder_checkpoint="",
-    encoder_config="",
-    use_cuda=args.use_cuda,
-)
-
-use_multi_speaker = hasattr(synthesizer.tts_model, "num_speakers") and (
-    synthesizer.tts_model.num_speakers > 1 or synthesizer.tts_speakers_file is not None
-)
-speaker_manager = getattr(synthesizer.tts_model, "speaker_manager", None)
-
-use_multi_language = hasattr(synthesizer.tts_model, "num_languages") and (
-    synthesizer.tts_model.num_languages > 1 or synthesizer.tts_languages_file is not None
-)
-language_manager = getattr(synthesizer.tts_model, "language_manager", None)
-
-# TODO: set this from SpeakerManager
-use_gst = synthesizer.tts_config.get("use_gst", False)
+# split the cores between the workers so parallel requests don't oversubscribe the CPU
+if args.threads_per_worker is not None or args.workers > 1:
+    torch.set_num_threads(args.threads_per_worker or max(1, (os.cpu_count() or 1) // args.workers))
+registry_args = {
+    "num_replicas": args.workers,
+    "max_queue_size": args.max_queue_size,
+    "queue_timeout": args.queue_timeout,
+    "idle_timeout": args.idle_timeout,
+    "memory_budget": int(args.memory_budget * 1024**2) if args.memory_budget is not None else None,
+    "use_cuda": args.use_cuda,
+}
+
+
+def model_details() -> list:
+    # NOTE: without a manifest, only one model is active at the same time
+    if args.model_name is not None:
+        return args.model_name.split("/")
+    return ["", "en", "", "default"]
+
+
+if args.manifest_path is not None:
+    # models are loaded on first use
+    synthesizer = None
+    voice_registry = VoiceRegistry.from_manifest(args.manifest_path, **registry_args)
+    voice_registry.start_sweeper()
+else:
+    # load models
+    synthesizer = Synthesizer(
+        tts_checkpoint=model_path,
+        tts_config_path=config_path,
+        tts_speakers_file=speakers_file_path,
+        tts_languages_file=None,
+        vocoder_checkpoint=vocoder_path,
+        vocoder_config=vocoder_config_path,
+        encoder_checkpoint="",
+        encoder_config="",
+        use_cuda=args.use_cuda,
+    )
+    name, locale = model_details()[3], model_details()[1]
+    voice_registry = VoiceRegistry.from_synthesizer(synthesizer, Voice(name, name, locale=locale), **registry_args)
+
+if synthesizer is not None:
+    use_multi_speaker = hasattr(synthesizer.tts_model, "num_speakers") and (
+        synthesizer.tts_model.num_speakers > 1 or synthesizer.tts_speakers_file is not None
+    )
+    speaker_manager = getattr(synthesizer.tts_model, "speaker_manager", None)
+    speaker_ids = speaker_manager.name_to_id if speaker_manager is not None else None
+
+    use_multi_language = hasattr(synthesizer.tts_model, "num_languages") and (
+        synthesizer.tts_model.num_languages > 1 or synthesizer.tts_languages_file is not None
+    )
+    language_manager = getattr(synthesizer.tts_model, "language_manager", None)
+    language_ids = language_manager.name_to_id if language_manager is not None else None
+
+    # TODO: set this from SpeakerManager
+    use_gst = synthesizer.tts_config.get("use_gst", False)
+else:
+    # the speaker list offers the voices of the manifest
+    use_multi_speaker = True
+    speaker_ids = list(voice_registry.voices)
+    use_multi_language, language_ids = False, None
+    use_gst = False
 app = Flask(__name__)
 
 
@@ -147,26 +226,24 @@ def style_wav_uri_to_dict(style_wav: str) -> Union[str, dict]:
     return None
 
 
-@app.route("/")
-def index():
-    return render_template(
-        "index.html",
-        show_details=args.show_details,
-        use_multi_speaker=use_multi_speaker,
-        use_multi_language=use_multi_language,
-        speaker_ids=speaker_manager.name_to_id if speaker_manager is not None else None,
-        language_ids=language_manager.name_to_id if language_manager is not None else None,
-        use_gst=use_gst,
-    )
+def index_context() -> dict:
+    return {
+        "show_details": args.show_details,
+        "use_multi_speaker": use_multi_speaker,
+        "use_multi_language": use_multi_language,
+        "speaker_ids": speaker_ids,
+        "language_ids": language_ids,
+        "use_gst": use_gst,
+    }
 
 
-@app.route("/details")
-def details():
+def details_context() -> dict:
+    # no config with --manifest_path, the models are loaded on demand
+    model_config = None
     if args.config_path is not None and os.path.isfile(args.config_path):
         model_config = load_config(args.config_path)
-    else:
-        if args.model_name is not None:
-            model_config = load_config(config_path)
+    elif config_path is not None:
+        model_config = load_config(config_path)
 
     if args.vocoder_config_path is not None and os.path.isfile(args.vocoder_config_path):
         vocoder_config = load_config(args.vocoder_config_path)
@@ -176,34 +253,133 @@ def details():
         else:
             vocoder_config = None
 
-    return render_template(
-        "details.html",
-        show_details=args.show_details,
-        model_config=model_config,
-        vocoder_config=vocoder_config,
-        args=args.__dict__,
-    )
+    return {
+        "show_details": args.show_details,
+        "model_config": model_config,
+        "vocoder_config": vocoder_config,
+        "args": args.__dict__,
+    }
+
+
+@app.route("/")
+def index():
+    return render_template("index.html", **index_context())
+
+
+@app.route("/details")
+def details():
+    return render_template("details.html", **details_context())
+
+
+def server_busy(error: PoolBusyError):
+    print(f" > {error}")
+    return "Server busy, retry later.", 503, {"Retry-After": "1"}
 
 
-lock = Lock()
+def tts_request(headers, values) -> dict:
+    """Read the `/api/tts` parameters. Headers take precedence over query and form values.
+
+    Raises:
+        ValueError: if the sample rate or bitrate (kbps) are not integers.
+    """
+    sample_rate = headers.get("sample-rate") or values.get("sample_rate", "")
+    bitrate = headers.get("bitrate") or values.get("bitrate", "")
+    try:
+        sample_rate = int(sample_rate) if sample_rate else None
+        bitrate = int(bitrate) if bitrate else None
+    except ValueError as e:
+        raise ValueError("sample_rate and bitrate must be integers.") from e
+    return {
+        "text": headers.get("text") or values.get("text", ""),
+        "speaker_idx": headers.get("speaker-id") or values.get("speaker_id", ""),
+        "language_idx": headers.get("language-id") or values.get("language_id", ""),
+        "style_wav": style_wav_uri_to_dict(headers.get("style-wav") or values.get("style_wav", "")),
+        "audio_format": (headers.get("audio-format") or values.get("format", "wav")).lower(),
+        "sample_rate": sample_rate,
+        "bitrate": bitrate,
+    }
+
+
+def synthesize(lease: Lease, params: dict, text: str = None):
+    """Run a leased worker on the request text, or on `text` when synthesizing the request sentence by sentence."""
+    return lease.worker.tts(
+        params["text"] if text is None else text,
+        speaker_name=lease.speaker,
+        language_name=lease.language,
+        style_wav=params["style_wav"],
+    )
 
 
 @app.route("/api/tts", methods=["GET", "POST"])
 def tts():
-    with lock:
-        text = request.headers.get("text") or request.values.get("text", "")
-        speaker_idx = request.headers.get("speaker-id") or request.values.get("speaker_id", "")
-        language_idx = request.headers.get("language-id") or request.values.get("language_id", "")
-        style_wav = request.headers.get("style-wav") or request.values.get("style_wav", "")
-        style_wav = style_wav_uri_to_dict(style_wav)
-
-        print(f" > Model input: {text}")
-        print(f" > Speaker Idx: {speaker_idx}")
-        print(f" > Language Idx: {language_idx}")
-        wavs = synthesizer.tts(text, speaker_name=speaker_idx, language_name=language_idx, style_wav=style_wav)
-        out = io.BytesIO()
-        synthesizer.save_wav(wavs, out)
-    return send_file(out, mimetype="audio/wav")
+    try:
+        params = tts_request(request.headers, request.values)
+    except ValueError as e:
+        return str(e), 400
+    text, audio_format, sample_rate, bitrate = (
+        params["text"],
+        params["audio_format"],
+        params["sample_rate"],
+        params["bitrate"],
+    )
+
+    print(f" > Model input: {text}")
+    print(f" > Speaker Idx: {params['speaker_idx']}")
+    print(f" > Language Idx: {params['language_idx']}")
+
+    if audio_format == "wav" and sample_rate is None and bitrate is None:
+        try:
+            with voice_registry.lease(params["speaker_idx"], params["language_idx"]) as lease:
+                wavs = synthesize(lease, params)
+                out = io.BytesIO()
+                lease.worker.save_wav(wavs, out)
+        except PoolBusyError as e:
+            return server_busy(e)
+        return send_file(out, mimetype="audio/wav")
+
+    # take the worker before answering so an overloaded server still returns 503
+    try:
+        lease = voice_registry.acquire(params["speaker_idx"], params["language_idx"])
+    except PoolBusyError as e:
+        return server_busy(e)
+
+    try:
+        encoder = StreamingAudioEncoder(audio_format, lease.worker.output_sample_rate, sample_rate, bitrate)
+    except ValueError as e:
+        voice_registry.release(lease)
+        return str(e), 400
+
+    release_lock = threading.Lock()
+    released = False
+
+    def release():
+        # the worker goes back once, whether the text was synthesized, the client left or the stream never started
+        nonlocal released
+        with release_lock:
+            if released:
+                return
+            released = True
+        voice_registry.release(lease)
+
+    # encode sentence by sentence so the first bytes are sent before the whole text is synthesized
+    def generate():
+        try:
+            for sentence in lease.worker.split_into_sentences(text):
+                yield encoder.encode(synthesize(lease, params, sentence))
+            # free the worker before the client reads the tail
+            release()
+            yield encoder.finish()
+        finally:
+            release()
+
+    response = Response(stream_with_context(generate()), mimetype=encoder.media_type)
+    response.call_on_close(release)
+    return response
+
+
+@app.route("/api/workers", methods=["GET"])
+def workers():
+    return voice_registry.stats()
 
 
 # Basic MaryTTS compatibility layer
@@ -212,46 +388,50 @@ def tts():
 @app.route("/locales", methods=["GET"])
 def mary_tts_api_locales():
     """MaryTTS-compatible /locales endpoint"""
-    # NOTE: We currently assume there is only one model active at the same time
-    if args.model_name is not None:
-        model_details = args.model_name.split("/")
-    else:
-        model_details = ["", "en", "", "default"]
-    return render_template_string("{{ locale }}\n", locale=model_details[1])
+    locales = sorted({voice.locale for voice in voice_registry.voices.values()})
+    return render_template_string("{% for locale in locales %}{{ locale }}\n{% endfor %}", locales=locales)
 
 
 @app.route("/voices", methods=["GET"])
 def mary_tts_api_voices():
     """MaryTTS-compatible /voices endpoint"""
-    # NOTE: We currently assume there is only one model active at the same time
-    if args.model_name is not None:
-        model_details = args.model_name.split("/")
-    else:
-        model_details = ["", "en", "", "default"]
     return render_template_string(
-        "{{ name }} {{ locale }} {{ gender }}\n", name=model_details[3], locale=model_details[1], gender="u"
+        "{% for voice in voices %}{{ voice.name }} {{ voice.locale }} {{ voice.gender }}\n{% endfor %}",
+        voices=voice_registry.voices.values(),
     )
 
 
 @app.route("/process", methods=["GET", "POST"])
 def mary_tts_api_process():
     """MaryTTS-compatible /process endpoint"""
-    with lock:
-        if request.method == "POST":
-            data = parse_qs(request.get_data(as_text=True))
-            # NOTE: we ignore param. LOCALE and VOICE for now since we have only one active model
-            text = data.get("INPUT_TEXT", [""])[0]
-        else:
-            text = request.args.get("INPUT_TEXT", "")
-        print(f" > Model input: {text}")
-        wavs = synthesizer.tts(text)
-        out = io.BytesIO()
-        synthesizer.save_wav(wavs, out)
+    if request.method == "POST":
+        data = {key: value[0] for key, value in parse_qs(request.get_data(as_text=True)).items()}
+    else:
+        data = request.args
+    # NOTE: we ignore param. LOCALE, the voice selects the model
+    text = data.get("INPUT_TEXT", "")
+    voice = data.get("VOICE")
+    print(f" > Model input: {text}")
+    try:
+        with voice_registry.lease(voice) as lease:
+            wavs = lease.worker.tts(text, speaker_name=lease.speaker, language_name=lease.language)
+            out = io.BytesIO()
+            lease.worker.save_wav(wavs, out)
+    except PoolBusyError as e:
+        return server_busy(e)
     return send_file(out, mimetype="audio/wav")
 
 
 def main():
-    app.run(debug=args.debug, host="::", port=args.port)
+    if args.asgi:
+        import uvicorn  # pylint: disable=import-outside-toplevel
+
+        from TTS.server.asgi import create_app  # pylint: disable=import-outside-toplevel
+
+        uvicorn.run(create_app(sys.modules[__name__]), host="::", port=args.port)
+        return
+    # each request runs on its own thread, the pools of the voice registry bound how many synthesize at once
+    app.run(debug=args.debug, host="::", port=args.port, threaded=True)
 
 
 if __name__ == "__main__":
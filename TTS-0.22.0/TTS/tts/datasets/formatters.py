@@ -5,7 +5,6 @@ from glob import glob
 from pathlib import Path
 from typing import List
 
-import pandas as pd
 from tqdm import tqdm
 
 ########################
@@ -25,6 +24,8 @@ def cml_tts(root_path, meta_file, ignored_speakers=None):
         if len(line.split("|")) != num_cols:
             print(f" > Missing column in line {idx + 1} -> {line.strip()}")
     # load metadata
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     metadata = pd.read_csv(os.path.join(root_path, meta_file), sep="|")
     assert all(x in metadata.columns for x in ["wav_filename", "transcript"])
     client_id = None if "client_id" in metadata.columns else "default"
@@ -63,6 +64,8 @@ def coqui(root_path, meta_file, ignored_speakers=None):
         if len(line.split("|")) != num_cols:
             print(f" > Missing column in line {idx + 1} -> {line.strip()}")
     # load metadata
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     metadata = pd.read_csv(os.path.join(root_path, meta_file), sep="|")
     assert all(x in metadata.columns for x in ["audio_file", "text"])
     speaker_name = None if "speaker_name" in metadata.columns else "coqui"
@@ -1,5 +1,7 @@
+import inspect
 import math
 import os
+from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from itertools import chain
 from typing import Dict, List, Tuple, Union
@@ -1109,6 +1111,72 @@ class Vits(BaseTTS):
             - m_p: :math:`[B, C, T_dec]`
             - logs_p: :math:`[B, C, T_dec]`
         """
+        outputs, g = self._inference_latent(x, aux_input)
+        outputs["model_outputs"] = self.waveform_decoder(
+            (outputs["z"] * outputs["y_mask"])[:, :, : self.max_inference_len], g=g
+        )
+        return outputs
+
+    @torch.no_grad()
+    def inference_stream(
+        self,
+        x,
+        aux_input={"x_lengths": None, "d_vectors": None, "speaker_ids": None, "language_ids": None, "durations": None},
+        chunk_frames: int = 64,
+        overlap_frames: int = 16,
+        fade_samples: int = None,
+    ):  # pylint: disable=dangerous-default-value
+        """Streaming inference, yielding the waveform chunk by chunk.
+
+        The latent `z` is computed for the whole input as in `inference`, then the waveform decoder runs on windows
+        of `chunk_frames` frames, each padded with `overlap_frames` frames of context on both sides so the samples
+        near its edges are computed as in a full pass. The context samples are cropped and consecutive chunks are
+        cross-faded over `fade_samples` samples. The first chunk is ready after decoding a single window and the
+        decoder memory doesn't grow with the length of the input.
+
+        Args:
+            x (torch.Tensor): token IDs of a single input, :math:`[1, T_seq]`.
+            aux_input (Dict): speaker, language and duration inputs as in `inference`.
+            chunk_frames (int): `z` frames decoded per chunk. Defaults to 64.
+            overlap_frames (int): frames of context decoded on each side of a chunk. Defaults to 16.
+            fade_samples (int): cross-fade length in samples, at most `overlap_frames` frames. Defaults to one
+                frame.
+
+        Yields:
+            torch.Tensor: the next waveform chunk, :math:`[1, 1, T_chunk]`. The chunks add up to the
+            `model_outputs` of `inference`.
+        """
+        if x.shape[0] != 1:
+            raise ValueError(" [!] Streaming inference takes a single input.")
+        outputs, g = self._inference_latent(x, aux_input)
+        z = (outputs["z"] * outputs["y_mask"])[:, :, : self.max_inference_len]
+        hop_length = int(np.prod(self.args.upsample_rates_decoder))
+        fade_samples = hop_length if fade_samples is None else min(fade_samples, overlap_frames * hop_length)
+        fade_in = torch.linspace(0, 1, fade_samples + 2, device=z.device)[1:-1]
+
+        num_frames = z.shape[-1]
+        tail = None
+        for start in range(0, num_frames, chunk_frames):
+            end = min(start + chunk_frames, num_frames)
+            context_start = max(0, start - overlap_frames)
+            context_end = min(num_frames, end + overlap_frames)
+            o = self.waveform_decoder(z[:, :, context_start:context_end], g=g)
+            # samples of the chunk and, for the cross-fade with the next chunk, the ones after it
+            offset = (start - context_start) * hop_length
+            chunk_end = (end - context_start) * hop_length
+            extra = min(fade_samples, o.shape[-1] - chunk_end)
+            chunk = o[:, :, offset:chunk_end]
+            if tail is not None:
+                chunk = chunk.clone()
+                chunk[:, :, : tail.shape[-1]] = (
+                    tail * (1 - fade_in[: tail.shape[-1]]) + chunk[:, :, : tail.shape[-1]] * fade_in[: tail.shape[-1]]
+                )
+            tail = o[:, :, chunk_end : chunk_end + extra] if extra > 0 else None
+            yield chunk
+
+    def _inference_latent(self, x, aux_input):
+        """Run the model up to the waveform decoder. Returns the outputs of `inference` but `model_outputs`, and the
+        speaker conditioning of the decoder."""
         sid, g, lid, durations = self._set_cond_input(aux_input)
         x_lengths = self._set_x_lengths(x, aux_input)
 
@@ -1158,10 +1226,7 @@ class Vits(BaseTTS):
         # upsampling if needed
         z, _, _, y_mask = self.upsampling_z(z, y_lengths=y_lengths, y_mask=y_mask)
 
-        o = self.waveform_decoder((z * y_mask)[:, :, : self.max_inference_len], g=g)
-
         outputs = {
-            "model_outputs": o,
             "alignments": attn.squeeze(1),
             "durations": w_ceil,
             "z": z,
@@ -1170,7 +1235,7 @@ class Vits(BaseTTS):
             "logs_p": logs_p,
             "y_mask": y_mask,
         }
-        return outputs
+        return outputs, g
 
     @torch.no_grad()
     def inference_voice_conversion(
@@ -1803,87 +1868,141 @@ class Vits(BaseTTS):
             )
         return Vits(new_config, ap, tokenizer, speaker_manager, language_manager)
 
-    def export_onnx(self, output_path: str = "coqui_vits.onnx", verbose: bool = True):
-        """Export model to ONNX format for inference
+    def _graph_inference(self, text, text_lengths, scales, sid=None, langid=None):
+        """`inference` as traced by `export_onnx` and `export_torchscript`.
 
-        Args:
-            output_path (str): Path to save the exported model.
-            verbose (bool): Print verbose information. Defaults to True.
+        The scales ``[noise_scale, length_scale, noise_scale_dp]`` are read by `inference`, so they become inputs of
+        the graph. Returns the padded waveforms and the length of each waveform.
         """
+        self.inference_noise_scale = scales[0]
+        self.length_scale = scales[1]
+        self.inference_noise_scale_dp = scales[2]
+        outputs = self.inference(
+            text,
+            aux_input={
+                "x_lengths": text_lengths,
+                "d_vectors": None,
+                "speaker_ids": sid,
+                "language_ids": langid,
+                "durations": None,
+            },
+        )
+        hop_length = int(np.prod(self.args.upsample_rates_decoder))
+        return outputs["model_outputs"], outputs["y_mask"].sum([1, 2]).long() * hop_length
+
+    def _graph_dummy_inputs(self) -> Tuple[Tuple[torch.Tensor], List[str]]:
+        """Inputs `_graph_inference` is traced with and their names."""
+        device = next(self.parameters()).device
+        dummy_input_length = 100
+        sequences = torch.randint(low=0, high=2, size=(1, dummy_input_length), dtype=torch.long, device=device)
+        sequence_lengths = torch.LongTensor([sequences.size(1)]).to(device)
+        dummy_scales = torch.FloatTensor(
+            [self.inference_noise_scale, self.length_scale, self.inference_noise_scale_dp]
+        ).to(device)
+        dummy_input = (sequences, sequence_lengths, dummy_scales)
+        input_names = ["input", "input_lengths", "scales"]
 
+        if self.num_speakers > 0:
+            dummy_input += (torch.LongTensor([0]).to(device),)
+            input_names.append("sid")
+
+        if hasattr(self, "num_languages") and self.num_languages > 0 and self.embedded_language_dim > 0:
+            dummy_input += (torch.LongTensor([0]).to(device),)
+            input_names.append("langid")
+        return dummy_input, input_names
+
+    @contextmanager
+    def _graph_mode(self):
+        """Make `forward` run `_graph_inference` without the discriminator while the model is traced."""
         # rollback values
         _forward = self.forward
         disc = None
         if hasattr(self, "disc"):
             disc = self.disc
         training = self.training
+        scales = (self.inference_noise_scale, self.length_scale, self.inference_noise_scale_dp)
 
         # set export mode
         self.disc = None
         self.eval()
+        self.forward = self._graph_inference
+        try:
+            yield
+        finally:
+            # rollback
+            self.forward = _forward
+            self.inference_noise_scale, self.length_scale, self.inference_noise_scale_dp = scales
+            if training:
+                self.train()
+            if not disc is None:
+                self.disc = disc
 
-        def onnx_inference(text, text_lengths, scales, sid=None, langid=None):
-            noise_scale = scales[0]
-            length_scale = scales[1]
-            noise_scale_dp = scales[2]
-            self.noise_scale = noise_scale
-            self.length_scale = length_scale
-            self.noise_scale_dp = noise_scale_dp
-            return self.inference(
-                text,
-                aux_input={
-                    "x_lengths": text_lengths,
-                    "d_vectors": None,
-                    "speaker_ids": sid,
-                    "language_ids": langid,
-                    "durations": None,
-                },
-            )["model_outputs"]
+    def export_onnx(self, output_path: str = "coqui_vits.onnx", verbose: bool = True):
+        """Export model to ONNX format for inference
 
-        self.forward = onnx_inference
+        The graph takes the padded token IDs ``input`` ``[B, T]``, their ``input_lengths`` ``[B]``, the ``scales``
+        ``[noise_scale, length_scale, noise_scale_dp]`` and, for multi-speaker and multi-lingual models, the ``sid``
+        and ``langid`` of each item ``[B]``. It returns the padded waveforms ``output`` ``[B, 1, T_wav]`` and the
+        length of each waveform ``output_lengths`` ``[B]``.
 
-        # set dummy inputs
-        dummy_input_length = 100
-        sequences = torch.randint(low=0, high=2, size=(1, dummy_input_length), dtype=torch.long)
-        sequence_lengths = torch.LongTensor([sequences.size(1)])
-        scales = torch.FloatTensor([self.inference_noise_scale, self.length_scale, self.inference_noise_scale_dp])
-        dummy_input = (sequences, sequence_lengths, scales)
-        input_names = ["input", "input_lengths", "scales"]
+        Args:
+            output_path (str): Path to save the exported model.
+            verbose (bool): Print verbose information. Defaults to True.
+        """
+        # the TorchScript based exporter, newer torch versions default to the dynamo one
+        export_kwargs = {}
+        if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+            export_kwargs["dynamo"] = False
 
-        if self.num_speakers > 0:
-            speaker_id = torch.LongTensor([0])
-            dummy_input += (speaker_id,)
-            input_names.append("sid")
+        # export to ONNX
+        with self._graph_mode():
+            dummy_input, input_names = self._graph_dummy_inputs()
+            torch.onnx.export(
+                model=self,
+                args=dummy_input,
+                opset_version=15,
+                f=output_path,
+                verbose=verbose,
+                input_names=input_names,
+                output_names=["output", "output_lengths"],
+                dynamic_axes={
+                    "input": {0: "batch_size", 1: "phonemes"},
+                    "input_lengths": {0: "batch_size"},
+                    "sid": {0: "batch_size"},
+                    "langid": {0: "batch_size"},
+                    "output": {0: "batch_size", 1: "time1", 2: "time2"},
+                    "output_lengths": {0: "batch_size"},
+                },
+                **export_kwargs,
+            )
 
-        if hasattr(self, "num_languages") and self.num_languages > 0 and self.embedded_language_dim > 0:
-            language_id = torch.LongTensor([0])
-            dummy_input += (language_id,)
-            input_names.append("langid")
+    def export_torchscript(self, output_path: str = "coqui_vits.pt"):
+        """Trace the inference of the model into a TorchScript module and save it.
 
-        # export to ONNX
-        torch.onnx.export(
-            model=self,
-            args=dummy_input,
-            opset_version=15,
-            f=output_path,
-            verbose=verbose,
-            input_names=input_names,
-            output_names=["output"],
-            dynamic_axes={
-                "input": {0: "batch_size", 1: "phonemes"},
-                "input_lengths": {0: "batch_size"},
-                "output": {0: "batch_size", 1: "time1", 2: "time2"},
-            },
-        )
+        The Python control flow of `inference` (speaker and language conditioning, stochastic or deterministic
+        duration predictor, upsampling) is resolved for the loaded config at trace time, only the tensor operations
+        are recorded. The module takes and returns the tensors of the `export_onnx` graph, in the same order. It is
+        written through a temporary file, so processes sharing a cache never load a partial module.
+
+        Args:
+            output_path (str): Path to save the traced module.
+        """
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        with self._graph_mode(), torch.no_grad():
+            dummy_input, _ = self._graph_dummy_inputs()
+            traced = torch.jit.trace(self, dummy_input, check_trace=False)
+        torch.jit.save(traced, tmp_path)
+        os.replace(tmp_path, output_path)
 
-        # rollback
-        self.forward = _forward
-        if training:
-            self.train()
-        if not disc is None:
-            self.disc = disc
+    def load_onnx(self, model_path: str, cuda=False, intra_op_num_threads: int = 0, inter_op_num_threads: int = 0):
+        """Load a model exported by `export_onnx` into an ONNX Runtime session.
 
-    def load_onnx(self, model_path: str, cuda=False):
+        Args:
+            model_path (str): Path to the exported model.
+            cuda (bool): Run the session on CUDA. Defaults to False.
+            intra_op_num_threads (int): Threads running a single operator. Defaults to 0, picked by ONNX Runtime.
+            inter_op_num_threads (int): Threads running independent operators. Defaults to 0, picked by ONNX Runtime.
+        """
         import onnxruntime as ort
 
         providers = [
@@ -1892,20 +2011,21 @@ class Vits(BaseTTS):
             else ("CUDAExecutionProvider", {"cudnn_conv_algo_search": "DEFAULT"})
         ]
         sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = intra_op_num_threads
+        sess_options.inter_op_num_threads = inter_op_num_threads
         self.onnx_sess = ort.InferenceSession(
             model_path,
             sess_options=sess_options,
             providers=providers,
         )
 
-    def inference_onnx(self, x, x_lengths=None, speaker_id=None, language_id=None):
-        """ONNX inference"""
-
+    def _onnx_inputs(self, x, x_lengths=None, speaker_id=None, language_id=None) -> Dict:
+        """Feed of the ONNX session. The speaker and language IDs are a single ID or one ID per batch item."""
         if isinstance(x, torch.Tensor):
             x = x.cpu().numpy()
 
         if x_lengths is None:
-            x_lengths = np.array([x.shape[1]], dtype=np.int64)
+            x_lengths = np.array([x.shape[1]] * x.shape[0], dtype=np.int64)
 
         if isinstance(x_lengths, torch.Tensor):
             x_lengths = x_lengths.cpu().numpy()
@@ -1915,16 +2035,94 @@ class Vits(BaseTTS):
         )
         input_params = {"input": x, "input_lengths": x_lengths, "scales": scales}
         if not speaker_id is None:
-            input_params["sid"] = torch.tensor([speaker_id]).cpu().numpy()
+            input_params["sid"] = np.asarray(speaker_id, dtype=np.int64).reshape(-1)
         if not language_id is None:
-            input_params["langid"] = torch.tensor([language_id]).cpu().numpy()
+            input_params["langid"] = np.asarray(language_id, dtype=np.int64).reshape(-1)
+        return input_params
 
+    def inference_onnx(self, x, x_lengths=None, speaker_id=None, language_id=None):
+        """ONNX inference"""
         audio = self.onnx_sess.run(
             ["output"],
-            input_params,
+            self._onnx_inputs(x, x_lengths, speaker_id, language_id),
         )
         return audio[0][0]
 
+    def inference_onnx_batch(self, x, x_lengths, speaker_ids=None, language_ids=None) -> Tuple[np.ndarray, np.ndarray]:
+        """ONNX inference of a padded batch.
+
+        Args:
+            x (Union[np.ndarray, torch.Tensor]): padded token IDs. Shape `[B, T]`.
+            x_lengths (Union[np.ndarray, torch.Tensor]): number of tokens of each item. Shape `[B]`.
+            speaker_ids (List[int], optional): speaker ID of each item. Defaults to None.
+            language_ids (List[int], optional): language ID of each item. Defaults to None.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: the padded waveforms `[B, T_wav]` and the length of each one.
+        """
+        output_names = [output.name for output in self.onnx_sess.get_outputs()]
+        if "output_lengths" not in output_names and len(x) > 1:
+            raise ValueError(" [!] The ONNX model has no `output_lengths`, export it again to synthesize batches.")
+        outputs = self.onnx_sess.run(
+            [name for name in ("output", "output_lengths") if name in output_names],
+            self._onnx_inputs(x, x_lengths, speaker_ids, language_ids),
+        )
+        wavs = outputs[0][:, 0]
+        if len(outputs) > 1:
+            # the output is cropped to `max_inference_len` frames
+            wav_lengths = np.minimum(outputs[1], wavs.shape[-1])
+        else:
+            wav_lengths = np.array([wavs.shape[-1]], dtype=np.int64)
+        return wavs, wav_lengths
+
+    def load_torchscript(self, model_path: str, cuda=False):
+        """Load a module traced by `export_torchscript`.
+
+        Args:
+            model_path (str): Path to the traced module.
+            cuda (bool): Run the module on CUDA. Defaults to False.
+        """
+        module = torch.jit.load(model_path, map_location="cuda" if cuda else "cpu").eval()
+        # not registered as a submodule, so it stays out of the state dict and out of later traces
+        self.__dict__["torchscript_module"] = module
+
+    @torch.no_grad()
+    def inference_torchscript_batch(
+        self, x, x_lengths, speaker_ids=None, language_ids=None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Inference of a padded batch with the module loaded by `load_torchscript`.
+
+        The current noise and length scales of the model are passed to the module, so they can be changed after it
+        is traced.
+
+        Args:
+            x (torch.Tensor): padded token IDs. Shape `[B, T]`.
+            x_lengths (torch.Tensor): number of tokens of each item. Shape `[B]`.
+            speaker_ids (torch.Tensor, optional): speaker ID of each item. Defaults to None.
+            language_ids (torch.Tensor, optional): language ID of each item. Defaults to None.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: the padded waveforms `[B, T_wav]` and the length of each one.
+        """
+        scales = torch.tensor(
+            [self.inference_noise_scale, self.length_scale, self.inference_noise_scale_dp],
+            dtype=torch.float,
+            device=x.device,
+        )
+        inputs = [x, x_lengths, scales]
+        if self.num_speakers > 0:
+            if speaker_ids is None:
+                raise ValueError(" [!] The TorchScript module of a multi-speaker model needs speaker IDs.")
+            inputs.append(speaker_ids.reshape(-1))
+        if hasattr(self, "num_languages") and self.num_languages > 0 and self.embedded_language_dim > 0:
+            if language_ids is None:
+                raise ValueError(" [!] The TorchScript module of a multi-lingual model needs language IDs.")
+            inputs.append(language_ids.reshape(-1))
+        model_outputs, wav_lengths = self.torchscript_module(*inputs)
+        wavs = model_outputs[:, 0].cpu().numpy()
+        # the output is cropped to `max_inference_len` frames
+        return wavs, np.minimum(wav_lengths.cpu().numpy(), wavs.shape[-1])
+
 
 ##################################
 # VITS CHARACTERS
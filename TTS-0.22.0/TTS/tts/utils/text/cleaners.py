@@ -8,14 +8,26 @@ from anyascii import anyascii
 from TTS.tts.utils.text.chinese_mandarin.numbers import replace_numbers_to_characters_in_text
 
 from .english.abbreviations import abbreviations_en
-from .english.number_norm import normalize_numbers as en_normalize_numbers
-from .english.time_norm import expand_time_english
 from .french.abbreviations import abbreviations_fr
 
 # Regular expression matching whitespace:
 _whitespace_re = re.compile(r"\s+")
 
 
+# inflect takes seconds to import, so the English number and time expansion is only imported when it is used
+def en_normalize_numbers(text):
+    from .english.number_norm import normalize_numbers  # pylint: disable=import-outside-toplevel
+
+    return normalize_numbers(text)
+
+
+def expand_time_english(text):
+    # pylint: disable=import-outside-toplevel
+    from .english.time_norm import expand_time_english as _expand_time_english
+
+    return _expand_time_english(text)
+
+
 def expand_abbreviations(text, lang="en"):
     if lang == "en":
         _abbreviations = abbreviations_en
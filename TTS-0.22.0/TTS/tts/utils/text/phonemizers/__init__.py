@@ -1,49 +1,86 @@
-from TTS.tts.utils.text.phonemizers.bangla_phonemizer import BN_Phonemizer
-from TTS.tts.utils.text.phonemizers.base import BasePhonemizer
-from TTS.tts.utils.text.phonemizers.belarusian_phonemizer import BEL_Phonemizer
-from TTS.tts.utils.text.phonemizers.espeak_wrapper import ESpeak
-from TTS.tts.utils.text.phonemizers.gruut_wrapper import Gruut
-from TTS.tts.utils.text.phonemizers.ko_kr_phonemizer import KO_KR_Phonemizer
-from TTS.tts.utils.text.phonemizers.zh_cn_phonemizer import ZH_CN_Phonemizer
-
-try:
-    from TTS.tts.utils.text.phonemizers.ja_jp_phonemizer import JA_JP_Phonemizer
-except ImportError:
-    JA_JP_Phonemizer = None
-    pass
-
-PHONEMIZERS = {b.name(): b for b in (ESpeak, Gruut, KO_KR_Phonemizer, BN_Phonemizer)}
-
-
-ESPEAK_LANGS = list(ESpeak.supported_languages().keys())
-GRUUT_LANGS = list(Gruut.supported_languages())
-
-
-# Dict setting default phonemizers for each language
-# Add Gruut languages
-_ = [Gruut.name()] * len(GRUUT_LANGS)
-DEF_LANG_TO_PHONEMIZER = dict(list(zip(GRUUT_LANGS, _)))
-
-
-# Add ESpeak languages and override any existing ones
-_ = [ESpeak.name()] * len(ESPEAK_LANGS)
-_new_dict = dict(list(zip(list(ESPEAK_LANGS), _)))
-DEF_LANG_TO_PHONEMIZER.update(_new_dict)
-
-
-# Force default for some languages
-DEF_LANG_TO_PHONEMIZER["en"] = DEF_LANG_TO_PHONEMIZER["en-us"]
-DEF_LANG_TO_PHONEMIZER["zh-cn"] = ZH_CN_Phonemizer.name()
-DEF_LANG_TO_PHONEMIZER["ko-kr"] = KO_KR_Phonemizer.name()
-DEF_LANG_TO_PHONEMIZER["bn"] = BN_Phonemizer.name()
-DEF_LANG_TO_PHONEMIZER["be"] = BEL_Phonemizer.name()
+import importlib
 
+from TTS.tts.utils.text.phonemizers.base import BasePhonemizer
 
-# JA phonemizer has deal breaking dependencies like MeCab for some systems.
-# So we only have it when we have it.
-if JA_JP_Phonemizer is not None:
-    PHONEMIZERS[JA_JP_Phonemizer.name()] = JA_JP_Phonemizer
-    DEF_LANG_TO_PHONEMIZER["ja-jp"] = JA_JP_Phonemizer.name()
+# The phonemizers and the default phonemizer of each language are only imported on first use, so models that don't
+# use phonemes don't load gruut, pypinyin, jamo, MeCab or call espeak when they are imported.
+_PHONEMIZER_MODULES = {
+    "BN_Phonemizer": "bangla_phonemizer",
+    "BEL_Phonemizer": "belarusian_phonemizer",
+    "ESpeak": "espeak_wrapper",
+    "Gruut": "gruut_wrapper",
+    "KO_KR_Phonemizer": "ko_kr_phonemizer",
+    "ZH_CN_Phonemizer": "zh_cn_phonemizer",
+    "JA_JP_Phonemizer": "ja_jp_phonemizer",
+}
+
+
+def _import_phonemizer(class_name: str):
+    module = importlib.import_module(f"{__name__}.{_PHONEMIZER_MODULES[class_name]}")
+    return getattr(module, class_name)
+
+
+def _import_ja_jp_phonemizer():
+    try:
+        return _import_phonemizer("JA_JP_Phonemizer")
+    except ImportError:
+        return None
+
+
+def _default_phonemizers() -> dict:
+    ESpeak, Gruut = _import_phonemizer("ESpeak"), _import_phonemizer("Gruut")
+    KO_KR_Phonemizer, BN_Phonemizer = _import_phonemizer("KO_KR_Phonemizer"), _import_phonemizer("BN_Phonemizer")
+    JA_JP_Phonemizer = _import_ja_jp_phonemizer()
+
+    PHONEMIZERS = {b.name(): b for b in (ESpeak, Gruut, KO_KR_Phonemizer, BN_Phonemizer)}
+
+    ESPEAK_LANGS = list(ESpeak.supported_languages().keys())
+    GRUUT_LANGS = list(Gruut.supported_languages())
+
+    # Dict setting default phonemizers for each language
+    # Add Gruut languages
+    _ = [Gruut.name()] * len(GRUUT_LANGS)
+    DEF_LANG_TO_PHONEMIZER = dict(list(zip(GRUUT_LANGS, _)))
+
+    # Add ESpeak languages and override any existing ones
+    _ = [ESpeak.name()] * len(ESPEAK_LANGS)
+    _new_dict = dict(list(zip(list(ESPEAK_LANGS), _)))
+    DEF_LANG_TO_PHONEMIZER.update(_new_dict)
+
+    # Force default for some languages
+    DEF_LANG_TO_PHONEMIZER["en"] = DEF_LANG_TO_PHONEMIZER["en-us"]
+    DEF_LANG_TO_PHONEMIZER["zh-cn"] = _import_phonemizer("ZH_CN_Phonemizer").name()
+    DEF_LANG_TO_PHONEMIZER["ko-kr"] = KO_KR_Phonemizer.name()
+    DEF_LANG_TO_PHONEMIZER["bn"] = BN_Phonemizer.name()
+    DEF_LANG_TO_PHONEMIZER["be"] = _import_phonemizer("BEL_Phonemizer").name()
+
+    # JA phonemizer has deal breaking dependencies like MeCab for some systems.
+    # So we only have it when we have it.
+    if JA_JP_Phonemizer is not None:
+        PHONEMIZERS[JA_JP_Phonemizer.name()] = JA_JP_Phonemizer
+        DEF_LANG_TO_PHONEMIZER["ja-jp"] = JA_JP_Phonemizer.name()
+
+    return {
+        "PHONEMIZERS": PHONEMIZERS,
+        "ESPEAK_LANGS": ESPEAK_LANGS,
+        "GRUUT_LANGS": GRUUT_LANGS,
+        "DEF_LANG_TO_PHONEMIZER": DEF_LANG_TO_PHONEMIZER,
+    }
+
+
+def __getattr__(name: str):
+    """Import the phonemizer classes and build the language defaults when they are first accessed."""
+    if name == "JA_JP_Phonemizer":
+        value = _import_ja_jp_phonemizer()
+    elif name in _PHONEMIZER_MODULES:
+        value = _import_phonemizer(name)
+    elif name in ("PHONEMIZERS", "ESPEAK_LANGS", "GRUUT_LANGS", "DEF_LANG_TO_PHONEMIZER"):
+        globals().update(_default_phonemizers())
+        return globals()[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
 def get_phonemizer_by_name(name: str, **kwargs) -> BasePhonemizer:
@@ -57,23 +94,24 @@ def get_phonemizer_by_name(name: str, **kwargs) -> BasePhonemizer:
             Extra keyword arguments that should be passed to the phonemizer.
     """
     if name == "espeak":
-        return ESpeak(**kwargs)
+        return _import_phonemizer("ESpeak")(**kwargs)
     if name == "gruut":
-        return Gruut(**kwargs)
+        return _import_phonemizer("Gruut")(**kwargs)
     if name == "zh_cn_phonemizer":
-        return ZH_CN_Phonemizer(**kwargs)
+        return _import_phonemizer("ZH_CN_Phonemizer")(**kwargs)
     if name == "ja_jp_phonemizer":
+        JA_JP_Phonemizer = _import_ja_jp_phonemizer()
         if JA_JP_Phonemizer is None:
             raise ValueError(" ❗ You need to install JA phonemizer dependencies. Try `pip install TTS[ja]`.")
         return JA_JP_Phonemizer(**kwargs)
     if name == "ko_kr_phonemizer":
-        return KO_KR_Phonemizer(**kwargs)
+        return _import_phonemizer("KO_KR_Phonemizer")(**kwargs)
     if name == "bn_phonemizer":
-        return BN_Phonemizer(**kwargs)
+        return _import_phonemizer("BN_Phonemizer")(**kwargs)
     if name == "be_phonemizer":
-        return BEL_Phonemizer(**kwargs)
+        return _import_phonemizer("BEL_Phonemizer")(**kwargs)
     raise ValueError(f"Phonemizer {name} not found")
 
 
 if __name__ == "__main__":
-    print(DEF_LANG_TO_PHONEMIZER)
+    print(__getattr__("DEF_LANG_TO_PHONEMIZER"))
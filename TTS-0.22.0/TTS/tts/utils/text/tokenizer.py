@@ -1,8 +1,8 @@
 from typing import Callable, Dict, List, Union
 
-from TTS.tts.utils.text import cleaners
+from TTS.tts.utils.text import cleaners, phonemizers
 from TTS.tts.utils.text.characters import Graphemes, IPAPhonemes
-from TTS.tts.utils.text.phonemizers import DEF_LANG_TO_PHONEMIZER, get_phonemizer_by_name
+from TTS.tts.utils.text.phonemizers import get_phonemizer_by_name
 from TTS.tts.utils.text.phonemizers.multi_phonemizer import MultiPhonemizer
 from TTS.utils.generic_utils import get_import_path, import_class
 
@@ -199,7 +199,7 @@ class TTSTokenizer:
                 else:
                     try:
                         phonemizer = get_phonemizer_by_name(
-                            DEF_LANG_TO_PHONEMIZER[config.phoneme_language], **phonemizer_kwargs
+                            phonemizers.DEF_LANG_TO_PHONEMIZER[config.phoneme_language], **phonemizer_kwargs
                         )
                         new_config.phonemizer = phonemizer.name()
                     except KeyError as e:
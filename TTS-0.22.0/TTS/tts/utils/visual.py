@@ -1,14 +1,23 @@
 import librosa
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
-from matplotlib.colors import LogNorm
 
-matplotlib.use("Agg")
+
+def import_pyplot():
+    """Import pyplot with the Agg backend. Figures are only drawn for training logs and notebooks, so matplotlib is
+    imported on first use to keep it out of the inference startup time."""
+    import matplotlib  # pylint: disable=import-outside-toplevel
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+    return plt
 
 
 def plot_alignment(alignment, info=None, fig_size=(16, 10), title=None, output_fig=False, plot_log=False):
+    plt = import_pyplot()
+    from matplotlib.colors import LogNorm  # pylint: disable=import-outside-toplevel
+
     if isinstance(alignment, torch.Tensor):
         alignment_ = alignment.detach().cpu().numpy().squeeze()
     else:
@@ -34,6 +43,7 @@ def plot_alignment(alignment, info=None, fig_size=(16, 10), title=None, output_f
 
 
 def plot_spectrogram(spectrogram, ap=None, fig_size=(16, 10), output_fig=False):
+    plt = import_pyplot()
     if isinstance(spectrogram, torch.Tensor):
         spectrogram_ = spectrogram.detach().cpu().numpy().squeeze().T
     else:
@@ -61,6 +71,7 @@ def plot_pitch(pitch, spectrogram, ap=None, fig_size=(30, 10), output_fig=False)
         pitch: :math:`(T,)`
         spec: :math:`(C, T)`
     """
+    plt = import_pyplot()
 
     if isinstance(spectrogram, torch.Tensor):
         spectrogram_ = spectrogram.detach().cpu().numpy().squeeze().T
@@ -100,6 +111,7 @@ def plot_avg_pitch(pitch, chars, fig_size=(30, 10), output_fig=False):
     Shapes:
         pitch: :math:`(T,)`
     """
+    plt = import_pyplot()
     old_fig_size = plt.rcParams["figure.figsize"]
     if fig_size is not None:
         plt.rcParams["figure.figsize"] = fig_size
@@ -133,6 +145,7 @@ def plot_avg_energy(energy, chars, fig_size=(30, 10), output_fig=False):
     Shapes:
         energy: :math:`(T,)`
     """
+    plt = import_pyplot()
     old_fig_size = plt.rcParams["figure.figsize"]
     if fig_size is not None:
         plt.rcParams["figure.figsize"] = fig_size
@@ -170,6 +183,7 @@ def visualize(
     output_fig=False,
 ):
     """Intended to be used in Notebooks."""
+    plt = import_pyplot()
 
     if decoder_output is not None:
         num_plot = 4
@@ -0,0 +1,323 @@
+import io
+import struct
+from dataclasses import dataclass
+from math import gcd
+from typing import List
+
+import numpy as np
+import scipy.signal
+import soundfile as sf
+
+
+@dataclass(frozen=True)
+class AudioFormat:
+    """Container and codec of an output format as named by libsndfile."""
+
+    container: str
+    subtype: str
+    media_type: str
+    extension: str
+    sample_rates: tuple = None  # None means any sample rate is accepted
+    default_bitrate: int = None  # kbps, None leaves it to the codec
+
+
+AUDIO_FORMATS = {
+    "wav": AudioFormat("WAV", "PCM_16", "audio/wav", "wav"),
+    "pcm": AudioFormat("RAW", "PCM_16", "audio/L16", "pcm"),
+    "flac": AudioFormat("FLAC", "PCM_16", "audio/flac", "flac"),
+    "mp3": AudioFormat(
+        "MP3",
+        "MPEG_LAYER_III",
+        "audio/mpeg",
+        "mp3",
+        (8000, 11025, 12000, 16000, 22050, 24000, 32000, 44100, 48000),
+        default_bitrate=64,
+    ),
+    "ogg": AudioFormat("OGG", "VORBIS", "audio/ogg", "ogg"),
+    "opus": AudioFormat("OGG", "OPUS", "audio/ogg; codecs=opus", "opus", (8000, 12000, 16000, 24000, 48000)),
+}
+
+
+def resample(wav: np.ndarray, sample_rate: int, output_sample_rate: int) -> np.ndarray:
+    """Polyphase resampling of a whole waveform, see `StreamingResampler` for a waveform given in chunks."""
+    if sample_rate == output_sample_rate:
+        return wav
+    factor = gcd(sample_rate, output_sample_rate)
+    return scipy.signal.resample_poly(wav, output_sample_rate // factor, sample_rate // factor).astype(np.float32)
+
+
+class StreamingResampler:
+    """Polyphase resampling of a waveform given in chunks.
+
+    Resampling each chunk on its own filters it as if it were surrounded by silence, which clicks at the chunk
+    boundaries. This keeps the last input samples between calls instead, so the chunks joined together are the same
+    as `resample` on the whole waveform. The output lags the input by half the filter length, `flush` returns the
+    rest at the end of the stream.
+
+    Args:
+        sample_rate (int): sample rate of the input chunks.
+        output_sample_rate (int): sample rate of the output.
+    """
+
+    def __init__(self, sample_rate: int, output_sample_rate: int):
+        factor = gcd(sample_rate, output_sample_rate)
+        self.up = output_sample_rate // factor
+        self.down = sample_rate // factor
+        if self.up == self.down:
+            return
+        # same filter as `scipy.signal.resample_poly`
+        max_rate = max(self.up, self.down)
+        half_len = 10 * max_rate
+        taps = scipy.signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)) * self.up
+        self._delay = half_len
+        # polyphase components: output sample `n` is the dot product of `phases[p]` with `x[i], x[i - 1], ...`
+        # where `i, p = divmod(n * down + delay, up)`
+        self._num_taps = -(-len(taps) // self.up)
+        padded = np.zeros(self._num_taps * self.up, dtype=np.float64)
+        padded[: len(taps)] = taps
+        self._phases = padded.reshape(self._num_taps, self.up).T
+        # input samples from index `_start`, starting with the zeros before the waveform
+        self._history = np.zeros(self._num_taps - 1, dtype=np.float64)
+        self._start = -(self._num_taps - 1)
+        self._num_in = 0
+        self._num_out = 0
+
+    def _resample(self, last_output: int) -> np.ndarray:
+        outputs = np.arange(self._num_out, last_output)
+        if len(outputs) == 0:
+            return np.zeros(0, dtype=np.float32)
+        positions = outputs * self.down + self._delay
+        inputs = positions // self.up - self._start
+        samples = self._history[inputs[:, None] - np.arange(self._num_taps)[None, :]]
+        wav = np.sum(samples * self._phases[positions % self.up], axis=1)
+        self._num_out = last_output
+        # keep the samples the next outputs still need
+        first_needed = (self._num_out * self.down + self._delay) // self.up - (self._num_taps - 1)
+        drop = max(0, first_needed - self._start)
+        self._history = self._history[drop:]
+        self._start += drop
+        return wav.astype(np.float32)
+
+    def resample(self, wav: np.ndarray) -> np.ndarray:
+        """Resample a chunk, returning the output samples that no later input changes."""
+        if self.up == self.down:
+            return np.asarray(wav, dtype=np.float32)
+        self._history = np.concatenate([self._history, np.asarray(wav, dtype=np.float64)])
+        self._num_in += len(wav)
+        # outputs whose filter window ends at the last input sample
+        ready = (self._num_in - 1) * self.up - self._delay
+        return self._resample(max(self._num_out, ready // self.down + 1) if ready >= 0 else self._num_out)
+
+    def flush(self) -> np.ndarray:
+        """Return the output samples held back for the filter, as if the waveform ended with silence."""
+        if self.up == self.down:
+            return np.zeros(0, dtype=np.float32)
+        self._history = np.concatenate([self._history, np.zeros(self._num_taps, dtype=np.float64)])
+        return self._resample(-(-self._num_in * self.up // self.down))
+
+
+def wav_stream_header(sample_rate: int, channels: int = 1, bits_per_sample: int = 16) -> bytes:
+    """WAV header for a stream of unknown length. The RIFF and data sizes are set to the maximum value,
+    which players accept for streaming."""
+    byte_rate = sample_rate * channels * bits_per_sample // 8
+    block_align = channels * bits_per_sample // 8
+    return (
+        b"RIFF"
+        + struct.pack("<I", 0xFFFFFFFF)
+        + b"WAVE"
+        + b"fmt "
+        + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, byte_rate, block_align, bits_per_sample)
+        + b"data"
+        + struct.pack("<I", 0xFFFFFFFF)
+    )
+
+
+def _mp3_bitrate_range(sample_rate: int):
+    # MPEG-1, MPEG-2 and MPEG-2.5 layer III allow different bitrates (kbps)
+    if sample_rate >= 32000:
+        return 32, 320
+    if sample_rate >= 16000:
+        return 8, 160
+    return 8, 64
+
+
+def _compression_level(audio_format: AudioFormat, sample_rate: int, bitrate: int):
+    """Map a target bitrate in kbps to libsndfile's compression level.
+
+    libsndfile only exposes a compression level in [0, 1]. For Opus it scales the bitrate linearly from
+    256 kbps down to 6 kbps and for constant bitrate MP3 over the bitrates the MPEG version allows.
+    """
+    if audio_format.subtype == "OPUS":
+        low, high = 6, 256
+    elif audio_format.subtype == "MPEG_LAYER_III":
+        low, high = _mp3_bitrate_range(sample_rate)
+    else:
+        raise ValueError(f" [!] Bitrate is not supported for {audio_format.extension} output.")
+    return float(np.clip((high - bitrate) / (high - low), 0.0, 0.99))
+
+
+def output_sample_rate_for(audio_format: AudioFormat, sample_rate: int) -> int:
+    """`sample_rate` if the codec supports it, otherwise the closest higher rate it supports."""
+    supported = audio_format.sample_rates
+    if supported is None or sample_rate in supported:
+        return sample_rate
+    higher = [rate for rate in supported if rate >= sample_rate]
+    return higher[0] if higher else supported[-1]
+
+
+def _open_sound_file(file, audio_format: AudioFormat, sample_rate: int, bitrate: int = None) -> sf.SoundFile:
+    kwargs = {}
+    bitrate = bitrate or audio_format.default_bitrate
+    if bitrate is not None:
+        kwargs["compression_level"] = _compression_level(audio_format, sample_rate, bitrate)
+    if audio_format.subtype == "MPEG_LAYER_III":
+        # a VBR stream needs its Xing header patched once the length is known, which a stream can't do
+        kwargs["bitrate_mode"] = "CONSTANT"
+    return sf.SoundFile(
+        file,
+        "w",
+        samplerate=sample_rate,
+        channels=1,
+        format=audio_format.container,
+        subtype=audio_format.subtype,
+        **kwargs,
+    )
+
+
+class _StreamSink:
+    """Write-only file object that hands out the encoded bytes as soon as they are written.
+
+    Encoders that seek back to patch a header on close (e.g. FLAC stream info) can only patch bytes that were
+    not sent yet, later patches are dropped. This is allowed by the formats offered here.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._base = 0  # stream offset of the first byte in the buffer
+        self._pos = 0
+        self._end = 0
+
+    def write(self, data):
+        data = bytes(data)
+        size = len(data)
+        start = self._pos - self._base
+        if start < 0:
+            data = data[-start:]
+            start = 0
+        if data:
+            if start > len(self._buffer):
+                self._buffer.extend(b"\x00" * (start - len(self._buffer)))
+            self._buffer[start : start + len(data)] = data
+        self._pos += size
+        self._end = max(self._end, self._pos)
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._end
+        self._pos = offset
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def read(self, size=-1):  # pylint: disable=unused-argument
+        return b""
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._base += len(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class StreamingAudioEncoder:
+    """Encode waveform chunks incrementally into a compressed audio stream.
+
+    Every call to `encode` returns the bytes that are ready to be sent, so the first bytes reach the client while
+    the rest of the text is still being synthesized. `finish` flushes the encoder and returns the remaining bytes.
+
+    Args:
+        audio_format (str): one of `AUDIO_FORMATS`: "wav", "pcm", "flac", "mp3", "ogg" or "opus". Defaults to "wav".
+        sample_rate (int): sample rate of the waveforms passed to `encode`. Defaults to 22050.
+        output_sample_rate (int, optional): sample rate of the encoded audio. Defaults to the input sample rate or,
+            when the codec doesn't support it, the closest higher rate it supports.
+        bitrate (int, optional): target bitrate in kbps for "mp3" and "opus". Defaults to the codec default.
+
+    Example:
+        >>> encoder = StreamingAudioEncoder("opus", 22050, bitrate=24)
+        >>> for sentence_wav in sentence_wavs:
+        ...     send(encoder.encode(sentence_wav))
+        >>> send(encoder.finish())
+    """
+
+    def __init__(
+        self, audio_format: str = "wav", sample_rate: int = 22050, output_sample_rate: int = None, bitrate: int = None
+    ):
+        if audio_format not in AUDIO_FORMATS:
+            raise ValueError(f" [!] Unsupported audio format: {audio_format}. Use one of {list(AUDIO_FORMATS)}.")
+        self.format = AUDIO_FORMATS[audio_format]
+        if bitrate is not None and self.format.subtype not in ("OPUS", "MPEG_LAYER_III"):
+            raise ValueError(f" [!] Bitrate is not supported for {audio_format} output.")
+        self.sample_rate = sample_rate
+        self.output_sample_rate = output_sample_rate_for(self.format, output_sample_rate or sample_rate)
+        self.bitrate = bitrate
+        self._resampler = StreamingResampler(sample_rate, self.output_sample_rate)
+        self._sink = _StreamSink()
+        self._header = b""
+        stream_format = self.format
+        if self.format.container == "WAV":
+            # libsndfile only writes the final sizes on close, so stream a header that doesn't need them
+            self._header = wav_stream_header(self.output_sample_rate)
+            stream_format = AUDIO_FORMATS["pcm"]
+        self._file = _open_sound_file(self._sink, stream_format, self.output_sample_rate, bitrate)
+
+    @property
+    def media_type(self) -> str:
+        if self.format.container == "RAW":
+            return f"audio/L16; rate={self.output_sample_rate}; channels=1"
+        return self.format.media_type
+
+    def encode(self, wav: List[float]) -> bytes:
+        """Encode a chunk of float samples in [-1, 1] and return the bytes that are ready."""
+        wav = np.clip(np.asarray(wav, dtype=np.float32).reshape(-1), -1.0, 1.0)
+        self._file.write(self._resampler.resample(wav))
+        header, self._header = self._header, b""
+        return header + self._sink.drain()
+
+    def finish(self) -> bytes:
+        """Flush the encoder and return the last bytes of the stream."""
+        self._file.write(self._resampler.flush())
+        self._file.close()
+        header, self._header = self._header, b""
+        return header + self._sink.drain()
+
+
+def encode_audio(
+    wav: List[float], sample_rate: int, audio_format: str = "wav", output_sample_rate: int = None, bitrate: int = None
+) -> bytes:
+    """Encode a whole waveform in memory.
+
+    Unlike `StreamingAudioEncoder`, the file is complete: WAV and FLAC headers carry the final length.
+
+    Args:
+        wav (List[float]): float samples in [-1, 1].
+        sample_rate (int): sample rate of `wav`.
+        audio_format (str): one of `AUDIO_FORMATS`. Defaults to "wav".
+        output_sample_rate (int, optional): sample rate of the encoded audio. Defaults to `sample_rate`.
+        bitrate (int, optional): target bitrate in kbps for "mp3" and "opus".
+
+    Returns:
+        bytes: the encoded audio.
+    """
+    if audio_format not in AUDIO_FORMATS:
+        raise ValueError(f" [!] Unsupported audio format: {audio_format}. Use one of {list(AUDIO_FORMATS)}.")
+    fmt = AUDIO_FORMATS[audio_format]
+    output_sample_rate = output_sample_rate_for(fmt, output_sample_rate or sample_rate)
+    wav = np.clip(np.asarray(wav, dtype=np.float32).reshape(-1), -1.0, 1.0)
+    buffer = io.BytesIO()
+    with _open_sound_file(buffer, fmt, output_sample_rate, bitrate) as f:
+        f.write(resample(wav, sample_rate, output_sample_rate))
+    return buffer.getvalue()
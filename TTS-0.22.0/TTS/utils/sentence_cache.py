@@ -0,0 +1,71 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class SentenceCache:
+    """In-memory LRU cache of synthesized sentence waveforms.
+
+    `Synthesizer.tts` looks up every sentence returned by `split_into_sentences` and only synthesizes the misses,
+    so re-synthesizing an edited paragraph costs only the sentences that changed.
+
+    Args:
+        max_entries (int): maximum number of sentences to keep. Defaults to 256.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._wavs = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text: str, speaker_id=None, d_vector=None, language_id=None, settings: dict = None) -> str:
+        """Hash of everything that changes the waveform of a sentence.
+
+        Args:
+            text (str): sentence text.
+            speaker_id (int, optional): speaker id for multi-speaker models. Defaults to None.
+            d_vector (np.ndarray, optional): speaker embedding for multi-speaker models. Defaults to None.
+            language_id (int, optional): language id for multi-lingual models. Defaults to None.
+            settings (dict, optional): inference settings such as noise and length scales. Defaults to None.
+
+        Returns:
+            str: hex digest used as the cache key.
+        """
+        digest = hashlib.sha256()
+        digest.update(text.strip().encode("utf-8"))
+        digest.update(repr((speaker_id, language_id, sorted((settings or {}).items()))).encode("utf-8"))
+        if d_vector is not None:
+            digest.update(np.asarray(d_vector, dtype=np.float32).tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        """Return the cached waveform or None."""
+        with self._lock:
+            wav = self._wavs.get(key)
+            if wav is None:
+                self.misses += 1
+                return None
+            self._wavs.move_to_end(key)
+            self.hits += 1
+            return wav
+
+    def put(self, key: str, wav):
+        """Store a waveform, evicting the least recently used sentences if the cache is full."""
+        wav = np.array(wav, dtype=np.float32)
+        with self._lock:
+            self._wavs[key] = wav
+            self._wavs.move_to_end(key)
+            while len(self._wavs) > self.max_entries:
+                self._wavs.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._wavs.clear()
+
+    def __len__(self):
+        return len(self._wavs)
@@ -0,0 +1,111 @@
+import copy
+import queue
+import threading
+from contextlib import contextmanager
+
+import torch
+
+from TTS.utils.synthesizer import Synthesizer
+
+
+class PoolBusyError(RuntimeError):
+    """Raised when a request can't be queued or no replica became free in time."""
+
+
+def replicate(synthesizer: Synthesizer) -> Synthesizer:
+    """Copy a `Synthesizer` that shares the model weights with the original.
+
+    Parameters and buffers are not copied, only the module objects around them, so every replica has its own
+    per-call state (hooks, cached tensors, weight-norm weights) while the weights are in memory once. The weights
+    must be treated as read-only, which is the case for inference.
+
+    Args:
+        synthesizer (Synthesizer): loaded synthesizer to replicate.
+
+    Returns:
+        Synthesizer: a replica that can run concurrently with the original.
+    """
+    # the sentence cache is thread-safe, all replicas reuse each other's sentences
+    memo = {id(synthesizer.sentence_cache): synthesizer.sentence_cache}
+    for model in (synthesizer.tts_model, synthesizer.vocoder_model):
+        if model is None:
+            continue
+        for tensor in list(model.parameters()) + list(model.buffers()):
+            memo[id(tensor)] = tensor
+        # tensors kept as plain attributes, e.g. the weights computed by weight norm, are recomputed per call
+        for module in model.modules():
+            for value in module.__dict__.values():
+                if isinstance(value, torch.Tensor):
+                    memo[id(value)] = value
+    return copy.deepcopy(synthesizer, memo)
+
+
+class SynthesizerPool:
+    """Bounded pool of `Synthesizer` replicas for serving concurrent requests.
+
+    A request takes an idle replica for the duration of its synthesis. Requests wait while all replicas are busy,
+    and at most `max_queue_size` of them may wait at once: once the queue is full, or a request waited `timeout`
+    seconds, `PoolBusyError` is raised so the server can answer 503 instead of piling up work.
+
+    Args:
+        synthesizer (Synthesizer): loaded synthesizer, used as the first replica.
+        num_replicas (int): number of requests synthesized in parallel. Defaults to 1.
+        max_queue_size (int): number of requests allowed to wait for a replica. Defaults to 16.
+        timeout (float): seconds a request waits for a replica. Defaults to 60.
+    """
+
+    def __init__(self, synthesizer: Synthesizer, num_replicas: int = 1, max_queue_size: int = 16, timeout: float = 60):
+        self.num_replicas = max(1, num_replicas)
+        self.max_queue_size = max(0, max_queue_size)
+        self.timeout = timeout
+        self.replicas = [synthesizer] + [replicate(synthesizer) for _ in range(self.num_replicas - 1)]
+        self._idle = queue.LifoQueue()
+        for replica in self.replicas:
+            self._idle.put(replica)
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float = None) -> Synthesizer:
+        """Take an idle replica, waiting for one if needed. Raises `PoolBusyError` on overflow or timeout."""
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            # fast path, no need to queue when a replica is idle
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._waiting >= self.max_queue_size:
+                raise PoolBusyError(
+                    f" [!] All {self.num_replicas} replicas are busy and {self._waiting} requests are queued."
+                )
+            self._waiting += 1
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty as e:
+            raise PoolBusyError(f" [!] No replica became free within {timeout} seconds.") from e
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def release(self, replica: Synthesizer):
+        """Give a replica taken with `acquire` back to the pool."""
+        self._idle.put(replica)
+
+    @contextmanager
+    def replica(self, timeout: float = None):
+        """Hold a replica for the duration of a `with` block."""
+        replica = self.acquire(timeout)
+        try:
+            yield replica
+        finally:
+            self.release(replica)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "replicas": self.num_replicas,
+                "idle": self._idle.qsize(),
+                "queued": self._waiting,
+                "max_queue_size": self.max_queue_size,
+            }
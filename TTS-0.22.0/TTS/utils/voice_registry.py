@@ -0,0 +1,325 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from typing import Dict, List, Tuple
+
+import torch
+
+from TTS.utils.synthesizer import Synthesizer
+from TTS.utils.synthesizer_pool import SynthesizerPool
+
+
+@dataclass
+class ModelEntry:
+    """Checkpoint files of a model listed in a voice manifest."""
+
+    name: str
+    model_path: str
+    config_path: str
+    speakers_file_path: str = None
+    languages_file_path: str = None
+    vocoder_path: str = None
+    vocoder_config_path: str = None
+
+
+@dataclass
+class Voice:
+    """A voice served by the registry: a model and, for multi-speaker or multi-lingual models, the speaker and
+    language to synthesize with. `locale` and `gender` are reported by the MaryTTS `/voices` route."""
+
+    name: str
+    model: str
+    speaker: str = None
+    language: str = None
+    locale: str = "en"
+    gender: str = "u"
+
+
+@dataclass
+class Lease:
+    """A replica taken from the pool of a voice's model, see `VoiceRegistry.acquire`."""
+
+    worker: Synthesizer
+    voice: Voice
+    speaker: str
+    language: str
+    model: "_ResidentModel"
+
+
+def model_size(synthesizer: Synthesizer) -> int:
+    """Bytes held by the parameters and buffers of a synthesizer's models. Replicas share them, so this is the
+    memory a loaded model costs whatever the number of workers."""
+    size = 0
+    for model in (synthesizer.tts_model, synthesizer.vocoder_model):
+        if model is None:
+            continue
+        for tensor in list(model.parameters()) + list(model.buffers()):
+            size += tensor.numel() * tensor.element_size()
+    return size
+
+
+class _ResidentModel:
+    def __init__(self, entry: ModelEntry, pool: SynthesizerPool, pinned: bool = False):
+        self.entry = entry
+        self.pool = pool
+        self.pinned = pinned
+        self.size = model_size(pool.replicas[0])
+        self.active = 0
+        self.last_used = time.monotonic()
+
+
+class VoiceRegistry:
+    """Serve several models from one process, each loaded on first use.
+
+    Requests name a voice, which maps to a model and a speaker. Every loaded model has its own `SynthesizerPool`.
+    When loading a model brings the weights over `memory_budget` bytes, the least recently used models that are
+    not serving a request are evicted. Models unused for `idle_timeout` seconds are evicted as well.
+
+    Args:
+        models (List[ModelEntry]): models that can be loaded.
+        voices (List[Voice]): voices served, each naming one of `models`.
+        default_voice (str, optional): voice used for requests naming an unknown voice. Defaults to the first voice.
+        memory_budget (int, optional): bytes of weights kept in memory. Defaults to no limit.
+        idle_timeout (float, optional): seconds after which an unused model is evicted. Defaults to never.
+        num_replicas (int): replicas per model, see `SynthesizerPool`. Defaults to 1.
+        max_queue_size (int): requests waiting per model, see `SynthesizerPool`. Defaults to 16.
+        queue_timeout (float): seconds a request waits for a replica. Defaults to 60.
+        use_cuda (bool): load the models on the GPU. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        models: List[ModelEntry],
+        voices: List[Voice],
+        default_voice: str = None,
+        memory_budget: int = None,
+        idle_timeout: float = None,
+        num_replicas: int = 1,
+        max_queue_size: int = 16,
+        queue_timeout: float = 60,
+        use_cuda: bool = False,
+    ):
+        self.models = {model.name: model for model in models}
+        self.voices = {voice.name: voice for voice in voices}
+        for voice in voices:
+            if voice.model not in self.models:
+                raise ValueError(f" [!] Voice {voice.name} uses an unknown model: {voice.model}")
+        if not self.voices:
+            raise ValueError(" [!] No voice to serve.")
+        self.default_voice = default_voice or voices[0].name
+        if self.default_voice not in self.voices:
+            raise ValueError(f" [!] Unknown default voice: {self.default_voice}")
+        self.memory_budget = memory_budget
+        self.idle_timeout = idle_timeout
+        self.pool_args = (num_replicas, max_queue_size, queue_timeout)
+        self.use_cuda = use_cuda
+        self._resident = {}
+        self._lock = threading.Lock()
+        self._loading_locks = {}
+        self._sweeper = None
+        self._closed = threading.Event()
+
+    @classmethod
+    def from_manifest(cls, manifest_path: str, **kwargs) -> "VoiceRegistry":
+        """Read the models and voices from a JSON manifest.
+
+        Relative paths are resolved from the manifest folder. Without a `voices` section, every model is served as
+        a voice of the same name.
+
+        Example:
+            {
+                "default_voice": "dinithi",
+                "models": {
+                    "LJ_Dinithi": {"model_path": "LJ_Dinithi/best_model.pth", "config_path": "LJ_Dinithi/config.json"},
+                    "LJ_BaseModel_Oshadi": {"model_path": "...", "config_path": "..."}
+                },
+                "voices": {
+                    "dinithi": {"model": "LJ_Dinithi", "locale": "si", "gender": "female"},
+                    "oshadi": {"model": "LJ_BaseModel_Oshadi", "locale": "si", "gender": "female"}
+                }
+            }
+        """
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        root = os.path.dirname(os.path.abspath(manifest_path))
+        path_fields = [field.name for field in fields(ModelEntry) if field.name.endswith("_path")]
+
+        models = []
+        for name, entry in manifest.get("models", {}).items():
+            entry = dict(entry)
+            for key in path_fields:
+                if entry.get(key):
+                    entry[key] = os.path.join(root, os.path.expanduser(entry[key]))
+            models.append(ModelEntry(name=name, **entry))
+        voices = [Voice(name=name, **voice) for name, voice in manifest.get("voices", {}).items()]
+        if not voices:
+            voices = [Voice(name=model.name, model=model.name) for model in models]
+        kwargs.setdefault("default_voice", manifest.get("default_voice"))
+        return cls(models, voices, **kwargs)
+
+    @classmethod
+    def from_synthesizer(cls, synthesizer: Synthesizer, voice: Voice, **kwargs) -> "VoiceRegistry":
+        """Serve a single loaded synthesizer, which is never evicted."""
+        kwargs.pop("use_cuda", None)
+        entry = ModelEntry(voice.model, synthesizer.tts_checkpoint, synthesizer.tts_config_path)
+        registry = cls([entry], [voice], **kwargs)
+        registry._resident[entry.name] = _ResidentModel(
+            entry, SynthesizerPool(synthesizer, *registry.pool_args), pinned=True
+        )
+        return registry
+
+    def resolve(self, name: str = None) -> Voice:
+        """The voice called `name`, or the default voice."""
+        return self.voices.get(name) or self.voices[self.default_voice]
+
+    def acquire(self, name: str = None, language: str = None, timeout: float = None) -> Lease:
+        """Take a replica of the model serving a voice, loading the model if needed.
+
+        A name that isn't a voice selects the default voice and, when its model has a speaker of that name, that
+        speaker. This keeps the `speaker_id` of single model servers working.
+
+        Raises:
+            PoolBusyError: if the model's replicas are busy and its queue is full.
+        """
+        voice = self.resolve(name)
+        self.evict_idle()
+        model = self._get(voice.model)
+        try:
+            worker = model.pool.acquire(timeout)
+        except Exception:
+            with self._lock:
+                model.active -= 1
+            raise
+        speaker = voice.speaker
+        if name and name != voice.name:
+            speaker_manager = getattr(worker.tts_model, "speaker_manager", None)
+            if speaker_manager is not None and name in (speaker_manager.name_to_id or {}):
+                speaker = name
+        return Lease(worker, voice, speaker, language or voice.language, model)
+
+    def release(self, lease: Lease):
+        """Give a replica taken with `acquire` back."""
+        lease.model.pool.release(lease.worker)
+        with self._lock:
+            lease.model.active -= 1
+            lease.model.last_used = time.monotonic()
+
+    @contextmanager
+    def lease(self, name: str = None, language: str = None, timeout: float = None):
+        """Hold a replica of a voice's model for the duration of a `with` block."""
+        lease = self.acquire(name, language, timeout)
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+
+    def _get(self, name: str) -> _ResidentModel:
+        """Resident model called `name`, marked as active so it isn't evicted before the caller releases it."""
+        with self._lock:
+            if name in self._resident:
+                model = self._resident[name]
+                model.active += 1
+                return model
+            loading_lock = self._loading_locks.setdefault(name, threading.Lock())
+
+        # load outside the registry lock so the other models keep serving
+        with loading_lock:
+            with self._lock:
+                if name in self._resident:
+                    model = self._resident[name]
+                    model.active += 1
+                    return model
+            try:
+                model = _ResidentModel(
+                    self.models[name], SynthesizerPool(self._load(self.models[name]), *self.pool_args)
+                )
+                with self._lock:
+                    model.active += 1
+                    self._resident[name] = model
+                    self._evict_over_budget()
+            finally:
+                # also after a failed load, so the lock of a model that can't be loaded isn't kept
+                with self._lock:
+                    self._loading_locks.pop(name, None)
+        return model
+
+    def _load(self, entry: ModelEntry) -> Synthesizer:
+        print(f" > Loading model {entry.name}")
+        return Synthesizer(
+            tts_checkpoint=entry.model_path,
+            tts_config_path=entry.config_path,
+            tts_speakers_file=entry.speakers_file_path,
+            tts_languages_file=entry.languages_file_path,
+            vocoder_checkpoint=entry.vocoder_path,
+            vocoder_config=entry.vocoder_config_path,
+            use_cuda=self.use_cuda,
+        )
+
+    def _evictable(self) -> List[Tuple[float, str]]:
+        # least recently used first
+        return sorted(
+            (model.last_used, name) for name, model in self._resident.items() if model.active == 0 and not model.pinned
+        )
+
+    def _evict(self, name: str):
+        del self._resident[name]
+        print(f" > Evicted model {name}")
+        if self.use_cuda:
+            torch.cuda.empty_cache()
+
+    def _evict_over_budget(self):
+        if self.memory_budget is None:
+            return
+        for _, name in self._evictable():
+            if self.resident_size() <= self.memory_budget:
+                return
+            self._evict(name)
+        if self.resident_size() > self.memory_budget:
+            print(f" > [!] Models in use take {self.resident_size()} bytes, over the budget of {self.memory_budget}.")
+
+    def evict_idle(self):
+        """Evict the models unused for `idle_timeout` seconds."""
+        if self.idle_timeout is None:
+            return
+        deadline = time.monotonic() - self.idle_timeout
+        with self._lock:
+            for last_used, name in self._evictable():
+                if last_used <= deadline:
+                    self._evict(name)
+
+    def start_sweeper(self, interval: float = None):
+        """Evict idle models from a background thread, so their memory is freed even when no request comes."""
+        if self.idle_timeout is None or self._sweeper is not None:
+            return
+        interval = interval or max(1.0, self.idle_timeout / 4)
+
+        def sweep():
+            while not self._closed.wait(interval):
+                self.evict_idle()
+
+        self._sweeper = threading.Thread(target=sweep, name="voice-registry-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def close(self):
+        self._closed.set()
+
+    def resident_size(self) -> int:
+        return sum(model.size for model in self._resident.values())
+
+    def resident_models(self) -> List[str]:
+        with self._lock:
+            return list(self._resident)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "memory_budget": self.memory_budget,
+                "resident_size": self.resident_size(),
+                "models": {
+                    name: {**model.pool.stats(), "size": model.size, "active": model.active, "pinned": model.pinned}
+                    for name, model in self._resident.items()
+                },
+            }
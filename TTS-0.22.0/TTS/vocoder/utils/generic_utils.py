@@ -2,9 +2,8 @@ from typing import Dict
 
 import numpy as np
 import torch
-from matplotlib import pyplot as plt
 
-from TTS.tts.utils.visual import plot_spectrogram
+from TTS.tts.utils.visual import import_pyplot, plot_spectrogram
 from TTS.utils.audio import AudioProcessor
 
 
@@ -53,6 +52,7 @@ def plot_results(y_hat: torch.tensor, y: torch.tensor, ap: AudioProcessor, name_
     spec_diff = np.abs(spec_fake - spec_real)
 
     # plot figure and save it
+    plt = import_pyplot()
     fig_wave = plt.figure()
     plt.subplot(2, 1, 1)
     plt.plot(y)
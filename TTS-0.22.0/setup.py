@@ -66,7 +66,9 @@ with open(os.path.join(cwd, "requirements.dev.txt"), "r") as f:
     requirements_dev = f.readlines()
 with open(os.path.join(cwd, "requirements.ja.txt"), "r") as f:
     requirements_ja = f.readlines()
-requirements_all = requirements_dev + requirements_notebooks + requirements_ja
+with open(os.path.join(cwd, "requirements.server.txt"), "r") as f:
+    requirements_server = f.readlines()
+requirements_all = requirements_dev + requirements_notebooks + requirements_ja + requirements_server
 
 with open("README.md", "r", encoding="utf-8") as readme_file:
     README = readme_file.read()
@@ -116,9 +118,16 @@ setup(
         "dev": requirements_dev,
         "notebooks": requirements_notebooks,
         "ja": requirements_ja,
+        "server": requirements_server,
     },
     python_requires=">=3.9.0, <3.12",
-    entry_points={"console_scripts": ["tts=TTS.bin.synthesize:main", "tts-server = TTS.server.server:main"]},
+    entry_points={
+        "console_scripts": [
+            "tts=TTS.bin.synthesize:main",
+            "tts-batch=TTS.bin.synthesize_batch:main",
+            "tts-server = TTS.server.server:main",
+        ]
+    },
     classifiers=[
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
@@ -56,3 +56,37 @@ def assertHasAttr(test_obj, obj, intendedAttr):
 def assertHasNotAttr(test_obj, obj, intendedAttr):
     testBool = hasattr(obj, intendedAttr)
     test_obj.assertFalse(testBool, msg=f"obj should not have an attribute. obj: {obj}, intendedAttr: {intendedAttr}")
+
+
+def get_tiny_vits_config(**model_args):
+    """Config of a VITS model small enough to train and synthesize with in the tests. `model_args` override its
+    `VitsArgs`."""
+    from TTS.tts.configs.vits_config import VitsConfig  # pylint: disable=import-outside-toplevel
+    from TTS.tts.models.vits import VitsArgs  # pylint: disable=import-outside-toplevel
+
+    args = {
+        "hidden_channels": 32,
+        "hidden_channels_ffn_text_encoder": 64,
+        "num_layers_text_encoder": 2,
+        "upsample_initial_channel_decoder": 32,
+        "num_layers_flow": 1,
+        "num_layers_posterior_encoder": 2,
+        "init_discriminator": False,
+        **model_args,
+    }
+    return VitsConfig(model_args=VitsArgs(**args), use_phonemes=False, text_cleaner="english_cleaners")
+
+
+def create_tiny_vits_model(output_path, steps=(1,), **model_args):
+    """Save `config.json` and a randomly initialized `checkpoint_<step>.pth` for each step of a tiny VITS model to
+    `output_path`. Each checkpoint has its own weights. Returns the config."""
+    from trainer.io import save_checkpoint  # pylint: disable=import-outside-toplevel
+
+    from TTS.tts.models.vits import Vits  # pylint: disable=import-outside-toplevel
+
+    config = get_tiny_vits_config(**model_args)
+    os.makedirs(output_path, exist_ok=True)
+    config.save_json(os.path.join(output_path, "config.json"))
+    for step in steps:
+        save_checkpoint(config, Vits.init_from_config(config), None, None, step, step, output_path)
+    return config
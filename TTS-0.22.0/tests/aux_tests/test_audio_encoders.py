@@ -0,0 +1,71 @@
+import io
+import unittest
+
+import numpy as np
+import soundfile as sf
+
+from TTS.utils.audio.encoders import StreamingAudioEncoder, StreamingResampler, encode_audio, resample
+
+SAMPLE_RATE = 22050
+
+
+class TestAudioEncoders(unittest.TestCase):
+    def setUp(self):
+        t = np.arange(SAMPLE_RATE * 2) / SAMPLE_RATE
+        self.wav = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+    def _stream(self, audio_format, **kwargs):
+        encoder = StreamingAudioEncoder(audio_format, SAMPLE_RATE, **kwargs)
+        chunks = [encoder.encode(self.wav[i : i + SAMPLE_RATE // 2]) for i in range(0, len(self.wav), SAMPLE_RATE // 2)]
+        chunks.append(encoder.finish())
+        return encoder, chunks
+
+    def test_streamed_wav_matches_pcm(self):
+        _, chunks = self._stream("wav")
+        self.assertTrue(chunks[0].startswith(b"RIFF"))
+        # every chunk carries the samples encoded so far
+        self.assertTrue(all(len(chunk) > 0 for chunk in chunks[:-1]))
+        wav, sample_rate = sf.read(io.BytesIO(encode_audio(self.wav, SAMPLE_RATE, "wav")), dtype="float32")
+        self.assertEqual(sample_rate, SAMPLE_RATE)
+        self.assertEqual(b"".join(chunks)[44:], (np.clip(wav, -1, 1) * 32767).round().astype("<i2").tobytes())
+
+    def test_compressed_formats(self):
+        wav_size = len(encode_audio(self.wav, SAMPLE_RATE, "wav"))
+        for audio_format in ["mp3", "ogg", "opus"]:
+            encoder, chunks = self._stream(audio_format)
+            data = b"".join(chunks)
+            self.assertLess(len(data), wav_size / 4)
+            decoded, sample_rate = sf.read(io.BytesIO(data))
+            self.assertEqual(sample_rate, encoder.output_sample_rate)
+            self.assertGreaterEqual(len(decoded), len(self.wav) * sample_rate / SAMPLE_RATE * 0.95)
+
+    def test_opus_sample_rate_and_bitrate(self):
+        encoder, low = self._stream("opus", bitrate=12)
+        # opus doesn't support 22.05 kHz, the next supported rate is used
+        self.assertEqual(encoder.output_sample_rate, 24000)
+        _, high = self._stream("opus", bitrate=64)
+        self.assertLess(len(b"".join(low)), len(b"".join(high)))
+
+    def test_streamed_resampling(self):
+        # the chunks are filtered together, so the stream has no clicks at their boundaries
+        resampler = StreamingResampler(SAMPLE_RATE, 16000)
+        chunks = [resampler.resample(self.wav[i : i + 1000]) for i in range(0, len(self.wav), 1000)]
+        chunks.append(resampler.flush())
+        np.testing.assert_allclose(np.concatenate(chunks), resample(self.wav, SAMPLE_RATE, 16000), atol=1e-6)
+
+        _, chunks = self._stream("pcm", output_sample_rate=16000)
+        pcm = encode_audio(self.wav, SAMPLE_RATE, "pcm", output_sample_rate=16000)
+        streamed = np.frombuffer(b"".join(chunks), dtype="<i2").astype(np.int32)
+        np.testing.assert_allclose(streamed, np.frombuffer(pcm, dtype="<i2"), atol=1)
+
+    def test_flac_resampled(self):
+        data = encode_audio(self.wav, SAMPLE_RATE, "flac", output_sample_rate=16000)
+        decoded, sample_rate = sf.read(io.BytesIO(data))
+        self.assertEqual(sample_rate, 16000)
+        self.assertEqual(len(decoded), 32000)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            StreamingAudioEncoder("aac", SAMPLE_RATE)
+        with self.assertRaises(ValueError):
+            StreamingAudioEncoder("flac", SAMPLE_RATE, bitrate=64)
@@ -1,12 +1,15 @@
+import importlib.util
 import os
+import shutil
 import unittest
 
+import numpy as np
 from trainer.io import save_checkpoint
 
-from tests import get_tests_input_path
+from tests import create_tiny_vits_model, get_tests_input_path, get_tests_output_path
 from TTS.config import load_config
 from TTS.tts.models import setup_model
-from TTS.utils.synthesizer import Synthesizer
+from TTS.utils.synthesizer import SENTENCE_SILENCE, Synthesizer
 
 
 class SynthesizerTest(unittest.TestCase):
@@ -26,6 +29,162 @@ class SynthesizerTest(unittest.TestCase):
         synthesizer = Synthesizer(tts_checkpoint, tts_config, None, None)
         synthesizer.tts("Better this test works!!")
 
+    def test_sentence_cache(self):
+        output_path = os.path.join(get_tests_output_path(), "sentence_cache")
+        create_tiny_vits_model(output_path)
+
+        synthesizer = Synthesizer(
+            os.path.join(output_path, "checkpoint_1.pth"),
+            os.path.join(output_path, "config.json"),
+            sentence_cache_size=8,
+        )
+        # make the synthesis deterministic so cached and fresh sentences can be compared
+        synthesizer.tts_model.inference_noise_scale = 0.0
+        synthesizer.tts_model.inference_noise_scale_dp = 0.0
+
+        wav = synthesizer.tts("This is the first sentence. This is the second one.")
+        self.assertEqual(len(synthesizer.sentence_cache), 2)
+        self.assertEqual(synthesizer.sentence_cache.hits, 0)
+
+        edited_wav = synthesizer.tts("This is the first sentence. This one was edited.")
+        self.assertEqual(len(synthesizer.sentence_cache), 3)
+        self.assertEqual(synthesizer.sentence_cache.hits, 1)
+
+        # the unchanged sentence is reused as is, followed by the usual silence
+        key = synthesizer.sentence_cache.make_key(
+            "This is the first sentence.", settings=synthesizer.inference_settings()
+        )
+        first_len = len(synthesizer.sentence_cache.get(key))
+        np.testing.assert_allclose(edited_wav[: first_len + SENTENCE_SILENCE], wav[: first_len + SENTENCE_SILENCE])
+        self.assertTrue(np.all(np.array(edited_wav[first_len : first_len + SENTENCE_SILENCE]) == 0))
+
+    def test_load_tts_checkpoint(self):
+        output_path = os.path.join(get_tests_output_path(), "load_tts_checkpoint")
+        # two checkpoints of the same model with different weights
+        create_tiny_vits_model(output_path, steps=(1, 2))
+        config_path = os.path.join(output_path, "config.json")
+
+        def synthesize(synthesizer):
+            synthesizer.tts_model.inference_noise_scale = 0.0
+            synthesizer.tts_model.inference_noise_scale_dp = 0.0
+            return np.array(synthesizer.tts("This is a test sentence."))
+
+        synthesizer = Synthesizer(os.path.join(output_path, "checkpoint_1.pth"), config_path, sentence_cache_size=4)
+        model = synthesizer.tts_model
+        first_wav = synthesize(synthesizer)
+        synthesizer.load_tts_checkpoint(os.path.join(output_path, "checkpoint_2.pth"))
+        self.assertIs(synthesizer.tts_model, model)
+        self.assertEqual(len(synthesizer.sentence_cache), 0)
+        wav = synthesize(synthesizer)
+        self.assertFalse(len(wav) == len(first_wav) and np.allclose(wav, first_wav))
+        np.testing.assert_allclose(
+            wav, synthesize(Synthesizer(os.path.join(output_path, "checkpoint_2.pth"), config_path)), atol=1e-5
+        )
+
+    def test_tts_stream(self):
+        output_path = os.path.join(get_tests_output_path(), "tts_stream")
+        create_tiny_vits_model(output_path)
+
+        synthesizer = Synthesizer(
+            os.path.join(output_path, "checkpoint_1.pth"), os.path.join(output_path, "config.json")
+        )
+        synthesizer.tts_model.inference_noise_scale = 0.0
+        synthesizer.tts_model.inference_noise_scale_dp = 0.0
+        # streamed sentences can't be trimmed
+        synthesizer.tts_config.audio["do_trim_silence"] = False
+
+        text = "This is a longer sentence, to get the audio in several chunks."
+        chunks = list(synthesizer.tts_stream(text, chunk_frames=16))
+        self.assertGreater(len(chunks), 2)
+        # the same audio as `tts()`, without the silence after the last sentence
+        np.testing.assert_allclose(
+            np.concatenate(chunks), np.array(synthesizer.tts(text))[:-SENTENCE_SILENCE], atol=1e-4
+        )
+
+        # sentences are separated by silence
+        chunks = list(synthesizer.tts_stream("A first sentence. And a second one.", chunk_frames=16))
+        self.assertEqual(sum(1 for chunk in chunks if len(chunk) == SENTENCE_SILENCE and not chunk.any()), 1)
+
+    def test_tts_batch(self):
+        output_path = os.path.join(get_tests_output_path(), "tts_batch")
+        create_tiny_vits_model(output_path)
+
+        synthesizer = Synthesizer(
+            os.path.join(output_path, "checkpoint_1.pth"), os.path.join(output_path, "config.json")
+        )
+        synthesizer.tts_model.inference_noise_scale = 0.0
+        synthesizer.tts_model.inference_noise_scale_dp = 0.0
+        synthesizer.tts_config.audio["do_trim_silence"] = False
+
+        self.assertEqual(Synthesizer._length_buckets([3, 9, 1, 7, 5], 2), [[1, 3], [4, 0], [2]])
+
+        texts = ["Short.", "This sentence is quite a bit longer than the others.", "A medium one.", "Tiny."]
+        wavs = synthesizer.tts_batch(texts, batch_size=2)
+        self.assertEqual(len(wavs), len(texts))
+        # the waveforms come back in the input order, the padding only leaks into the last frames
+        edge = 8 * synthesizer.tts_config.audio.hop_length
+        for text, wav in zip(texts, wavs):
+            single = synthesizer.tts_batch([text])[0]
+            self.assertEqual(single.shape, wav.shape)
+            np.testing.assert_allclose(wav[:-edge], single[:-edge], atol=1e-3)
+
+        with self.assertRaises(ValueError):
+            synthesizer.tts_batch(texts, speakers=["a", "b"])
+
+    @unittest.skipIf(importlib.util.find_spec("onnxruntime") is None, "onnxruntime is not installed")
+    def test_onnx_backend(self):
+        output_path = os.path.join(get_tests_output_path(), "onnx_backend")
+        create_tiny_vits_model(output_path)
+        config_path = os.path.join(output_path, "config.json")
+        checkpoint_path = os.path.join(output_path, "checkpoint_1.pth")
+        onnx_path = os.path.join(output_path, "checkpoint_1.onnx")
+        if os.path.exists(onnx_path):
+            os.remove(onnx_path)
+
+        def synthesize(synthesizer):
+            synthesizer.tts_model.inference_noise_scale = 0.0
+            synthesizer.tts_model.inference_noise_scale_dp = 0.0
+            return np.array(synthesizer.tts("This is the first sentence. And this is the second one."))
+
+        wav = synthesize(Synthesizer(checkpoint_path, config_path))
+        # the checkpoint is exported next to it on first use, the export is then loaded as is
+        onnx_wav = synthesize(Synthesizer(checkpoint_path, config_path, backend="onnx", onnx_intra_op_threads=1))
+        self.assertTrue(os.path.isfile(onnx_path))
+        np.testing.assert_allclose(onnx_wav, wav, atol=1e-3)
+        np.testing.assert_allclose(synthesize(Synthesizer(onnx_path, config_path, backend="onnx")), onnx_wav)
+
+        with self.assertRaises(ValueError):
+            Synthesizer(checkpoint_path, config_path, backend="tensorflow")
+
+    def test_torchscript_backend(self):
+        output_path = os.path.join(get_tests_output_path(), "torchscript_backend")
+        cache_dir = os.path.join(output_path, "cache")
+        shutil.rmtree(output_path, ignore_errors=True)
+        create_tiny_vits_model(output_path, steps=(1, 2))
+        config_path = os.path.join(output_path, "config.json")
+
+        def synthesize(synthesizer):
+            synthesizer.tts_model.inference_noise_scale = 0.0
+            synthesizer.tts_model.inference_noise_scale_dp = 0.0
+            return np.array(synthesizer.tts("This is the first sentence. And this is the second one."))
+
+        checkpoint_path = os.path.join(output_path, "checkpoint_1.pth")
+        wav = synthesize(Synthesizer(checkpoint_path, config_path))
+        synthesizer = Synthesizer(checkpoint_path, config_path, backend="torchscript", torchscript_cache_dir=cache_dir)
+        np.testing.assert_allclose(synthesize(synthesizer), wav, atol=1e-4)
+        self.assertEqual(list(synthesizer.warmup([8, 16], batch_size=2)), [8, 16])
+
+        # the traced module is reused for the same checkpoint and traced again for another one
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        Synthesizer(checkpoint_path, config_path, backend="torchscript", torchscript_cache_dir=cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        checkpoint_path = os.path.join(output_path, "checkpoint_2.pth")
+        synthesizer.load_tts_checkpoint(checkpoint_path)
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+        np.testing.assert_allclose(
+            synthesize(synthesizer), synthesize(Synthesizer(checkpoint_path, config_path)), atol=1e-4
+        )
+
     def test_split_into_sentences(self):
         """Check demo server sentences split as expected"""
         print("\n > Testing demo server sentence splitting")
@@ -0,0 +1,63 @@
+import os
+import threading
+import unittest
+
+import numpy as np
+
+from tests import create_tiny_vits_model, get_tests_output_path
+from TTS.utils.synthesizer import Synthesizer
+from TTS.utils.synthesizer_pool import PoolBusyError, SynthesizerPool, replicate
+
+
+class SynthesizerPoolTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        output_path = os.path.join(get_tests_output_path(), "synthesizer_pool")
+        create_tiny_vits_model(output_path)
+        cls.synthesizer = Synthesizer(
+            os.path.join(output_path, "checkpoint_1.pth"), os.path.join(output_path, "config.json")
+        )
+        # deterministic output so replicas can be compared
+        cls.synthesizer.tts_model.inference_noise_scale = 0.0
+        cls.synthesizer.tts_model.inference_noise_scale_dp = 0.0
+
+    def test_replicate_shares_weights(self):
+        replica = replicate(self.synthesizer)
+        self.assertIsNot(replica.tts_model, self.synthesizer.tts_model)
+        params = dict(self.synthesizer.tts_model.named_parameters())
+        for name, param in replica.tts_model.named_parameters():
+            self.assertEqual(param.data_ptr(), params[name].data_ptr())
+        text = "This is a test sentence."
+        np.testing.assert_allclose(replica.tts(text), self.synthesizer.tts(text), atol=1e-5)
+
+    def test_concurrent_requests(self):
+        pool = SynthesizerPool(self.synthesizer, num_replicas=2, max_queue_size=4)
+        self.assertEqual(len({id(replica) for replica in pool.replicas}), 2)
+        results = [None] * 4
+
+        def synthesize(idx):
+            with pool.replica() as worker:
+                results[idx] = worker.tts("Another test sentence.")
+
+        threads = [threading.Thread(target=synthesize, args=(idx,)) for idx in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for wav in results[1:]:
+            np.testing.assert_allclose(wav, results[0], atol=1e-5)
+        self.assertEqual(pool.stats()["idle"], 2)
+
+    def test_backpressure(self):
+        pool = SynthesizerPool(self.synthesizer, num_replicas=1, max_queue_size=0, timeout=0.1)
+        worker = pool.acquire()
+        # the only replica is busy and no request may queue
+        with self.assertRaises(PoolBusyError):
+            pool.acquire()
+        pool.max_queue_size = 1
+        # queued, but the replica isn't released in time
+        with self.assertRaises(PoolBusyError):
+            pool.acquire()
+        pool.release(worker)
+        with pool.replica() as replica:
+            self.assertIs(replica, worker)
@@ -0,0 +1,82 @@
+import json
+import os
+import time
+import unittest
+from unittest import mock
+
+from tests import create_tiny_vits_model, get_tests_output_path
+from TTS.utils.synthesizer_pool import PoolBusyError
+from TTS.utils.voice_registry import VoiceRegistry
+
+
+class VoiceRegistryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_path = os.path.join(get_tests_output_path(), "voice_registry")
+        create_tiny_vits_model(cls.output_path)
+        model = {"model_path": "checkpoint_1.pth", "config_path": "config.json"}
+        cls.manifest_path = os.path.join(cls.output_path, "voices.json")
+        with open(cls.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "default_voice": "first",
+                    "models": {"model_a": model, "model_b": model},
+                    "voices": {
+                        "first": {"model": "model_a", "locale": "si", "gender": "female"},
+                        "second": {"model": "model_b", "locale": "si", "gender": "male"},
+                    },
+                },
+                f,
+            )
+
+    def test_lazy_load_and_routing(self):
+        registry = VoiceRegistry.from_manifest(self.manifest_path)
+        self.assertEqual(registry.models["model_a"].model_path, os.path.join(self.output_path, "checkpoint_1.pth"))
+        self.assertEqual(registry.resident_models(), [])
+        with registry.lease("second") as lease:
+            self.assertEqual(lease.voice.name, "second")
+            self.assertGreater(len(lease.worker.tts("A test sentence.")), 0)
+        # unknown voices fall back to the default voice
+        with registry.lease("nobody") as lease:
+            self.assertEqual(lease.voice.name, "first")
+            self.assertIsNone(lease.speaker)
+        self.assertEqual(sorted(registry.resident_models()), ["model_a", "model_b"])
+
+    def test_memory_budget(self):
+        registry = VoiceRegistry.from_manifest(self.manifest_path)
+        with registry.lease("first") as lease:
+            size = lease.model.size
+        # room for a single model, the least recently used one is evicted
+        registry.memory_budget = size
+        lease = registry.acquire("second")
+        self.assertEqual(registry.resident_models(), ["model_b"])
+        # a model serving a request is kept even over the budget
+        with registry.lease("first"):
+            self.assertEqual(sorted(registry.resident_models()), ["model_a", "model_b"])
+        registry.release(lease)
+        self.assertEqual(registry.stats()["models"]["model_a"]["active"], 0)
+
+    def test_idle_timeout(self):
+        registry = VoiceRegistry.from_manifest(self.manifest_path, idle_timeout=0.1, num_replicas=1, max_queue_size=0)
+        with registry.lease("first"):
+            pass
+        time.sleep(0.2)
+        registry.evict_idle()
+        self.assertEqual(registry.resident_models(), [])
+        lease = registry.acquire("first", timeout=0.1)
+        with self.assertRaises(PoolBusyError):
+            registry.acquire("first", timeout=0.1)
+        # a failed acquire doesn't keep the model active
+        self.assertEqual(registry.stats()["models"]["model_a"]["active"], 1)
+        registry.release(lease)
+
+    def test_failed_load(self):
+        # pylint: disable=protected-access
+        registry = VoiceRegistry.from_manifest(self.manifest_path)
+        with mock.patch.object(registry, "_load", side_effect=FileNotFoundError):
+            with self.assertRaises(FileNotFoundError):
+                registry.acquire("first")
+        # the model can be loaded again by the next request
+        self.assertEqual(registry._loading_locks, {})
+        with registry.lease("first") as lease:
+            self.assertEqual(lease.voice.name, "first")
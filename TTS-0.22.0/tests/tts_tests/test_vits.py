@@ -1,11 +1,20 @@
 import copy
+import importlib.util
 import os
 import unittest
 
+import numpy as np
 import torch
 from trainer.logging.tensorboard_logger import TensorboardLogger
 
-from tests import assertHasAttr, assertHasNotAttr, get_tests_data_path, get_tests_input_path, get_tests_output_path
+from tests import (
+    assertHasAttr,
+    assertHasNotAttr,
+    get_tests_data_path,
+    get_tests_input_path,
+    get_tests_output_path,
+    get_tiny_vits_config,
+)
 from TTS.config import load_config
 from TTS.encoder.utils.generic_utils import setup_encoder_model
 from TTS.tts.configs.vits_config import VitsConfig
@@ -21,6 +30,7 @@ from TTS.tts.models.vits import (
     wav_to_spec,
 )
 from TTS.tts.utils.speakers import SpeakerManager
+from TTS.tts.utils.synthesis import synthesis_batch
 
 LANG_FILE = os.path.join(get_tests_input_path(), "language_ids.json")
 SPEAKER_ENCODER_CONFIG = os.path.join(get_tests_input_path(), "test_speaker_encoder_config.json")
@@ -371,6 +381,74 @@ class TestVits(unittest.TestCase):
         outputs = model.inference(input_dummy, aux_input={"x_lengths": input_lengths, "d_vectors": d_vectors})
         self._check_inference_outputs(config, outputs, input_dummy, batch_size=2)
 
+    def test_synthesis_batch(self):
+        config = VitsConfig(model_args=VitsArgs(num_chars=32))
+        model = Vits.init_from_config(config, verbose=False).to(device)
+        model.eval()
+        # make the outputs deterministic to compare batched and single runs
+        model.inference_noise_scale = 0.0
+        model.inference_noise_scale_dp = 0.0
+
+        texts = ["a short one.", "this sentence is quite a bit longer than the first one."]
+        outputs = synthesis_batch(model, texts, config, use_cuda)
+        hop_length = config.audio.hop_length
+        y_lengths = outputs["outputs"]["y_mask"].sum([1, 2]).long().cpu().numpy()
+        self.assertEqual(len(outputs["wavs"]), 2)
+        for wav, y_length in zip(outputs["wavs"], y_lengths):
+            self.assertEqual(len(wav), y_length * hop_length)
+
+        # padding only leaks into the last frames through the decoder receptive field
+        edge = 2 * hop_length
+        for idx, text in enumerate(texts):
+            single = synthesis_batch(model, [text], config, use_cuda)["wavs"][0]
+            self.assertEqual(single.shape, outputs["wavs"][idx].shape)
+            self.assertTrue(np.allclose(single[:-edge], outputs["wavs"][idx][:-edge], atol=1e-4))
+
+    @unittest.skipIf(importlib.util.find_spec("onnxruntime") is None, "onnxruntime is not installed")
+    def test_synthesis_batch_onnx(self):
+        config = get_tiny_vits_config(num_speakers=4, use_speaker_embedding=True)
+        config.num_speakers = 4
+        config.use_speaker_embedding = True
+        model = Vits.init_from_config(config, verbose=False)
+        model.eval()
+        model.inference_noise_scale = 0.0
+        model.inference_noise_scale_dp = 0.0
+        onnx_path = os.path.join(get_tests_output_path(), "test_vits.onnx")
+        model.export_onnx(output_path=onnx_path, verbose=False)
+        model.load_onnx(onnx_path, intra_op_num_threads=1)
+
+        # a padded batch with a speaker per sentence, the same waveforms as the torch model
+        texts = ["a short one.", "this sentence is quite a bit longer than the first one."]
+        speaker_ids = [3, 1]
+        outputs = synthesis_batch(model, texts, config, False, speaker_ids=speaker_ids)
+        onnx_outputs = synthesis_batch(model, texts, config, False, speaker_ids=speaker_ids, backend="onnx")
+        np.testing.assert_array_equal(onnx_outputs["wav_lengths"], outputs["wav_lengths"])
+        for wav, onnx_wav in zip(outputs["wavs"], onnx_outputs["wavs"]):
+            np.testing.assert_allclose(onnx_wav, wav, atol=1e-4)
+
+        # the scales are inputs of the graph
+        model.length_scale = 2.0
+        slow_outputs = synthesis_batch(model, texts, config, False, speaker_ids=speaker_ids, backend="onnx")
+        self.assertTrue(np.all(slow_outputs["wav_lengths"] > onnx_outputs["wav_lengths"]))
+
+    def test_inference_stream(self):
+        config = VitsConfig(model_args=VitsArgs(num_chars=32))
+        model = Vits.init_from_config(config, verbose=False).to(device)
+        model.eval()
+        model.inference_noise_scale = 0.0
+        model.inference_noise_scale_dp = 0.0
+
+        input_dummy, *_ = self._create_inputs(config, batch_size=1)
+        wav = model.inference(input_dummy)["model_outputs"]
+        chunks = list(model.inference_stream(input_dummy, chunk_frames=8, overlap_frames=16))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunk.shape[-1] <= 8 * config.audio.hop_length for chunk in chunks))
+        # with enough context the chunks add up to the full pass
+        self.assertTrue(torch.allclose(torch.cat(chunks, dim=-1), wav, atol=1e-4))
+
+        with self.assertRaises(ValueError):
+            next(model.inference_stream(torch.cat([input_dummy, input_dummy])))
+
     @staticmethod
     def _check_parameter_changes(model, model_ref):
         count = 0
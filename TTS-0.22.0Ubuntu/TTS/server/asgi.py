@@ -0,0 +1,298 @@
+"""ASGI version of the demo server.
+
+Serves the same pages, `/api/tts` and MaryTTS routes as the Flask app in `server.py`, from the voices it loaded,
+plus a WebSocket route streaming the audio sentence by sentence. Model calls run on a thread pool so the event loop
+keeps serving other clients, and a replica is released as soon as its text is synthesized, whether or not a slow
+client has received the audio yet.
+
+Start it with `tts-server --asgi true ...`.
+"""
+import asyncio
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import ModuleType
+from urllib.parse import parse_qs
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Mount, Route, WebSocketRoute
+from starlette.staticfiles import StaticFiles
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from TTS.utils.audio.encoders import StreamingAudioEncoder
+from TTS.utils.synthesizer_pool import PoolBusyError
+from TTS.utils.voice_registry import Lease
+
+SERVER_DIR = Path(__file__).parent
+
+# WebSocket close code asking the client to retry later (RFC 6455 "Try Again Later")
+WS_TRY_AGAIN_LATER = 1013
+
+
+def _url_for(endpoint: str, filename: str = None) -> str:
+    # the templates only link static files
+    if endpoint != "static":
+        raise ValueError(f" [!] Unknown endpoint: {endpoint}")
+    return f"/static/{filename}"
+
+
+async def _request_values(request: Request) -> dict:
+    """Query parameters merged with an urlencoded POST body, like Flask's `request.values`."""
+    values = dict(request.query_params)
+    if request.method == "POST" and request.headers.get("content-type", "").startswith(
+        "application/x-www-form-urlencoded"
+    ):
+        body = parse_qs((await request.body()).decode("utf-8"))
+        values.update({key: value[0] for key, value in body.items()})
+    return values
+
+
+def _encoder(lease: Lease, params: dict) -> StreamingAudioEncoder:
+    return StreamingAudioEncoder(
+        params["audio_format"], lease.worker.output_sample_rate, params["sample_rate"], params["bitrate"]
+    )
+
+
+def _busy_response(error: PoolBusyError) -> Response:
+    print(f" > {error}")
+    return PlainTextResponse("Server busy, retry later.", status_code=503, headers={"Retry-After": "1"})
+
+
+def create_app(server: ModuleType = None) -> Starlette:
+    """Build the ASGI app around the voices loaded by `TTS.server.server`.
+
+    Args:
+        server (ModuleType, optional): the loaded server module. Defaults to importing `TTS.server.server`, which
+            parses the command line and loads the models.
+
+    Returns:
+        Starlette: the ASGI application.
+    """
+    if server is None:
+        from TTS.server import server  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    voices = server.voice_registry
+    # enough threads for every replica to synthesize and every queued request to wait for one
+    num_replicas, max_queue_size, _ = voices.pool_args
+    executor = ThreadPoolExecutor(len(voices.models) * (num_replicas + max_queue_size), thread_name_prefix="tts")
+    templates = Environment(loader=FileSystemLoader(SERVER_DIR / "templates"), autoescape=select_autoescape())
+    templates.globals["url_for"] = _url_for
+
+    async def run(func, *args):
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    async def synthesize_wav(params: dict) -> Response:
+        def _synthesize():
+            with voices.lease(params["speaker_idx"], params["language_idx"]) as lease:
+                out = io.BytesIO()
+                lease.worker.save_wav(server.synthesize(lease, params), out)
+            return out.getvalue()
+
+        try:
+            return Response(await run(_synthesize), media_type="audio/wav")
+        except PoolBusyError as e:
+            return _busy_response(e)
+
+    def stream_sentences(lease: Lease, params: dict, encoder: StreamingAudioEncoder):
+        """Synthesize the sentences of the text on the executor, starting right away.
+
+        Returns an async iterator over the encoded audio of each sentence and a `stop` function skipping the
+        remaining sentences, also called when the iterator is closed. The replica is released exactly once, after the
+        last sentence it synthesizes, so it comes back to the pool even if the iterator is never consumed.
+        """
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue()
+        cancelled = threading.Event()
+        release_lock = threading.Lock()
+        released = False
+
+        def release():
+            nonlocal released
+            with release_lock:
+                if released:
+                    return
+                released = True
+            voices.release(lease)
+
+        def produce():
+            try:
+                for sentence in lease.worker.split_into_sentences(params["text"]):
+                    if cancelled.is_set():
+                        return
+                    chunk = encoder.encode(server.synthesize(lease, params, sentence))
+                    loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+            except Exception as e:  # pylint: disable=broad-except
+                loop.call_soon_threadsafe(chunks.put_nowait, e)
+                return
+            finally:
+                release()
+            loop.call_soon_threadsafe(chunks.put_nowait, encoder.finish())
+            loop.call_soon_threadsafe(chunks.put_nowait, None)
+
+        try:
+            executor.submit(produce)
+        except RuntimeError:
+            # the executor is shut down
+            release()
+            raise
+
+        async def iterate():
+            try:
+                while True:
+                    chunk = await chunks.get()
+                    if chunk is None:
+                        return
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    yield chunk
+            finally:
+                cancelled.set()
+
+        return iterate(), cancelled.set
+
+    async def index(request: Request):  # pylint: disable=unused-argument
+        return HTMLResponse(templates.get_template("index.html").render(**server.index_context()))
+
+    async def details(request: Request):  # pylint: disable=unused-argument
+        return HTMLResponse(templates.get_template("details.html").render(**server.details_context()))
+
+    async def tts(request: Request):
+        try:
+            params = server.tts_request(request.headers, await _request_values(request))
+        except ValueError as e:
+            return PlainTextResponse(str(e), status_code=400)
+
+        print(f" > Model input: {params['text']}")
+        print(f" > Speaker Idx: {params['speaker_idx']}")
+        print(f" > Language Idx: {params['language_idx']}")
+
+        if params["audio_format"] == "wav" and params["sample_rate"] is None and params["bitrate"] is None:
+            return await synthesize_wav(params)
+
+        # take the worker before answering so an overloaded server still returns 503
+        try:
+            lease = await run(voices.acquire, params["speaker_idx"], params["language_idx"])
+        except PoolBusyError as e:
+            return _busy_response(e)
+        try:
+            encoder = _encoder(lease, params)
+        except ValueError as e:
+            voices.release(lease)
+            return PlainTextResponse(str(e), status_code=400)
+        chunks, stop = stream_sentences(lease, params, encoder)
+        # also stops the synthesis when the client left before the stream was iterated
+        return StreamingResponse(chunks, media_type=encoder.media_type, background=BackgroundTask(stop))
+
+    async def tts_websocket(websocket: WebSocket):
+        """Stream each request sent on the socket sentence by sentence.
+
+        Every text message is a JSON request with the `/api/tts` query parameters, e.g.
+        `{"text": "...", "speaker_id": "...", "format": "opus"}`. The server answers with a
+        `{"event": "start", "media_type": ...}` message, the encoded audio of each sentence as binary messages and
+        `{"event": "end"}`. Invalid requests get `{"event": "error", "message": ...}`. When the server is busy, the
+        socket is closed with code 1013 and the client should reconnect later.
+        """
+        await websocket.accept()
+        while True:
+            try:
+                message = await websocket.receive_text()
+            except WebSocketDisconnect:
+                return
+            try:
+                values = json.loads(message)
+                if not isinstance(values, dict):
+                    raise ValueError("The request must be a JSON object.")
+                params = server.tts_request({}, {key: str(value) for key, value in values.items()})
+            except ValueError as e:
+                await websocket.send_json({"event": "error", "message": str(e)})
+                continue
+
+            print(f" > Model input: {params['text']}")
+            try:
+                lease = await run(voices.acquire, params["speaker_idx"], params["language_idx"])
+            except PoolBusyError as e:
+                print(f" > {e}")
+                await websocket.close(code=WS_TRY_AGAIN_LATER, reason="Server busy, retry later.")
+                return
+            try:
+                encoder = _encoder(lease, params)
+            except ValueError as e:
+                voices.release(lease)
+                await websocket.send_json({"event": "error", "message": str(e)})
+                continue
+
+            await websocket.send_json(
+                {"event": "start", "media_type": encoder.media_type, "sample_rate": encoder.output_sample_rate}
+            )
+            chunks, stop = stream_sentences(lease, params, encoder)
+            try:
+                async for chunk in chunks:
+                    # compressed formats may hold a short sentence back until the next one
+                    if chunk:
+                        await websocket.send_bytes(chunk)
+            except WebSocketDisconnect:
+                return
+            except Exception as e:  # pylint: disable=broad-except
+                await websocket.send_json({"event": "error", "message": str(e)})
+                continue
+            finally:
+                stop()
+            await websocket.send_json({"event": "end"})
+
+    async def workers(request: Request):  # pylint: disable=unused-argument
+        return JSONResponse(voices.stats())
+
+    # Basic MaryTTS compatibility layer
+
+    async def mary_tts_api_locales(request: Request):  # pylint: disable=unused-argument
+        """MaryTTS-compatible /locales endpoint"""
+        locales = sorted({voice.locale for voice in voices.voices.values()})
+        return PlainTextResponse("".join(f"{locale}\n" for locale in locales))
+
+    async def mary_tts_api_voices(request: Request):  # pylint: disable=unused-argument
+        """MaryTTS-compatible /voices endpoint"""
+        return PlainTextResponse(
+            "".join(f"{voice.name} {voice.locale} {voice.gender}\n" for voice in voices.voices.values())
+        )
+
+    async def mary_tts_api_process(request: Request):
+        """MaryTTS-compatible /process endpoint"""
+        if request.method == "POST":
+            data = {key: value[0] for key, value in parse_qs((await request.body()).decode("utf-8")).items()}
+        else:
+            data = request.query_params
+        # NOTE: we ignore param. LOCALE, the voice selects the model
+        text = data.get("INPUT_TEXT", "")
+        print(f" > Model input: {text}")
+        return await synthesize_wav(
+            {"text": text, "speaker_idx": data.get("VOICE"), "language_idx": None, "style_wav": None}
+        )
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette):  # pylint: disable=unused-argument
+        yield
+        executor.shutdown(wait=False)
+
+    app = Starlette(
+        debug=server.args.debug,
+        routes=[
+            Route("/", index),
+            Route("/details", details),
+            Route("/api/tts", tts, methods=["GET", "POST"]),
+            WebSocketRoute("/api/tts/ws", tts_websocket),
+            Route("/api/workers", workers),
+            Route("/locales", mary_tts_api_locales),
+            Route("/voices", mary_tts_api_voices),
+            Route("/process", mary_tts_api_process, methods=["GET", "POST"]),
+            Mount("/static", StaticFiles(directory=SERVER_DIR / "static"), name="static"),
+        ],
+        lifespan=lifespan,
+    )
+    return app
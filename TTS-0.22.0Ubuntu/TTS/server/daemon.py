@@ -0,0 +1,326 @@
+"""Daemon mode of the `tts` command line.
+
+`tts --serve` loads the models selected by its arguments and waits for requests on a local socket. Every `tts` call
+looks for a running daemon before importing anything heavy and, when it finds one, sends its arguments to it instead
+of loading the models itself. Scripts calling `tts` once per sentence keep working unchanged and only pay for the
+synthesis. A request for other models makes the daemon load them, keeping at most `--daemon_max_models` loaded.
+
+The daemon listens on a Unix socket only its user can open, in $XDG_RUNTIME_DIR or in a folder of the temp folder only
+its user can enter, or on a localhost TCP port where Unix sockets are not available (Windows). Clients only forward
+requests to a socket owned by their user. Requests are served one at a time.
+
+Protocol: the client sends one JSON line `{"command": "synthesize", "args": {...}}` with the parsed command line
+arguments, or `{"command": "stop"}`. The daemon answers with one JSON line
+`{"status": "ok" | "error", "output": ..., "message": ..., "wav_size": ...}`, followed by `wav_size` bytes of wav
+data when `--pipe_out` is set.
+
+This module only imports the standard library so that forwarding a request stays fast.
+"""
+import contextlib
+import getpass
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import traceback
+from argparse import Namespace
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Callable, Dict, Tuple
+
+DEFAULT_PORT = 5054
+CONNECT_TIMEOUT = 1.0
+
+# arguments selecting the models, requests with other values are served by other models
+MODEL_ARGS = [
+    "model_name",
+    "model_path",
+    "config_path",
+    "speakers_file_path",
+    "language_ids_file_path",
+    "vocoder_name",
+    "vocoder_path",
+    "vocoder_config_path",
+    "encoder_path",
+    "encoder_config_path",
+    "device",
+    "use_cuda",
+    "voice_dir",
+]
+
+# arguments holding paths, made absolute by the client since the daemon runs from another folder
+PATH_ARGS = [
+    "model_path",
+    "config_path",
+    "speakers_file_path",
+    "language_ids_file_path",
+    "vocoder_path",
+    "vocoder_config_path",
+    "encoder_path",
+    "encoder_config_path",
+    "out_path",
+    "speaker_wav",
+    "reference_wav",
+    "capacitron_style_wav",
+    "gst_style",
+    "source_wav",
+    "target_wav",
+    "voice_dir",
+]
+
+# requests that don't need a model, they are answered by the client itself
+LOCAL_ARGS = ["list_models", "model_info_by_idx", "model_info_by_name"]
+
+
+def _private_dir() -> str:
+    """Per-user folder of the socket when $XDG_RUNTIME_DIR isn't set, created by the daemon with mode 0700."""
+    return os.path.join(tempfile.gettempdir(), f"tts-daemon-{getpass.getuser()}")
+
+
+def default_address() -> str:
+    """$TTS_DAEMON_ADDRESS, else a Unix socket in $XDG_RUNTIME_DIR or in a per-user folder of the temp folder, or a
+    localhost port on Windows."""
+    address = os.environ.get("TTS_DAEMON_ADDRESS")
+    if address:
+        return address
+    if os.name == "nt" or not hasattr(socket, "AF_UNIX"):
+        return f"127.0.0.1:{DEFAULT_PORT}"
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "tts-daemon.sock")
+    return os.path.join(_private_dir(), "daemon.sock")
+
+
+def _check_owner(path: str):
+    """Raise `PermissionError` if `path` belongs to another user, who could read the requests sent to it."""
+    if hasattr(os, "getuid") and os.stat(path).st_uid != os.getuid():
+        raise PermissionError(f" [!] {path} belongs to another user.")
+
+
+def _tcp_address(address: str) -> Tuple[str, int]:
+    """`(host, port)` for a `host:port` address, None for a socket path."""
+    host, _, port = address.rpartition(":")
+    if host and port.isdigit() and "/" not in host and "\\" not in host:
+        return host.strip("[]"), int(port)
+    return None
+
+
+def connect(address: str = None, timeout: float = CONNECT_TIMEOUT) -> socket.socket:
+    """Open a connection to the daemon.
+
+    Raises:
+        OSError: if no daemon listens at `address`.
+        PermissionError: if the socket at `address` belongs to another user.
+    """
+    address = address or default_address()
+    tcp_address = _tcp_address(address)
+    if tcp_address is not None:
+        return socket.create_connection(tcp_address, timeout=timeout)
+    _check_owner(address)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # pylint: disable=no-member
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def request(sock: socket.socket, message: Dict) -> Tuple[Dict, bytes]:
+    """Send a request on a connection and read the response and the wav data that follows it."""
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+    # the first request of a model waits for the model to load
+    sock.settimeout(None)
+    with sock.makefile("rb") as f:
+        response = json.loads(f.readline())
+        wav = f.read(response.get("wav_size", 0))
+    return response, wav
+
+
+def _request_args(args: Namespace) -> Dict:
+    values = dict(vars(args))
+    for name in PATH_ARGS:
+        value = values.get(name)
+        if isinstance(value, list):
+            values[name] = [os.path.abspath(path) for path in value]
+        elif value:
+            values[name] = os.path.abspath(value)
+    return values
+
+
+def forward(args: Namespace) -> bool:
+    """Send the request of the `tts` command line arguments to a running daemon.
+
+    Returns:
+        bool: True if a daemon served the request, False if there is no daemon and the request must be served
+        locally.
+    """
+    if any(getattr(args, name, None) for name in LOCAL_ARGS):
+        return False
+    try:
+        sock = connect(args.daemon_address)
+    except PermissionError as e:
+        print(f"{e} Not sending the request to it.", file=sys.stderr)
+        return False
+    except OSError:
+        return False
+    with sock:
+        response, wav = request(sock, {"command": "synthesize", "args": _request_args(args)})
+    if response["status"] != "ok":
+        print(response.get("output", ""), end="", file=sys.stderr)
+        print(f" [!] The tts daemon failed: {response['message']}", file=sys.stderr)
+        sys.exit(1)
+    if args.pipe_out:
+        sys.stdout.buffer.write(wav)
+        sys.stdout.flush()
+    else:
+        print(response["output"], end="")
+    return True
+
+
+def stop(address: str = None) -> bool:
+    """Ask the daemon at `address` to stop. Returns False if no daemon is running."""
+    try:
+        sock = connect(address)
+    except OSError:
+        print(" > No tts daemon running.")
+        return False
+    with sock:
+        request(sock, {"command": "stop"})
+    print(" > tts daemon stopped.")
+    return True
+
+
+def model_key(values: Dict) -> str:
+    """Key of the models selected by a request, the model name doesn't matter when a model path is given."""
+    key = {name: values.get(name) for name in MODEL_ARGS}
+    if key["model_path"]:
+        key["model_name"] = None
+    return json.dumps(key, sort_keys=True)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            message = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        response, wav = self.server.daemon.handle(message)
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n" + wav)
+
+
+class TTSDaemon:
+    """Serve the requests forwarded by the `tts` command line with models kept in memory.
+
+    Args:
+        load_synthesizer (Callable): builds a `Synthesizer` from the command line arguments.
+        run_synthesis (Callable): serves the command line arguments with a loaded `Synthesizer`.
+        address (str, optional): Unix socket path or `host:port` to listen on. Defaults to `default_address()`.
+        max_models (int): models kept loaded, the least recently used one is unloaded once another one is loaded.
+            Defaults to 1.
+    """
+
+    def __init__(self, load_synthesizer: Callable, run_synthesis: Callable, address: str = None, max_models: int = 1):
+        self.load_synthesizer = load_synthesizer
+        self.run_synthesis = run_synthesis
+        self.address = address or default_address()
+        self.max_models = max(1, max_models)
+        self.synthesizers = OrderedDict()
+        self.server = None
+        self._stopped = False
+
+    def synthesizer(self, values: Dict):
+        """Loaded models selected by the arguments of a request."""
+        key = model_key(values)
+        if key in self.synthesizers:
+            self.synthesizers.move_to_end(key)
+            return self.synthesizers[key]
+        # load before unloading, so a request with bad arguments doesn't unload a working model
+        synthesizer = self.load_synthesizer(Namespace(**values))
+        while len(self.synthesizers) >= self.max_models:
+            self.synthesizers.popitem(last=False)
+        self.synthesizers[key] = synthesizer
+        return synthesizer
+
+    def handle(self, message: Dict) -> Tuple[Dict, bytes]:
+        """Serve a request, returning the response and the wav data sent after it."""
+        if message.get("command") == "stop":
+            self._stopped = True
+            return {"status": "ok"}, b""
+        if message.get("command") != "synthesize":
+            return {"status": "error", "message": f"Unknown command: {message.get('command')}"}, b""
+
+        args = Namespace(**message["args"])
+        pipe_out = SimpleNamespace(buffer=io.BytesIO()) if args.pipe_out else None
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                self.run_synthesis(args, self.synthesizer(message["args"]), pipe_out)
+        except Exception as e:  # pylint: disable=broad-except
+            traceback.print_exc()
+            return {"status": "error", "output": output.getvalue(), "message": str(e)}, b""
+        wav = pipe_out.buffer.getvalue() if pipe_out else b""
+        return {"status": "ok", "output": output.getvalue(), "wav_size": len(wav)}, wav
+
+    def bind(self):
+        """Open the listening socket, replacing the socket file of a daemon that didn't exit cleanly."""
+        tcp_address = _tcp_address(self.address)
+        if tcp_address is not None:
+            self.server = socketserver.TCPServer(tcp_address, _RequestHandler)
+        else:
+            directory = os.path.dirname(self.address)
+            if directory == _private_dir():
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+                # another user could have created it first to hand out their own socket
+                _check_owner(directory)
+                os.chmod(directory, 0o700)
+            if os.path.exists(self.address):
+                try:
+                    connect(self.address).close()
+                except OSError:
+                    os.remove(self.address)
+                else:
+                    raise RuntimeError(f" [!] A tts daemon is already listening on {self.address}.")
+            # only the user running the daemon can connect
+            umask = os.umask(0o177)
+            try:
+                self.server = socketserver.UnixStreamServer(self.address, _RequestHandler)  # pylint: disable=no-member
+            finally:
+                os.umask(umask)
+        self.server.daemon = self
+
+    def serve_forever(self):
+        """Serve requests until a stop request."""
+        if self.server is None:
+            self.bind()
+        try:
+            while not self._stopped:
+                self.server.handle_request()
+        finally:
+            self.close()
+
+    def close(self):
+        if self.server is None:
+            return
+        self.server.server_close()
+        self.server = None
+        if _tcp_address(self.address) is None and os.path.exists(self.address):
+            os.remove(self.address)
+
+
+def serve(args: Namespace, load_synthesizer: Callable, run_synthesis: Callable):
+    """Run `tts --serve`: load the models selected by `args` and serve requests until stopped."""
+    daemon = TTSDaemon(load_synthesizer, run_synthesis, args.daemon_address, args.daemon_max_models)
+    daemon.bind()
+    daemon.synthesizer(_request_args(args))
+    print(f" > tts daemon listening on {daemon.address}. Stop it with `tts --stop_daemon` or Ctrl+C.")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
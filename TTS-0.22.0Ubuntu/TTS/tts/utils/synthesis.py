@@ -33,7 +33,7 @@ def run_model_torch(
     d_vector: torch.Tensor = None,
     language_id: torch.Tensor = None,
 ) -> Dict:
-    """Run a torch model for inference. It does not support batch inference.
+    """Run a torch model for inference. It does not support batch inference, see `synthesis_batch`.
 
     Args:
         model (nn.Module): The model to run inference.
@@ -252,6 +252,230 @@ def synthesis(
     return return_dict
 
 
+def synthesis_batch(
+    model,
+    texts,
+    CONFIG,
+    use_cuda,
+    speaker_ids=None,
+    d_vectors=None,
+    language_ids=None,
+    token_ids=None,
+    backend="torch",
+):
+    """Synthesize a batch of sentences with a single forward pass. Only for models that take `x_lengths` and output
+    waveforms (e.g. VITS).
+
+    The token sequences are right padded, run through ``model.inference`` at once and each waveform is cropped back to
+    its own length using the returned ``y_mask``. With the ``onnx`` backend they run through the ONNX Runtime session
+    of the model instead, see ``Vits.inference_onnx_batch``, and with the ``torchscript`` backend through its traced
+    module, see ``Vits.inference_torchscript_batch``.
+
+    Args:
+        model (TTS.tts.models):
+            The TTS model to synthesize audio with.
+
+        texts (List[str]):
+            The input sentences.
+
+        CONFIG (Coqpit):
+            Model configuration.
+
+        use_cuda (bool):
+            Enable/disable CUDA.
+
+        speaker_ids (List[int]):
+            Speaker ID of each sentence for multi-speaker models. Defaults to None.
+
+        d_vectors (List[np.ndarray]):
+            d-vector of each sentence for multi-speaker models. Defaults to None.
+
+        language_ids (List[int]):
+            Language ID of each sentence for multi-lingual models. Defaults to None.
+
+        token_ids (List[List[int]]):
+            Token IDs of the sentences, when the caller already tokenized them. Defaults to None.
+
+        backend (str):
+            ``torch``, ``onnx`` to run the ONNX model loaded by ``Vits.load_onnx``, or ``torchscript`` to run the
+            module loaded by ``Vits.load_torchscript``. Defaults to ``torch``.
+
+    Returns:
+        Dict: ``wavs`` with one waveform per sentence, ``wav_lengths`` and the raw model ``outputs`` (None with the
+        ``onnx`` and ``torchscript`` backends).
+    """
+    language_names = [None] * len(texts)
+    if language_ids is not None:
+        id_to_name = {v: k for k, v in model.language_manager.name_to_id.items()}
+        language_names = [id_to_name[lid] for lid in language_ids]
+
+    # convert texts to padded sequences of token IDs
+    if token_ids is None:
+        token_ids = [
+            model.tokenizer.text_to_ids(text, language=language_name)
+            for text, language_name in zip(texts, language_names)
+        ]
+    text_lengths = np.array([len(ids) for ids in token_ids], dtype=np.int64)
+    text_inputs = np.zeros((len(token_ids), text_lengths.max()), dtype=np.int64)
+    for idx, ids in enumerate(token_ids):
+        text_inputs[idx, : len(ids)] = ids
+
+    if backend != "torch" and d_vectors is not None:
+        raise ValueError(f" [!] The {backend} backend takes speaker IDs, not d-vectors.")
+    if backend == "onnx":
+        model_outputs, wav_lengths = model.inference_onnx_batch(text_inputs, text_lengths, speaker_ids, language_ids)
+        return {
+            "wavs": [model_outputs[idx, :wav_len] for idx, wav_len in enumerate(wav_lengths)],
+            "wav_lengths": wav_lengths,
+            "text_inputs": text_inputs,
+            "outputs": None,
+        }
+
+    # device
+    device = next(model.parameters()).device
+    if use_cuda:
+        device = "cuda"
+
+    text_inputs = numpy_to_torch(text_inputs, torch.long, device=device)
+    text_lengths = numpy_to_torch(text_lengths, torch.long, device=device)
+
+    # pass tensors to backend
+    if speaker_ids is not None:
+        speaker_ids = id_to_torch(speaker_ids, device=device)
+
+    if d_vectors is not None:
+        d_vectors = numpy_to_torch(np.asarray(d_vectors), torch.float, device=device)
+
+    if language_ids is not None:
+        language_ids = id_to_torch(language_ids, device=device)
+
+    if backend == "torchscript":
+        model_outputs, wav_lengths = model.inference_torchscript_batch(
+            text_inputs, text_lengths, speaker_ids, language_ids
+        )
+        return {
+            "wavs": [model_outputs[idx, :wav_len] for idx, wav_len in enumerate(wav_lengths)],
+            "wav_lengths": wav_lengths,
+            "text_inputs": text_inputs,
+            "outputs": None,
+        }
+
+    if hasattr(model, "module"):
+        _func = model.module.inference
+    else:
+        _func = model.inference
+    outputs = _func(
+        text_inputs,
+        aux_input={
+            "x_lengths": text_lengths,
+            "speaker_ids": speaker_ids,
+            "d_vectors": d_vectors,
+            "language_ids": language_ids,
+        },
+    )
+
+    model_outputs = outputs["model_outputs"]
+    if model_outputs.ndim != 3 or model_outputs.shape[1] != 1:
+        raise ValueError(" [!] Batch synthesis is only supported for models that output waveforms.")
+
+    # crop each waveform back to its own length
+    y_mask = outputs["y_mask"]
+    num_frames = y_mask.shape[-1]
+    if getattr(model, "max_inference_len", None):
+        num_frames = min(num_frames, model.max_inference_len)
+    hop_length = model_outputs.shape[-1] // num_frames
+    y_lengths = torch.clamp(y_mask.sum([1, 2]).long(), max=num_frames)
+    wav_lengths = (y_lengths * hop_length).cpu().numpy()
+
+    model_outputs = model_outputs.squeeze(1).data.cpu().numpy()
+    wavs = [model_outputs[idx, :wav_len] for idx, wav_len in enumerate(wav_lengths)]
+    return {
+        "wavs": wavs,
+        "wav_lengths": wav_lengths,
+        "text_inputs": text_inputs,
+        "outputs": outputs,
+    }
+
+
+def synthesis_stream(
+    model,
+    text,
+    use_cuda,
+    speaker_id=None,
+    d_vector=None,
+    language_id=None,
+    chunk_frames=64,
+    overlap_frames=16,
+):
+    """Synthesize a sentence chunk by chunk with the streaming inference of the model, see `Vits.inference_stream`.
+
+    Args:
+        model (TTS.tts.models):
+            The TTS model to synthesize audio with. It must implement ``inference_stream``.
+
+        text (str):
+            The input text.
+
+        use_cuda (bool):
+            Enable/disable CUDA.
+
+        speaker_id (int):
+            Speaker ID for multi-speaker models. Defaults to None.
+
+        d_vector (np.ndarray):
+            d-vector for multi-speaker models. Defaults to None.
+
+        language_id (int):
+            Language ID for multi-lingual models. Defaults to None.
+
+        chunk_frames (int):
+            Decoder frames per chunk. Defaults to 64.
+
+        overlap_frames (int):
+            Frames of context decoded on each side of a chunk. Defaults to 16.
+
+    Yields:
+        np.ndarray: the next waveform chunk.
+    """
+    # device
+    device = next(model.parameters()).device
+    if use_cuda:
+        device = "cuda"
+
+    language_name = None
+    if language_id is not None:
+        language = [k for k, v in model.language_manager.name_to_id.items() if v == language_id]
+        assert len(language) == 1, "language_id must be a valid language"
+        language_name = language[0]
+
+    text_inputs = np.asarray(model.tokenizer.text_to_ids(text, language=language_name), dtype=np.int32)
+    text_inputs = numpy_to_torch(text_inputs, torch.long, device=device).unsqueeze(0)
+
+    # pass tensors to backend
+    if speaker_id is not None:
+        speaker_id = id_to_torch(speaker_id, device=device)
+
+    if d_vector is not None:
+        d_vector = embedding_to_torch(d_vector, device=device)
+
+    if language_id is not None:
+        language_id = id_to_torch(language_id, device=device)
+
+    _func = model.module.inference_stream if hasattr(model, "module") else model.inference_stream
+    for chunk in _func(
+        text_inputs,
+        aux_input={
+            "x_lengths": None,
+            "speaker_ids": speaker_id,
+            "d_vectors": d_vector,
+            "language_ids": language_id,
+        },
+        chunk_frames=chunk_frames,
+        overlap_frames=overlap_frames,
+    ):
+        yield chunk.squeeze().data.cpu().numpy()
+
+
 def transfer_voice(
     model,
     CONFIG,
@@ -1,6 +1,7 @@
 from typing import Dict, List
 
-from TTS.tts.utils.text.phonemizers import DEF_LANG_TO_PHONEMIZER, get_phonemizer_by_name
+from TTS.tts.utils.text import phonemizers
+from TTS.tts.utils.text.phonemizers import get_phonemizer_by_name
 
 
 class MultiPhonemizer:
@@ -18,8 +19,8 @@ class MultiPhonemizer:
 
     def __init__(self, lang_to_phonemizer_name: Dict = {}) -> None:  # pylint: disable=dangerous-default-value
         for k, v in lang_to_phonemizer_name.items():
-            if v == "" and k in DEF_LANG_TO_PHONEMIZER.keys():
-                lang_to_phonemizer_name[k] = DEF_LANG_TO_PHONEMIZER[k]
+            if v == "" and k in phonemizers.DEF_LANG_TO_PHONEMIZER.keys():
+                lang_to_phonemizer_name[k] = phonemizers.DEF_LANG_TO_PHONEMIZER[k]
             elif v == "":
                 raise ValueError(f"Phonemizer wasn't set for language {k} and doesn't have a default.")
         self.lang_to_phonemizer_name = lang_to_phonemizer_name
@@ -5,7 +5,6 @@ import librosa
 import numpy as np
 import scipy
 import soundfile as sf
-from librosa import magphase, pyin
 
 # For using kwargs
 # pylint: disable=unused-argument
@@ -280,7 +279,8 @@ def compute_f0(
     assert pitch_fmax is not None, " [!] Set `pitch_fmax` before caling `compute_f0`."
     assert pitch_fmin is not None, " [!] Set `pitch_fmin` before caling `compute_f0`."
 
-    f0, voiced_mask, _ = pyin(
+    # librosa loads its submodules on first access, pitch tracking takes most of a second to load
+    f0, voiced_mask, _ = librosa.pyin(
         y=x.astype(np.double),
         fmin=pitch_fmin,
         fmax=pitch_fmax,
@@ -319,7 +319,7 @@ def compute_energy(y: np.ndarray, **kwargs) -> np.ndarray:
       >>> energy = ap.compute_energy(wav)
     """
     x = stft(y=y, **kwargs)
-    mag, _ = magphase(x)
+    mag, _ = librosa.magphase(x)
     energy = np.sqrt(np.sum(mag**2, axis=0))
     return energy
 
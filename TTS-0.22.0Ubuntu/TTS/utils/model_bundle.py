@@ -0,0 +1,235 @@
+"""Inference bundles: a model exported once for fast loading.
+
+A bundle is a folder with the model config, the tokenizer vocabulary, the speaker and language maps and the weights
+in the safetensors layout, with weight norm already folded into the convolution weights. Loading a bundle skips the
+pickled checkpoint and maps the weights from disk instead of reading them, so a worker starts in a fraction of the
+time and processes serving the same bundle share its pages in the OS cache.
+"""
+import copy
+import json
+import mmap
+import os
+from typing import Dict, Tuple
+
+import torch
+from coqpit import Coqpit
+from torch.nn.utils import parametrize
+
+from TTS.config import load_config
+from TTS.tts.models import setup_model
+
+BUNDLE_CONFIG = "config.json"
+BUNDLE_WEIGHTS = "model.safetensors"
+BUNDLE_VOCAB = "vocab.json"
+BUNDLE_SPEAKERS = "speakers.json"
+BUNDLE_D_VECTORS = "d_vectors.pth"
+BUNDLE_LANGUAGES = "language_ids.json"
+
+# safetensors dtype names
+_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+_DTYPE_NAMES = {dtype: name for name, dtype in _DTYPES.items()}
+
+
+def save_safetensors(tensors: Dict[str, torch.Tensor], path: str, metadata: Dict[str, str] = None):
+    """Write tensors in the safetensors layout: an 8 byte header size, a JSON header and the raw tensor data.
+
+    Tensors are written from the largest to the smallest element size so that, with the header padded to 8 bytes,
+    every tensor starts at an offset aligned to its element size and can be viewed in place from a memory map.
+    """
+    tensors = {name: tensor.detach().cpu().contiguous() for name, tensor in tensors.items()}
+    names = sorted(tensors, key=lambda name: (-tensors[name].element_size(), name))
+    header = {"__metadata__": metadata} if metadata else {}
+    offset = 0
+    for name in names:
+        tensor = tensors[name]
+        size = tensor.numel() * tensor.element_size()
+        header[name] = {
+            "dtype": _DTYPE_NAMES[tensor.dtype],
+            "shape": list(tensor.shape),
+            "data_offsets": [offset, offset + size],
+        }
+        offset += size
+    header = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    header += b" " * (-len(header) % 8)
+    with open(path, "wb") as f:
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        for name in names:
+            # bytes through numpy, which doesn't know bfloat16, so reinterpret as raw bytes first
+            f.write(tensors[name].reshape(-1).view(torch.uint8).numpy().tobytes())
+
+
+def load_safetensors(path: str, use_mmap: bool = True) -> Tuple[Dict[str, torch.Tensor], Dict[str, str]]:
+    """Read a safetensors file.
+
+    Args:
+        path (str): path to the file.
+        use_mmap (bool): view the tensors from a private memory map of the file instead of reading it. Pages are
+            loaded on first access and shared with every process mapping the same file until they are written to.
+            Defaults to True.
+
+    Returns:
+        Tuple[Dict[str, torch.Tensor], Dict[str, str]]: the tensors and the metadata of the file.
+    """
+    with open(path, "rb") as f:
+        header_size = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(header_size))
+        if use_mmap:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        else:
+            f.seek(0)
+            buffer = bytearray(f.read())
+    metadata = header.pop("__metadata__", {})
+    start = 8 + header_size
+    tensors = {}
+    for name, info in header.items():
+        begin, end = info["data_offsets"]
+        dtype = _DTYPES[info["dtype"]]
+        if end == begin:
+            tensors[name] = torch.empty(info["shape"], dtype=dtype)
+            continue
+        tensor = torch.frombuffer(buffer, dtype=torch.uint8, count=end - begin, offset=start + begin)
+        tensors[name] = tensor.view(dtype).reshape(info["shape"])
+    return tensors, metadata
+
+
+def fold_weight_norm(model: torch.nn.Module) -> int:
+    """Replace the weight norm parametrizations of a model by the weights they compute.
+
+    The weights stop being recomputed at every forward pass. Only for inference, the model can't be trained
+    with weight norm anymore.
+
+    Returns:
+        int: number of folded weights.
+    """
+    folded = 0
+    for module in model.modules():
+        if not parametrize.is_parametrized(module):
+            continue
+        for name in list(module.parametrizations.keys()):
+            if any(type(p).__name__ == "_WeightNorm" for p in module.parametrizations[name]):
+                parametrize.remove_parametrizations(module, name, leave_parametrized=True)
+                folded += 1
+    return folded
+
+
+def is_bundle(path: str) -> bool:
+    return path is not None and os.path.isfile(os.path.join(path, BUNDLE_WEIGHTS))
+
+
+def _set_config_path(config: Coqpit, key: str, value):
+    """Point a file path in the config and its model args to a bundled file."""
+    if hasattr(config, key):
+        config[key] = value
+    model_args = getattr(config, "model_args", None)
+    if model_args is not None and hasattr(model_args, key):
+        # `d_vector_file` is a list in the model args
+        model_args[key] = [value] if isinstance(model_args[key], list) and value is not None else value
+
+
+def export_bundle(model: torch.nn.Module, config: Coqpit, output_path: str, dtype: str = "fp32") -> str:
+    """Export a loaded TTS model to an inference bundle.
+
+    Args:
+        model (torch.nn.Module): TTS model with its checkpoint loaded, e.g. `Synthesizer.tts_model`. It is modified:
+            weight norm is folded and the discriminator is dropped.
+        config (Coqpit): model config.
+        output_path (str): bundle folder, created if needed.
+        dtype (str): "fp32" or "fp16". fp16 halves the size of the bundle, the weights are cast back to fp32 when
+            the bundle is loaded. Defaults to "fp32".
+
+    Returns:
+        str: path to the bundle.
+    """
+    if dtype not in ("fp32", "fp16"):
+        raise ValueError(f" [!] Unsupported bundle dtype: {dtype}. Use fp32 or fp16.")
+    os.makedirs(output_path, exist_ok=True)
+    config = copy.deepcopy(config)
+
+    # the discriminator is only used for training
+    if getattr(model, "disc", None) is not None:
+        model.disc = None
+    if hasattr(config, "model_args") and hasattr(config.model_args, "init_discriminator"):
+        config.model_args.init_discriminator = False
+    num_folded = fold_weight_norm(model)
+
+    speaker_manager = getattr(model, "speaker_manager", None)
+    if speaker_manager is not None and speaker_manager.embeddings:
+        speaker_manager.save_embeddings_to_file(os.path.join(output_path, BUNDLE_D_VECTORS))
+        _set_config_path(config, "d_vector_file", BUNDLE_D_VECTORS)
+    elif speaker_manager is not None and speaker_manager.name_to_id:
+        speaker_manager.save_ids_to_file(os.path.join(output_path, BUNDLE_SPEAKERS))
+        _set_config_path(config, "speakers_file", BUNDLE_SPEAKERS)
+    language_manager = getattr(model, "language_manager", None)
+    if language_manager is not None and language_manager.name_to_id:
+        language_manager.save_ids_to_file(os.path.join(output_path, BUNDLE_LANGUAGES))
+        _set_config_path(config, "language_ids_file", BUNDLE_LANGUAGES)
+    config.save_json(os.path.join(output_path, BUNDLE_CONFIG))
+
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is not None:
+        with open(os.path.join(output_path, BUNDLE_VOCAB), "w", encoding="utf-8") as f:
+            json.dump({"vocab": tokenizer.characters.vocab}, f, ensure_ascii=False, indent=2)
+
+    state_dict = {key: value for key, value in model.state_dict().items() if "speaker_encoder" not in key}
+    if dtype == "fp16":
+        state_dict = {key: value.half() if value.is_floating_point() else value for key, value in state_dict.items()}
+    metadata = {"format": "coqui-tts-bundle", "dtype": dtype, "weight_norm": "folded", "num_folded": str(num_folded)}
+    save_safetensors(state_dict, os.path.join(output_path, BUNDLE_WEIGHTS), metadata)
+    return output_path
+
+
+def load_bundle(bundle_path: str, use_cuda: bool = False) -> Tuple[Coqpit, torch.nn.Module]:
+    """Load an inference bundle written by `export_bundle`.
+
+    The model is built from the bundled config with weight norm folded, then its parameters are replaced by views
+    of the memory mapped weights, without copying them. fp16 bundles are cast to fp32.
+
+    Args:
+        bundle_path (str): bundle folder.
+        use_cuda (bool): move the model to the GPU. Defaults to False.
+
+    Returns:
+        Tuple[Coqpit, torch.nn.Module]: the model config and the model, in eval mode.
+    """
+    config = load_config(os.path.join(bundle_path, BUNDLE_CONFIG))
+    for key, file_name in (
+        ("speakers_file", BUNDLE_SPEAKERS),
+        ("d_vector_file", BUNDLE_D_VECTORS),
+        ("language_ids_file", BUNDLE_LANGUAGES),
+    ):
+        if os.path.isfile(os.path.join(bundle_path, file_name)):
+            _set_config_path(config, key, os.path.join(bundle_path, file_name))
+
+    model = setup_model(config)
+    fold_weight_norm(model)
+
+    vocab_path = os.path.join(bundle_path, BUNDLE_VOCAB)
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is not None and os.path.isfile(vocab_path):
+        with open(vocab_path, "r", encoding="utf-8") as f:
+            vocab = json.load(f)["vocab"]
+        if list(tokenizer.characters.vocab) != vocab:
+            raise ValueError(f" [!] The tokenizer built from the config doesn't match the vocabulary of {bundle_path}.")
+
+    state_dict, metadata = load_safetensors(os.path.join(bundle_path, BUNDLE_WEIGHTS))
+    if metadata.get("dtype") == "fp16":
+        state_dict = {
+            key: value.float() if value.dtype == torch.float16 else value for key, value in state_dict.items()
+        }
+    model.load_state_dict(state_dict, assign=True)
+    model.eval()
+    if use_cuda:
+        model.cuda()
+    return config, model
@@ -0,0 +1,109 @@
+"""int8 post-training quantization of the ONNX models run by the `onnx` backend of `Synthesizer`.
+
+The convolutions and matrix products of the text encoder, the flow and the HiFi-GAN decoder get int8 weights. Static
+quantization also fixes the scale of their inputs from calibration sentences and runs them with int8 kernels, which
+is where the CPU speedup comes from. Dynamic quantization only needs the model, but computes the input scales at
+every call and runs `ConvInteger`, which is usually slower than fp32 on CPU for convolution heavy models like VITS.
+
+Needs the `onnxruntime` package.
+"""
+import os
+from typing import Dict, List
+
+import numpy as np
+
+QUANTIZATION_MODES = ("static", "dynamic")
+
+
+def quantized_model_path(onnx_path: str, mode: str = "static") -> str:
+    """Path of the int8 model of an ONNX model, e.g. `best_model.int8.onnx` for `best_model.onnx`."""
+    base = os.path.splitext(onnx_path)[0]
+    return f"{base}.int8.onnx" if mode == "static" else f"{base}.int8-{mode}.onnx"
+
+
+def calibration_feeds(
+    model, texts: List[str], speaker_ids: List[int] = None, language_ids: List[int] = None
+) -> List[Dict]:
+    """ONNX session inputs of the calibration sentences, one sentence per feed.
+
+    Args:
+        model (Vits): the model the ONNX model was exported from, for its tokenizer and inference scales.
+        texts (List[str]): calibration sentences, preferably a sample of the training metadata.
+        speaker_ids (List[int], optional): speaker ID of each sentence for multi-speaker models. Defaults to None.
+        language_ids (List[int], optional): language ID of each sentence for multi-lingual models. Defaults to None.
+    """
+    feeds = []
+    for idx, text in enumerate(texts):
+        token_ids = np.array([model.tokenizer.text_to_ids(text)], dtype=np.int64)
+        feeds.append(
+            model._onnx_inputs(  # pylint: disable=protected-access
+                token_ids,
+                speaker_id=None if speaker_ids is None else speaker_ids[idx],
+                language_id=None if language_ids is None else language_ids[idx],
+            )
+        )
+    return feeds
+
+
+def quantize_onnx(
+    onnx_path: str, output_path: str = None, mode: str = "static", feeds: List[Dict] = None, per_channel: bool = True
+) -> str:
+    """Quantize the `Conv` and `MatMul` nodes of an ONNX model to int8.
+
+    Nodes without a constant weight, like the attention score products of the text encoder, stay in fp32.
+
+    Args:
+        onnx_path (str): fp32 model exported by `Vits.export_onnx`.
+        output_path (str, optional): path of the int8 model. Defaults to `quantized_model_path(onnx_path, mode)`.
+        mode (str, optional): "static" or "dynamic". Defaults to "static".
+        feeds (List[Dict], optional): calibration inputs of static quantization, see `calibration_feeds`.
+        per_channel (bool, optional): one weight scale per output channel with static quantization. Defaults to True.
+
+    Returns:
+        str: path of the int8 model.
+    """
+    import onnx  # pylint: disable=import-outside-toplevel
+    from onnxruntime import quantization  # pylint: disable=import-outside-toplevel
+
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f" [!] Unknown quantization mode `{mode}`, use one of {QUANTIZATION_MODES}.")
+    if mode == "static" and not feeds:
+        raise ValueError(" [!] Static quantization needs calibration inputs.")
+    output_path = output_path or quantized_model_path(onnx_path, mode)
+
+    graph = onnx.load(onnx_path).graph
+    initializers = {initializer.name for initializer in graph.initializer}
+    op_types = ["Conv", "MatMul"]
+    computed_weights = [
+        node.name
+        for node in graph.node
+        if node.op_type in op_types and len(node.input) > 1 and node.input[1] not in initializers
+    ]
+
+    if mode == "dynamic":
+        quantization.quantize_dynamic(
+            onnx_path,
+            output_path,
+            op_types_to_quantize=op_types,
+            weight_type=quantization.QuantType.QInt8,
+            nodes_to_exclude=computed_weights,
+        )
+        return output_path
+
+    class _FeedReader(quantization.CalibrationDataReader):
+        def __init__(self):
+            self.feeds = iter(feeds)
+
+        def get_next(self):
+            return next(self.feeds, None)
+
+    quantization.quantize_static(
+        onnx_path,
+        output_path,
+        _FeedReader(),
+        quant_format=quantization.QuantFormat.QDQ,
+        op_types_to_quantize=op_types,
+        per_channel=per_channel,
+        nodes_to_exclude=computed_weights,
+    )
+    return output_path
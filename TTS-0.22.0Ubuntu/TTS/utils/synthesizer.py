@@ -1,6 +1,7 @@
+import hashlib
 import os
 import time
-from typing import List
+from typing import Dict, Iterator, List, Union
 
 import numpy as np
 import pysbd
@@ -14,13 +15,22 @@ from TTS.tts.models.vits import Vits
 
 # pylint: disable=unused-wildcard-import
 # pylint: disable=wildcard-import
-from TTS.tts.utils.synthesis import synthesis, transfer_voice, trim_silence
+from TTS.tts.utils.synthesis import synthesis, synthesis_batch, synthesis_stream, transfer_voice, trim_silence
 from TTS.utils.audio import AudioProcessor
 from TTS.utils.audio.numpy_transforms import save_wav
+from TTS.utils.generic_utils import get_user_data_dir
+from TTS.utils.model_bundle import BUNDLE_WEIGHTS, is_bundle, load_bundle
+from TTS.utils.sentence_cache import SentenceCache
 from TTS.vc.models import setup_model as setup_vc_model
 from TTS.vocoder.models import setup_model as setup_vocoder_model
 from TTS.vocoder.utils.generic_utils import interpolate_vocoder_input
 
+BACKENDS = ("torch", "onnx", "torchscript")
+# token lengths `Synthesizer.warmup` runs the model with
+WARMUP_TOKEN_LENGTHS = (32, 64, 128, 256)
+# samples of silence `Synthesizer.tts` appends after each sentence
+SENTENCE_SILENCE = 10000
+
 
 class Synthesizer(nn.Module):
     def __init__(
@@ -38,6 +48,11 @@ class Synthesizer(nn.Module):
         model_dir: str = "",
         voice_dir: str = None,
         use_cuda: bool = False,
+        sentence_cache_size: int = 0,
+        backend: str = "torch",
+        onnx_intra_op_threads: int = 0,
+        onnx_inter_op_threads: int = 0,
+        torchscript_cache_dir: str = None,
     ) -> None:
         """General 🐸 TTS interface for inference. It takes a tts and a vocoder
         model and synthesize speech from the provided text.
@@ -60,6 +75,18 @@ class Synthesizer(nn.Module):
             vc_checkpoint (str, optional): path to the voice conversion model file. Defaults to `""`,
             vc_config (str, optional): path to the voice conversion config file. Defaults to `""`,
             use_cuda (bool, optional): enable/disable cuda. Defaults to False.
+            sentence_cache_size (int, optional): number of synthesized sentences to keep in memory and reuse in
+                `tts()`. Defaults to 0 (disabled).
+            backend (str, optional): runtime of the TTS model, `torch`, `onnx` or `torchscript`. The `onnx` backend
+                runs a VITS model in ONNX Runtime. `tts_checkpoint` is then a model exported by `Vits.export_onnx` or a
+                checkpoint, exported next to it on first use. The `torchscript` backend runs the VITS inference traced
+                by `Vits.export_torchscript`, cached in `torchscript_cache_dir`. Defaults to `torch`.
+            onnx_intra_op_threads (int, optional): threads running a single operator with the `onnx` backend.
+                Defaults to 0, picked by ONNX Runtime.
+            onnx_inter_op_threads (int, optional): threads running independent operators with the `onnx` backend.
+                Defaults to 0, picked by ONNX Runtime.
+            torchscript_cache_dir (str, optional): folder of the modules traced by the `torchscript` backend, one per
+                checkpoint, config, torch version and device. Defaults to `torchscript` in the TTS data folder.
         """
         super().__init__()
         self.tts_checkpoint = tts_checkpoint
@@ -86,6 +113,15 @@ class Synthesizer(nn.Module):
         self.seg = self._get_segmenter("en")
         self.use_cuda = use_cuda
         self.voice_dir = voice_dir
+        self.sentence_cache = SentenceCache(sentence_cache_size) if sentence_cache_size > 0 else None
+        self.backend = backend
+        self.onnx_intra_op_threads = onnx_intra_op_threads
+        self.onnx_inter_op_threads = onnx_inter_op_threads
+        self.torchscript_cache_dir = torchscript_cache_dir or os.path.join(get_user_data_dir("tts"), "torchscript")
+        if backend not in BACKENDS:
+            raise ValueError(f" [!] Unknown backend `{backend}`, use one of {BACKENDS}.")
+        if backend != "torch" and (vocoder_checkpoint or vc_checkpoint or model_dir):
+            raise ValueError(f" [!] The {backend} backend only runs TTS checkpoints that output waveforms, like VITS.")
         if self.use_cuda:
             assert torch.cuda.is_available(), "CUDA is not availabe on this machine."
 
@@ -174,11 +210,22 @@ class Synthesizer(nn.Module):
         4. Move the model to the GPU if CUDA is enabled.
         5. Init the speaker manager in the model.
 
+        `tts_checkpoint` can also be an inference bundle folder written by `TTS.utils.model_bundle.export_bundle`,
+        which has its own config.
+
         Args:
-            tts_checkpoint (str): path to the model checkpoint.
+            tts_checkpoint (str): path to the model checkpoint or bundle.
             tts_config_path (str): path to the model config file.
             use_cuda (bool): enable/disable CUDA use.
         """
+        if is_bundle(tts_checkpoint):
+            self.tts_config, self.tts_model = load_bundle(tts_checkpoint, use_cuda)
+            if self.backend == "onnx":
+                self._load_tts_onnx(os.path.join(tts_checkpoint, "model.onnx"), tts_checkpoint, use_cuda)
+            elif self.backend == "torchscript":
+                self._load_tts_torchscript(os.path.join(tts_checkpoint, BUNDLE_WEIGHTS), use_cuda)
+            return
+
         # pylint: disable=global-statement
         self.tts_config = load_config(tts_config_path)
         if self.tts_config["use_phonemes"] and self.tts_config["phonemizer"] is None:
@@ -189,6 +236,12 @@ class Synthesizer(nn.Module):
         if not self.encoder_checkpoint:
             self._set_speaker_encoder_paths_from_tts_config()
 
+        if self.backend == "onnx" and tts_checkpoint.endswith(".onnx"):
+            # the weights are in the ONNX model, the torch model only holds the tokenizer and the speakers
+            self.tts_model.eval()
+            self._load_tts_onnx(tts_checkpoint, None, use_cuda)
+            return
+
         self.tts_model.load_checkpoint(self.tts_config, tts_checkpoint, eval=True)
         if use_cuda:
             self.tts_model.cuda()
@@ -196,6 +249,88 @@ class Synthesizer(nn.Module):
         if self.encoder_checkpoint and hasattr(self.tts_model, "speaker_manager"):
             self.tts_model.speaker_manager.init_encoder(self.encoder_checkpoint, self.encoder_config, use_cuda)
 
+        if self.backend == "onnx":
+            self._load_tts_onnx(os.path.splitext(tts_checkpoint)[0] + ".onnx", tts_checkpoint, use_cuda)
+        elif self.backend == "torchscript":
+            self._load_tts_torchscript(tts_checkpoint, use_cuda)
+
+    def _load_tts_onnx(self, onnx_path: str, tts_checkpoint: str, use_cuda: bool) -> None:
+        """Load the ONNX model of the TTS model into an ONNX Runtime session.
+
+        The loaded torch model is exported to `onnx_path` first, unless it holds an export newer than
+        `tts_checkpoint`.
+
+        Args:
+            onnx_path (str): path to the ONNX model.
+            tts_checkpoint (str): path to the checkpoint or bundle the ONNX model is exported from. None to load
+                `onnx_path` as is.
+            use_cuda (bool): enable/disable CUDA use.
+        """
+        if not isinstance(self.tts_model, Vits):
+            raise ValueError(" [!] The ONNX backend only runs VITS models.")
+        if tts_checkpoint is not None and (
+            not os.path.isfile(onnx_path) or os.path.getmtime(onnx_path) < os.path.getmtime(tts_checkpoint)
+        ):
+            print(f" > Exporting the model to {onnx_path}")
+            self.tts_model.export_onnx(output_path=onnx_path, verbose=False)
+        self.tts_model.load_onnx(
+            onnx_path,
+            cuda=use_cuda,
+            intra_op_num_threads=self.onnx_intra_op_threads,
+            inter_op_num_threads=self.onnx_inter_op_threads,
+        )
+
+    def _torchscript_key(self, tts_checkpoint: str, use_cuda: bool) -> str:
+        """Hash of everything the traced module depends on: the checkpoint, the config, torch and the device."""
+        digest = hashlib.sha256()
+        with open(tts_checkpoint, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(self.tts_config.to_json().encode("utf-8"))
+        digest.update(f"{torch.__version__}|{'cuda' if use_cuda else 'cpu'}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_tts_torchscript(self, tts_checkpoint: str, use_cuda: bool) -> None:
+        """Load the traced inference of the TTS model.
+
+        The module is read from `torchscript_cache_dir` when it holds one traced from the same checkpoint and
+        config, otherwise the loaded torch model is traced and saved there first.
+
+        Args:
+            tts_checkpoint (str): path to the checkpoint file the torch model was loaded from.
+            use_cuda (bool): enable/disable CUDA use.
+        """
+        if not isinstance(self.tts_model, Vits):
+            raise ValueError(" [!] The TorchScript backend only runs VITS models.")
+        module_path = os.path.join(self.torchscript_cache_dir, f"{self._torchscript_key(tts_checkpoint, use_cuda)}.pt")
+        if not os.path.isfile(module_path):
+            print(f" > Tracing the model to {module_path}")
+            os.makedirs(self.torchscript_cache_dir, exist_ok=True)
+            self.tts_model.export_torchscript(module_path)
+        self.tts_model.load_torchscript(module_path, cuda=use_cuda)
+
+    def load_tts_checkpoint(self, tts_checkpoint: str) -> None:
+        """Load the weights of another checkpoint of the same model into the loaded TTS model.
+
+        The model isn't built again, only its state dict is replaced, which makes going through the checkpoints of
+        a training run much faster than creating a `Synthesizer` for each one. The checkpoint must match the config
+        the synthesizer was created with.
+
+        Args:
+            tts_checkpoint (str): path to the model checkpoint.
+        """
+        if is_bundle(self.tts_checkpoint):
+            raise ValueError(" [!] The weights of a model loaded from a bundle can't be replaced by a checkpoint.")
+        if self.backend == "onnx":
+            raise ValueError(" [!] The weights of a model run by the ONNX backend can't be replaced by a checkpoint.")
+        self.tts_model.load_checkpoint(self.tts_config, tts_checkpoint, eval=True)
+        if self.backend == "torchscript":
+            self._load_tts_torchscript(tts_checkpoint, self.use_cuda)
+        self.tts_checkpoint = tts_checkpoint
+        # the cached sentences were synthesized by the previous weights
+        if self.sentence_cache is not None:
+            self.sentence_cache.clear()
+
     def _set_speaker_encoder_paths_from_tts_config(self):
         """Set the encoder paths from the tts model config for models with speaker encoders."""
         if hasattr(self.tts_config, "model_args") and hasattr(
@@ -254,54 +389,167 @@ class Synthesizer(nn.Module):
         output_wav = self.vc_model.voice_conversion(source_wav, target_wav)
         return output_wav
 
-    def tts(
+    def inference_settings(self) -> dict:
+        """Model settings that change the synthesized waveform of a sentence."""
+        return {
+            "noise_scale": getattr(self.tts_model, "inference_noise_scale", None),
+            "noise_scale_dp": getattr(self.tts_model, "inference_noise_scale_dp", None),
+            "length_scale": getattr(self.tts_model, "length_scale", None),
+        }
+
+    def _supports_batch_synthesis(self, style_wav=None) -> bool:
+        """Batched synthesis needs a VITS model that outputs waveforms directly."""
+        return isinstance(self.tts_model, Vits) and self.vocoder_model is None and style_wav is None
+
+    @staticmethod
+    def _length_buckets(lengths: List[int], batch_size: int) -> List[List[int]]:
+        """Group the indices of the inputs into batches of inputs of about the same length, longest first."""
+        order = sorted(range(len(lengths)), key=lambda idx: lengths[idx], reverse=True)
+        return [order[idx : idx + batch_size] for idx in range(0, len(order), batch_size)]
+
+    def _synthesize_batch(
+        self, sens: List[str], speaker_ids=None, d_vectors=None, language_ids=None, batch_size: int = 16
+    ) -> List[np.ndarray]:
+        """Synthesize the sentences with one VITS forward pass per length bucket and return one trimmed waveform per
+        sentence, in the input order. `speaker_ids`, `d_vectors` and `language_ids` have one entry per sentence."""
+        language_names = [None] * len(sens)
+        if language_ids is not None:
+            id_to_name = {v: k for k, v in self.tts_model.language_manager.name_to_id.items()}
+            language_names = [id_to_name[language_id] for language_id in language_ids]
+        token_ids = [
+            self.tts_model.tokenizer.text_to_ids(sen, language=language_name)
+            for sen, language_name in zip(sens, language_names)
+        ]
+
+        def select(values, bucket):
+            return None if values is None else [values[idx] for idx in bucket]
+
+        waveforms = [None] * len(sens)
+        for bucket in self._length_buckets([len(ids) for ids in token_ids], batch_size):
+            outputs = synthesis_batch(
+                model=self.tts_model,
+                texts=select(sens, bucket),
+                CONFIG=self.tts_config,
+                use_cuda=self.use_cuda,
+                speaker_ids=select(speaker_ids, bucket),
+                d_vectors=select(d_vectors, bucket),
+                language_ids=select(language_ids, bucket),
+                token_ids=select(token_ids, bucket),
+                backend=self.backend,
+            )
+            for idx, waveform in zip(bucket, outputs["wavs"]):
+                if "do_trim_silence" in self.tts_config.audio and self.tts_config.audio["do_trim_silence"]:
+                    waveform = trim_silence(waveform, self.tts_model.ap)
+                waveforms[idx] = waveform
+        return waveforms
+
+    def tts_batch(
         self,
-        text: str = "",
-        speaker_name: str = "",
+        texts: List[str],
+        speakers: Union[str, List[str]] = None,
         language_name: str = "",
         speaker_wav=None,
-        style_wav=None,
-        style_text=None,
-        reference_wav=None,
-        reference_speaker_name=None,
-        split_sentences: bool = True,
-        **kwargs,
-    ) -> List[int]:
-        """🐸 TTS magic. Run all the models and generate speech.
+        batch_size: int = 16,
+    ) -> List[np.ndarray]:
+        """Synthesize many texts at once and return one waveform per text, in the input order.
+
+        The texts are tokenized, sorted by token length and cut into buckets of `batch_size` texts, so each padded
+        batch holds texts of about the same length. A VITS model synthesizes each bucket in one forward pass and the
+        waveforms are cropped back to their own length. Other models synthesize the texts one by one with `tts()`.
+        Texts aren't split into sentences and no silence is appended.
 
         Args:
-            text (str): input text.
-            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
-            language_name (str, optional): language id for multi-language models. Defaults to "".
+            texts (List[str]): input texts.
+            speakers (Union[str, List[str]], optional): speaker name of every text, or one speaker for all of them,
+                for multi-speaker models. Defaults to None.
+            language_name (str, optional): language of the texts for multi-language models. Defaults to "".
             speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
-            style_wav ([type], optional): style waveform for GST. Defaults to None.
-            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
-            reference_wav ([type], optional): reference waveform for voice conversion. Defaults to None.
-            reference_speaker_name ([type], optional): speaker id of reference waveform. Defaults to None.
-            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
-            **kwargs: additional arguments to pass to the TTS model.
+            batch_size (int, optional): texts synthesized per forward pass. Defaults to 16.
+
         Returns:
-            List[int]: [description]
+            List[np.ndarray]: the waveform of each text.
         """
-        start_time = time.time()
-        wavs = []
+        if speakers is None or isinstance(speakers, str):
+            speakers = [speakers] * len(texts)
+        if len(speakers) != len(texts):
+            raise ValueError(f" [!] {len(texts)} texts but {len(speakers)} speakers.")
+
+        if not self._supports_batch_synthesis():
+            return [
+                # without the silence `tts()` appends after the sentence
+                np.array(
+                    self.tts(
+                        text,
+                        speaker_name=speaker,
+                        language_name=language_name,
+                        speaker_wav=speaker_wav,
+                        split_sentences=False,
+                    )[:-SENTENCE_SILENCE]
+                )
+                for text, speaker in zip(texts, speakers)
+            ]
+
+        voices = {}
+        for speaker in speakers:
+            if speaker not in voices:
+                voices[speaker] = self._voice_inputs(speaker, language_name, speaker_wav)
+        speaker_ids = [voices[speaker][0] for speaker in speakers]
+        d_vectors = [voices[speaker][1] for speaker in speakers]
+        language_ids = [voices[speaker][2] for speaker in speakers]
+        return self._synthesize_batch(
+            texts,
+            speaker_ids=None if speaker_ids[0] is None else speaker_ids,
+            d_vectors=None if d_vectors[0] is None else [np.asarray(d_vector).reshape(-1) for d_vector in d_vectors],
+            language_ids=None if language_ids[0] is None else language_ids,
+            batch_size=batch_size,
+        )
+
+    def warmup(self, token_lengths: List[int] = WARMUP_TOKEN_LENGTHS, batch_size: int = 1) -> Dict[int, float]:
+        """Synthesize a dummy input of each token length, so the first requests run as fast as the next ones.
+
+        The `torchscript` backend optimizes its graph during the first calls with new input shapes, and every
+        backend allocates its buffers on the first inputs of a size. Only for VITS models.
 
-        if not text and not reference_wav:
-            raise ValueError(
-                "You need to define either `text` (for sythesis) or a `reference_wav` (for voice conversion) to use the Coqui TTS API."
-            )
+        Args:
+            token_lengths (List[int], optional): token lengths of the dummy inputs. Defaults to
+                `WARMUP_TOKEN_LENGTHS`.
+            batch_size (int, optional): inputs per dummy batch. Defaults to 1.
 
-        if text:
-            sens = [text]
-            if split_sentences:
-                print(" > Text splitted to sentences.")
-                sens = self.split_into_sentences(text)
-            print(sens)
+        Returns:
+            Dict[int, float]: seconds the dummy input of each token length took.
+        """
+        if not self._supports_batch_synthesis():
+            return {}
+        model = self.tts_model
+        ids = model.tokenizer.text_to_ids("warm up")
+        speaker_ids = [0] * batch_size if model.num_speakers > 0 else None
+        d_vectors = None
+        if self.backend == "torch" and model.args.use_d_vector_file:
+            d_vectors = [np.zeros(model.args.d_vector_dim, dtype=np.float32)] * batch_size
+        language_ids = None
+        if getattr(model, "num_languages", 0) > 0 and model.embedded_language_dim > 0:
+            language_ids = [0] * batch_size
+
+        timings = {}
+        for length in token_lengths:
+            start = time.time()
+            synthesis_batch(
+                model=model,
+                texts=[""] * batch_size,
+                CONFIG=self.tts_config,
+                use_cuda=self.use_cuda,
+                speaker_ids=speaker_ids,
+                d_vectors=d_vectors,
+                language_ids=language_ids,
+                token_ids=[(ids * (length // len(ids) + 1))[:length]] * batch_size,
+                backend=self.backend,
+            )
+            timings[length] = time.time() - start
+        return timings
 
-        # handle multi-speaker
-        if "voice_dir" in kwargs:
-            self.voice_dir = kwargs["voice_dir"]
-            kwargs.pop("voice_dir")
+    def _voice_inputs(self, speaker_name: str = "", language_name: str = "", speaker_wav=None):
+        """Speaker ID, speaker embedding and language ID of the model inputs for a speaker and language name or a
+        reference clip of the speaker."""
         speaker_embedding = None
         speaker_id = None
         if self.tts_speakers_file or hasattr(self.tts_model.speaker_manager, "name_to_id"):
@@ -372,6 +620,59 @@ class Synthesizer(nn.Module):
             and self.tts_model.speaker_manager.encoder_ap is not None
         ):
             speaker_embedding = self.tts_model.speaker_manager.compute_embedding_from_clip(speaker_wav)
+        return speaker_id, speaker_embedding, language_id
+
+    def tts(
+        self,
+        text: str = "",
+        speaker_name: str = "",
+        language_name: str = "",
+        speaker_wav=None,
+        style_wav=None,
+        style_text=None,
+        reference_wav=None,
+        reference_speaker_name=None,
+        split_sentences: bool = True,
+        **kwargs,
+    ) -> List[int]:
+        """🐸 TTS magic. Run all the models and generate speech.
+
+        Args:
+            text (str): input text.
+            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
+            language_name (str, optional): language id for multi-language models. Defaults to "".
+            speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
+            style_wav ([type], optional): style waveform for GST. Defaults to None.
+            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
+            reference_wav ([type], optional): reference waveform for voice conversion. Defaults to None.
+            reference_speaker_name ([type], optional): speaker id of reference waveform. Defaults to None.
+            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
+            **kwargs: additional arguments to pass to the TTS model.
+        Returns:
+            List[int]: [description]
+        """
+        start_time = time.time()
+        wavs = []
+
+        if not text and not reference_wav:
+            raise ValueError(
+                "You need to define either `text` (for sythesis) or a `reference_wav` (for voice conversion) to use the Coqui TTS API."
+            )
+        if self.backend == "onnx" and (style_wav is not None or reference_wav):
+            raise ValueError(" [!] The ONNX backend doesn't support `style_wav` and `reference_wav`.")
+
+        if text:
+            sens = [text]
+            if split_sentences:
+                print(" > Text splitted to sentences.")
+                sens = self.split_into_sentences(text)
+            print(sens)
+
+        # handle multi-speaker
+        if "voice_dir" in kwargs:
+            self.voice_dir = kwargs["voice_dir"]
+            kwargs.pop("voice_dir")
+        speaker_id, speaker_embedding, language_id = self._voice_inputs(speaker_name, language_name, speaker_wav)
 
         vocoder_device = "cpu"
         use_gl = self.vocoder_model is None
@@ -381,7 +682,36 @@ class Synthesizer(nn.Module):
             vocoder_device = "cuda"
 
         if not reference_wav:  # not voice conversion
-            for sen in sens:
+            # reuse sentences that were already synthesized with the same voice
+            sentence_wavs = [None] * len(sens)
+            cache_keys = [None] * len(sens)
+            if self.sentence_cache is not None and style_wav is None and not hasattr(self.tts_model, "synthesize"):
+                settings = self.inference_settings()
+                for idx, sen in enumerate(sens):
+                    cache_keys[idx] = self.sentence_cache.make_key(
+                        sen, speaker_id, speaker_embedding, language_id, settings
+                    )
+                    sentence_wavs[idx] = self.sentence_cache.get(cache_keys[idx])
+            misses = [idx for idx, wav in enumerate(sentence_wavs) if wav is None]
+            if len(misses) < len(sens):
+                print(f" > Reusing {len(sens) - len(misses)} cached sentences.")
+
+            # synthesize the missing sentences of a VITS model in length-bucketed batches
+            if (len(misses) > 1 or misses and self.backend != "torch") and self._supports_batch_synthesis(style_wav):
+                waveforms = self._synthesize_batch(
+                    [sens[idx] for idx in misses],
+                    speaker_ids=None if speaker_id is None else [speaker_id] * len(misses),
+                    d_vectors=None
+                    if speaker_embedding is None
+                    else [np.asarray(speaker_embedding).reshape(-1)] * len(misses),
+                    language_ids=None if language_id is None else [language_id] * len(misses),
+                )
+                for idx, waveform in zip(misses, waveforms):
+                    sentence_wavs[idx] = waveform
+                misses = []
+
+            for idx in misses:
+                sen = sens[idx]
                 if hasattr(self.tts_model, "synthesize"):
                     outputs = self.tts_model.synthesize(
                         text=sen,
@@ -437,8 +767,13 @@ class Synthesizer(nn.Module):
                 if "do_trim_silence" in self.tts_config.audio and self.tts_config.audio["do_trim_silence"]:
                     waveform = trim_silence(waveform, self.tts_model.ap)
 
+                sentence_wavs[idx] = waveform
+
+            for idx, waveform in enumerate(sentence_wavs):
+                if cache_keys[idx] is not None:
+                    self.sentence_cache.put(cache_keys[idx], waveform)
                 wavs += list(waveform)
-                wavs += [0] * 10000
+                wavs += [0] * SENTENCE_SILENCE
         else:
             # get the speaker embedding or speaker id for the reference wav file
             reference_speaker_embedding = None
@@ -503,3 +838,52 @@ class Synthesizer(nn.Module):
         print(f" > Processing time: {process_time}")
         print(f" > Real-time factor: {process_time / audio_time}")
         return wavs
+
+    def tts_stream(
+        self,
+        text: str,
+        speaker_name: str = "",
+        language_name: str = "",
+        speaker_wav=None,
+        split_sentences: bool = True,
+        chunk_frames: int = 64,
+        overlap_frames: int = 16,
+    ) -> Iterator[np.ndarray]:
+        """Synthesize speech chunk by chunk, for playback to start before the whole text is synthesized.
+
+        Each sentence is decoded in windows of `chunk_frames` frames, see `Vits.inference_stream`, so the first
+        audio is ready after the first window and the memory used by the decoder doesn't grow with the sentence
+        length. Sentences are separated by the same silence as in `tts()`. Silence isn't trimmed, since the end of
+        a sentence isn't known when its first chunk is returned.
+
+        Args:
+            text (str): input text.
+            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
+            language_name (str, optional): language id for multi-language models. Defaults to "".
+            speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
+            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
+            chunk_frames (int, optional): decoder frames per chunk. Defaults to 64.
+            overlap_frames (int, optional): frames of context decoded on each side of a chunk. Defaults to 16.
+
+        Yields:
+            np.ndarray: the next waveform chunk.
+        """
+        if not hasattr(self.tts_model, "inference_stream") or self.vocoder_model is not None:
+            raise ValueError(" [!] Streaming synthesis needs a model that outputs waveforms, like VITS.")
+        if self.backend == "onnx":
+            raise ValueError(" [!] Streaming synthesis isn't supported by the ONNX backend.")
+        sens = self.split_into_sentences(text) if split_sentences else [text]
+        speaker_id, speaker_embedding, language_id = self._voice_inputs(speaker_name, language_name, speaker_wav)
+        for idx, sen in enumerate(sens):
+            if idx > 0:
+                yield np.zeros(SENTENCE_SILENCE, dtype=np.float32)
+            yield from synthesis_stream(
+                model=self.tts_model,
+                text=sen,
+                use_cuda=self.use_cuda,
+                speaker_id=speaker_id,
+                d_vector=speaker_embedding,
+                language_id=language_id,
+                chunk_frames=chunk_frames,
+                overlap_frames=overlap_frames,
+            )
@@ -0,0 +1,26 @@
+import json
+import subprocess
+import sys
+import unittest
+
+from TTS.bin.benchmark_imports import LAZY_PACKAGES
+
+
+def imported_packages(module: str) -> set:
+    code = f"import json, sys; import {module}; print(json.dumps(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+class LazyImportsTest(unittest.TestCase):
+    def test_synthesizer_imports(self):
+        self.assertEqual(imported_packages("TTS.utils.synthesizer") & set(LAZY_PACKAGES), set())
+
+    def test_phonemizers_on_demand(self):
+        code = (
+            "import sys; from TTS.tts.utils.text import phonemizers; assert 'gruut' not in sys.modules; "
+            "assert 'en-us' in phonemizers.DEF_LANG_TO_PHONEMIZER; "
+            "print(phonemizers.get_phonemizer_by_name('gruut', language='en-us').name())"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.splitlines()[-1], "gruut")
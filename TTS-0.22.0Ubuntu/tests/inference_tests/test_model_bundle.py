@@ -0,0 +1,59 @@
+import os
+import unittest
+
+import numpy as np
+import torch
+from torch.nn.utils import parametrize
+
+from tests import create_tiny_vits_model, get_tests_output_path
+from TTS.utils.model_bundle import export_bundle, fold_weight_norm, load_safetensors, save_safetensors
+from TTS.utils.synthesizer import Synthesizer
+
+
+class ModelBundleTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_path = os.path.join(get_tests_output_path(), "model_bundle")
+        # with a discriminator, to check that the bundle drops it
+        create_tiny_vits_model(cls.output_path, init_discriminator=True)
+
+    def _synthesizer(self, *args):
+        synthesizer = Synthesizer(*args)
+        synthesizer.tts_model.inference_noise_scale = 0.0
+        synthesizer.tts_model.inference_noise_scale_dp = 0.0
+        return synthesizer
+
+    def test_safetensors_round_trip(self):
+        tensors = {"weight": torch.randn(3, 5), "half": torch.randn(7).half(), "steps": torch.arange(3)}
+        path = os.path.join(self.output_path, "tensors.safetensors")
+        save_safetensors(tensors, path, {"format": "test"})
+        loaded, metadata = load_safetensors(path)
+        self.assertEqual(metadata, {"format": "test"})
+        for name, tensor in tensors.items():
+            self.assertTrue(torch.equal(loaded[name], tensor))
+
+    def test_export_and_load(self):
+        checkpoint = self._synthesizer(
+            os.path.join(self.output_path, "checkpoint_1.pth"), os.path.join(self.output_path, "config.json")
+        )
+        text = "This is a test sentence."
+        wav = np.array(checkpoint.tts(text))
+        bundle_path = os.path.join(self.output_path, "bundle")
+        export_bundle(checkpoint.tts_model, checkpoint.tts_config, bundle_path)
+        # the discriminator is dropped and no weight norm is left to fold
+        self.assertFalse(any(key.startswith("disc.") for key in checkpoint.tts_model.state_dict()))
+        self.assertEqual(fold_weight_norm(checkpoint.tts_model), 0)
+
+        bundle = self._synthesizer(bundle_path)
+        self.assertFalse(any(parametrize.is_parametrized(module) for module in bundle.tts_model.modules()))
+        np.testing.assert_allclose(np.array(bundle.tts(text)), wav, atol=1e-5)
+
+        fp16_path = os.path.join(self.output_path, "bundle_fp16")
+        export_bundle(checkpoint.tts_model, checkpoint.tts_config, fp16_path, dtype="fp16")
+        self.assertLess(
+            os.path.getsize(os.path.join(fp16_path, "model.safetensors")),
+            os.path.getsize(os.path.join(bundle_path, "model.safetensors")) * 0.6,
+        )
+        fp16 = self._synthesizer(fp16_path)
+        self.assertEqual(next(fp16.tts_model.parameters()).dtype, torch.float32)
+        self.assertEqual(len(fp16.tts(text)), len(wav))
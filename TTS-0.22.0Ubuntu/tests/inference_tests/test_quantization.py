@@ -0,0 +1,58 @@
+import importlib.util
+import os
+import unittest
+
+import numpy as np
+
+from tests import create_tiny_vits_model, get_tests_output_path
+from TTS.utils.quantization import calibration_feeds, quantize_onnx, quantized_model_path
+from TTS.utils.synthesizer import Synthesizer
+
+
+@unittest.skipIf(importlib.util.find_spec("onnxruntime") is None, "onnxruntime is not installed")
+class QuantizationTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_path = os.path.join(get_tests_output_path(), "quantization")
+        create_tiny_vits_model(cls.output_path)
+        cls.config_path = os.path.join(cls.output_path, "config.json")
+        cls.onnx_path = os.path.join(cls.output_path, "checkpoint_1.onnx")
+        if os.path.exists(cls.onnx_path):
+            os.remove(cls.onnx_path)
+        cls.fp32 = cls._synthesizer(os.path.join(cls.output_path, "checkpoint_1.pth"))
+        cls.text = "This is the first sentence. And this is the second one."
+
+    @classmethod
+    def _synthesizer(cls, checkpoint):
+        synthesizer = Synthesizer(checkpoint, cls.config_path, backend="onnx", onnx_intra_op_threads=1)
+        synthesizer.tts_model.inference_noise_scale = 0.0
+        synthesizer.tts_model.inference_noise_scale_dp = 0.0
+        return synthesizer
+
+    def _check_int8(self, int8_path):
+        self.assertTrue(os.path.isfile(int8_path))
+        self.assertLess(os.path.getsize(int8_path), os.path.getsize(self.onnx_path))
+        wav = np.array(self.fp32.tts(self.text))
+        int8_wav = np.array(self._synthesizer(int8_path).tts(self.text))
+        # the durations come from the same text encoder, only slightly off weights
+        self.assertLess(abs(len(int8_wav) - len(wav)), len(wav) // 10)
+        self.assertTrue(np.isfinite(int8_wav).all())
+
+    def test_static(self):
+        texts = ["A calibration sentence.", "Another, somewhat longer calibration sentence.", "Short one."]
+        feeds = calibration_feeds(self.fp32.tts_model, texts)
+        self.assertEqual(len(feeds), len(texts))
+        self.assertEqual(feeds[0]["input"].shape[0], 1)
+        int8_path = quantize_onnx(self.onnx_path, mode="static", feeds=feeds)
+        self.assertEqual(int8_path, quantized_model_path(self.onnx_path))
+        self._check_int8(int8_path)
+
+    def test_dynamic(self):
+        int8_path = quantize_onnx(self.onnx_path, os.path.join(self.output_path, "dynamic.onnx"), mode="dynamic")
+        self._check_int8(int8_path)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            quantize_onnx(self.onnx_path, mode="fp4")
+        with self.assertRaises(ValueError):
+            quantize_onnx(self.onnx_path, mode="static")
@@ -0,0 +1,56 @@
+import json
+import os
+import shutil
+import unittest
+
+from tests import create_tiny_vits_model, get_tests_output_path, run_cli
+from TTS.bin.synthesize_batch import Sentence, load_sentences, make_batches
+
+
+class SynthesizeBatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_path = os.path.join(get_tests_output_path(), "synthesize_batch")
+        shutil.rmtree(cls.output_path, ignore_errors=True)
+        create_tiny_vits_model(cls.output_path)
+
+    def test_load_sentences(self):
+        csv_path = os.path.join(self.output_path, "metadata.csv")
+        with open(csv_path, "w", encoding="utf-8") as f:
+            f.write('a|Say "hello".|speaker_1\nb|A sentence.\n')
+        self.assertEqual(
+            load_sentences(csv_path), [Sentence("a", 'Say "hello".', "speaker_1"), Sentence("b", "A sentence.")]
+        )
+        jsonl_path = os.path.join(self.output_path, "metadata.jsonl")
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"id": 1, "text": "A sentence."}) + "\n")
+            f.write(json.dumps({"id": "../1", "text": "Another one."}) + "\n")
+        with self.assertRaises(ValueError):
+            load_sentences(jsonl_path)
+
+    def test_make_batches(self):
+        sentences = [Sentence(str(idx), "x" * length) for idx, length in enumerate([3, 9, 1, 5, 7])]
+        batches = make_batches(sentences, 2)
+        self.assertEqual([[len(s.text) for s in batch] for batch in batches], [[9, 7], [5, 3], [1]])
+
+    def test_synthesize_batch(self):
+        metadata_path = os.path.join(self.output_path, "sentences.csv")
+        wavs_path = os.path.join(self.output_path, "wavs")
+        with open(metadata_path, "w", encoding="utf-8") as f:
+            for idx, text in enumerate(["Short one.", "This is a longer test sentence.", "A medium sentence."]):
+                f.write(f"sentence_{idx}|{text}\n")
+        command = (
+            f'CUDA_VISIBLE_DEVICES="" python TTS/bin/synthesize_batch.py --metadata_path "{metadata_path}" '
+            f'--output_path "{wavs_path}" --batch_size 2 '
+            f'--model_path "{os.path.join(self.output_path, "checkpoint_1.pth")}" '
+            f'--config_path "{os.path.join(self.output_path, "config.json")}"'
+        )
+        run_cli(command)
+        self.assertEqual(sorted(os.listdir(wavs_path)), [f"sentence_{idx}.wav" for idx in range(3)])
+
+        # a second run only synthesizes the missing sentences
+        os.remove(os.path.join(wavs_path, "sentence_1.wav"))
+        mtime = os.path.getmtime(os.path.join(wavs_path, "sentence_0.wav"))
+        run_cli(command)
+        self.assertTrue(os.path.isfile(os.path.join(wavs_path, "sentence_1.wav")))
+        self.assertEqual(os.path.getmtime(os.path.join(wavs_path, "sentence_0.wav")), mtime)
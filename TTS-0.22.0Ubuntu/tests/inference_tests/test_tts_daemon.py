@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from unittest import mock
+
+from tests import create_tiny_vits_model, get_tests_output_path
+from TTS.bin.synthesize import load_synthesizer, run_synthesis
+from TTS.server import daemon
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(daemon.__file__))))
+
+
+class TTSDaemonTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_path = os.path.join(get_tests_output_path(), "tts_daemon")
+        create_tiny_vits_model(cls.output_path)
+
+    def _tts(self, *args):
+        model_path = os.path.join(self.output_path, "checkpoint_1.pth")
+        config_path = os.path.join(self.output_path, "config.json")
+        command = [sys.executable, "-m", "TTS.bin.synthesize", "--model_path", model_path, "--config_path", config_path]
+        # the client runs from the output folder, with 🐸TTS importable whether it is installed or not
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT_PATH, os.environ.get("PYTHONPATH", "")]))
+        return subprocess.run(command + list(args), capture_output=True, check=False, cwd=self.output_path, env=env)
+
+    def test_forward_requests(self):
+        address = os.path.join(self.output_path, "daemon.sock")
+        if daemon._tcp_address(daemon.default_address()) is not None:  # pylint: disable=protected-access
+            address = "127.0.0.1:5055"
+        loads = []
+
+        def load(args):
+            synthesizer = load_synthesizer(args)
+            loads.append(args.model_path)
+            return synthesizer
+
+        tts_daemon = daemon.TTSDaemon(load, run_synthesis, address)
+        tts_daemon.bind()
+        thread = threading.Thread(target=tts_daemon.serve_forever)
+        thread.start()
+        try:
+            for i in range(2):
+                result = self._tts(
+                    "--text", "This is a test.", "--out_path", f"out_{i}.wav", "--daemon_address", address
+                )
+                self.assertEqual(result.returncode, 0, result.stderr)
+                self.assertIn(b"Saving output to", result.stdout)
+                # relative paths are resolved from the folder of the client
+                self.assertTrue(os.path.isfile(os.path.join(self.output_path, f"out_{i}.wav")))
+            # the model is loaded once and kept for the next requests
+            self.assertEqual(len(loads), 1)
+
+            result = self._tts("--text", "A test.", "--pipe_out", "--daemon_address", address)
+            self.assertEqual(result.stdout[:4], b"RIFF")
+
+            result = self._tts("--text", "A test.", "--config_path", "missing.json", "--daemon_address", address)
+            self.assertEqual(result.returncode, 1)
+            self.assertIn(b"The tts daemon failed", result.stderr)
+            # the failed load didn't unload the working model
+            result = self._tts("--text", "A test.", "--pipe_out", "--daemon_address", address)
+            self.assertEqual(result.stdout[:4], b"RIFF")
+            self.assertEqual(len(loads), 1)
+        finally:
+            self.assertTrue(daemon.stop(address))
+            thread.join()
+        self.assertFalse(daemon.stop(address))
+
+    @unittest.skipIf(not hasattr(os, "getuid"), "Unix sockets only")
+    def test_socket_owner(self):
+        with mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": self.output_path}):
+            os.environ.pop("TTS_DAEMON_ADDRESS", None)
+            self.assertEqual(daemon.default_address(), os.path.join(self.output_path, "tts-daemon.sock"))
+        address = os.path.join(self.output_path, "owner.sock")
+        tts_daemon = daemon.TTSDaemon(None, None, address)
+        tts_daemon.bind()
+        try:
+            daemon.connect(address).close()
+            # a socket of another user is never sent the requests
+            with mock.patch("os.getuid", return_value=os.getuid() + 1):
+                with self.assertRaises(PermissionError):
+                    daemon.connect(address)
+        finally:
+            tts_daemon.close()
@@ -4,18 +4,36 @@ import { useState, useRef, useEffect } from "react";
 import { Button } from "@/components/ui/button";
 import { Slider } from "@/components/ui/slider";
 import { Play, Pause, Volume2, VolumeX } from "lucide-react";
+import { useStreamingTTS } from "@/hooks/useStreamingTTS";
 
 interface AudioPlayerProps {
-  audioUrl: string;
+  audioUrl?: string;
+  // Preprocessed text to stream from /api/infer-tts/stream instead of an audioUrl
+  streamText?: string;
+  speakerID?: string;
   fileName: string;
   fileInfo: string;
 }
 
 export function AudioPlayer({
-  audioUrl,
+  audioUrl: fileUrl,
+  streamText,
+  speakerID = "default",
   fileName,
   fileInfo,
 }: AudioPlayerProps) {
+  const {
+    streaming,
+    error: streamError,
+    audioUrl: streamedUrl,
+    timeToFirstAudio,
+    streamText: startStream,
+    stop: stopStream,
+  } = useStreamingTTS();
+  // The streamed chunks are played as they arrive, the complete WAV is then
+  // loaded in the player for replay and seeking
+  const audioUrl = fileUrl ?? streamedUrl;
+
   const [isPlaying, setIsPlaying] = useState(false);
   const [duration, setDuration] = useState(0);
   const [currentTime, setCurrentTime] = useState(0);
@@ -36,6 +54,12 @@ export function AudioPlayer({
   const sourceRef = useRef<MediaElementAudioSourceNode | null>(null);
   const dataArrayRef = useRef<Uint8Array | null>(null);
 
+  useEffect(() => {
+    if (!streamText) return;
+    startStream(streamText, speakerID);
+    return () => stopStream();
+  }, [streamText, speakerID]);
+
   // Initialize audio on component mount or when audioUrl changes
   useEffect(() => {
     // Clean up previous audio instance
@@ -61,6 +85,8 @@ export function AudioPlayer({
     setDuration(0);
     setAudioData([]);
 
+    if (!audioUrl) return;
+
     // Create new audio context and analyzer
     const AudioContext =
       window.AudioContext || (window as any).webkitAudioContext;
@@ -444,7 +470,15 @@ export function AudioPlayer({
         </Button>
         <div className="flex-1">
           <p className="font-medium">{fileName}</p>
-          <p className="text-sm text-white/70">{fileInfo}</p>
+          <p className="text-sm text-white/70">
+            {streamError
+              ? streamError
+              : streaming
+              ? timeToFirstAudio === null
+                ? "Streaming..."
+                : `Streaming • first audio after ${timeToFirstAudio.toFixed(2)}s`
+              : fileInfo}
+          </p>
         </div>
       </div>
 
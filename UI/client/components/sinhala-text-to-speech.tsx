@@ -79,6 +79,7 @@ export function SinhalaTextToSpeech({
     setIsGenerated(false);
     setProgress(0);
     setProcessingState("idle");
+    setPreprocessedText("");
 
     try {
       // Process the text using the hook's processText function with progress callback
@@ -105,7 +106,7 @@ export function SinhalaTextToSpeech({
           case "synthesizing_complete":
             setProgress(70);
             if (progressData.raw_audio_url) {
-              setAudioRawUrl(progressData.raw_audio_url.slice(33));
+              setAudioRawUrl(progressData.raw_audio_url);
             }
             break;
 
@@ -118,10 +119,10 @@ export function SinhalaTextToSpeech({
             setProcessingState("complete");
             setProgress(100);
             if (progressData.audio_url) {
-              setAudioUrl(progressData.audio_url.slice(33));
+              setAudioUrl(progressData.audio_url);
             }
             if (progressData.raw_audio_url) {
-              setAudioRawUrl(progressData.raw_audio_url.slice(33));
+              setAudioRawUrl(progressData.raw_audio_url);
             }
             setIsGenerated(true);
             setVoiceRating(0);
@@ -178,7 +179,7 @@ export function SinhalaTextToSpeech({
 
   const handleDownload = () => {
     const a = document.createElement("a");
-    a.href = "E:/UOM/FYP/TTSx/UI/client/public/Audios/cleaned_audio.wav"; // replace with your audio URL
+    a.href = audioUrl;
     a.download = "GeneratedAudio.wav"; // change filename if needed
     document.body.appendChild(a);
     a.click();
@@ -534,6 +535,18 @@ export function SinhalaTextToSpeech({
                 />
               </div>
 
+              {/* Live preview, streamed while the full pipeline runs */}
+              {preprocessedText && processingState !== "Preprocessing" && (
+                <div className="w-full max-w-md">
+                  <AudioPlayer
+                    streamText={preprocessedText}
+                    speakerID={useClonedVoice ? "cloned_speaker" : "default"}
+                    fileName="Live Preview"
+                    fileInfo="Raw • Streamed"
+                  />
+                </div>
+              )}
+
               <p className="text-white/70 text-center max-w-sm">
                 {processingState === "Preprocessing" &&
                   "Analyzing text structure and pronunciation..."}
@@ -670,7 +683,7 @@ export function SinhalaTextToSpeech({
 
               <div className="grid grid-cols-2 gap-4 mt-auto">
                 <a
-                  href="/Audios/InitialInference.wav"
+                  href={isDenoised ? audioUrl : audioRawUrl}
                   download="GeneratedAudio.wav"
                   style={{ display: "contents" }} // lets child button behave normally
                 >
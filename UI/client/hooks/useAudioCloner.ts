@@ -21,6 +21,42 @@ interface CloningProgress {
   error?: string
 }
 
+interface CloneJob {
+  job_id: string
+  status: "queued" | "running" | "succeeded" | "failed" | "cancelled"
+  audio_path: string | null
+  audio_url: string | null
+  error: string | null
+  processing_time: number | null
+}
+
+const CLONE_JOB_POLL_INTERVAL_MS = 1000
+
+// Submits a voice cloning job and polls it until it finishes
+const runCloneJob = async (
+  referenceWAV: string,
+  targetWAV: string,
+  onStatus?: (job: CloneJob) => void,
+): Promise<CloneJob> => {
+  const submitResponse = await axios.post<CloneJob>("http://127.0.0.1:8000/api/clone-jobs", {
+    ReferenceWAV: referenceWAV,
+    TargetWAV: targetWAV,
+  })
+
+  let job = submitResponse.data
+  while (job.status === "queued" || job.status === "running") {
+    onStatus?.(job)
+    await new Promise((resolve) => setTimeout(resolve, CLONE_JOB_POLL_INTERVAL_MS))
+    const statusResponse = await axios.get<CloneJob>(`http://127.0.0.1:8000/api/clone-jobs/${job.job_id}`)
+    job = statusResponse.data
+  }
+
+  if (job.status !== "succeeded") {
+    throw new Error(job.error || `Voice cloning ${job.status}`)
+  }
+  return job
+}
+
 interface UseAudioClonerResult {
   loading: boolean
   error: string | null
@@ -64,19 +100,19 @@ export const useAudioCloner = (): UseAudioClonerResult => {
 
       console.log("Cloning audio with reference:", referenceAudio, "and target:", targetAudio)
 
-      const cloningResponse = await axios.post("http://127.0.0.1:8000/api/Clone-tts", {
-        // ReferenceWAV: referenceAudio,
-        // TargetWAV: targetAudio,
-        ReferenceWAV: "/Audios/ReferenceAudio.wav",
-        TargetWAV: "/Audios/TargetAudio.wav",
-      })
+      // The clone runs as a background job on the server, poll until it is done
+      const cloneJob = await runCloneJob(
+        // referenceAudio,
+        // targetAudio,
+        "/Audios/ReferenceAudio.wav",
+        "/Audios/TargetAudio.wav",
+        (job) => onProgress?.({ stage: "cloning", message: `Voice cloning ${job.status}` }),
+      )
 
-      console.log("Cloning response:", cloningResponse)
+      console.log("Cloning job:", cloneJob)
 
-      // Handle the string response from the API
-      const responseData = cloningResponse.data
-      const rawAudioUrl = typeof responseData === "string" ? responseData : responseData.cloned_audio_path
-      const processingTime = typeof responseData === "string" ? 0 : responseData.processing_time || 0
+      const rawAudioUrl = `http://127.0.0.1:8000${cloneJob.audio_url}`
+      const processingTime = cloneJob.processing_time || 0
 
       onProgress?.({
         stage: "cloning_complete",
@@ -0,0 +1,149 @@
+import { useRef, useState } from "react";
+
+const WAV_HEADER_SIZE = 44;
+
+interface UseStreamingTTSResult {
+  streaming: boolean;
+  error: string | null;
+  audioUrl: string | null;
+  timeToFirstAudio: number | null;
+  streamText: (preprocessedText: string, speakerID: string) => Promise<void>;
+  stop: () => void;
+}
+
+// Builds a playable WAV file from the collected 16 bit PCM chunks
+const buildWavBlob = (chunks: Uint8Array[], sampleRate: number): Blob => {
+  const dataSize = chunks.reduce((size, chunk) => size + chunk.byteLength, 0);
+  const header = new DataView(new ArrayBuffer(WAV_HEADER_SIZE));
+  const writeString = (offset: number, value: string) => {
+    for (let i = 0; i < value.length; i++) header.setUint8(offset + i, value.charCodeAt(i));
+  };
+
+  writeString(0, "RIFF");
+  header.setUint32(4, 36 + dataSize, true);
+  writeString(8, "WAVE");
+  writeString(12, "fmt ");
+  header.setUint32(16, 16, true);
+  header.setUint16(20, 1, true);
+  header.setUint16(22, 1, true);
+  header.setUint32(24, sampleRate, true);
+  header.setUint32(28, sampleRate * 2, true);
+  header.setUint16(32, 2, true);
+  header.setUint16(34, 16, true);
+  writeString(36, "data");
+  header.setUint32(40, dataSize, true);
+
+  return new Blob([header.buffer, ...chunks], { type: "audio/wav" });
+};
+
+/**
+ * Streams synthesized speech from /api/infer-tts/stream and plays every
+ * sentence as soon as it arrives. When the stream ends, `audioUrl` points to
+ * the complete WAV so it can be handed to <AudioPlayer />.
+ */
+export const useStreamingTTS = (): UseStreamingTTSResult => {
+  const [streaming, setStreaming] = useState(false);
+  const [error, setError] = useState<string | null>(null);
+  const [audioUrl, setAudioUrl] = useState<string | null>(null);
+  const [timeToFirstAudio, setTimeToFirstAudio] = useState<number | null>(null);
+
+  const audioContextRef = useRef<AudioContext | null>(null);
+  const abortRef = useRef<AbortController | null>(null);
+
+  const stop = () => {
+    abortRef.current?.abort();
+    if (audioContextRef.current && audioContextRef.current.state !== "closed") {
+      audioContextRef.current.close();
+    }
+    audioContextRef.current = null;
+  };
+
+  const streamText = async (preprocessedText: string, speakerID: string) => {
+    stop();
+    setStreaming(true);
+    setError(null);
+    setAudioUrl(null);
+    setTimeToFirstAudio(null);
+
+    const abortController = new AbortController();
+    abortRef.current = abortController;
+    const startTime = performance.now();
+
+    try {
+      const response = await fetch("http://127.0.0.1:8000/api/infer-tts/stream", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+          preprocessed_text: preprocessedText,
+          speakerID: speakerID,
+          audio_format: "pcm",
+        }),
+        signal: abortController.signal,
+      });
+
+      if (!response.ok || !response.body) {
+        throw new Error(`Streaming failed with status ${response.status}`);
+      }
+
+      const sampleRate = Number(response.headers.get("X-Sample-Rate")) || 22050;
+      const AudioContext = window.AudioContext || (window as any).webkitAudioContext;
+      const audioContext = new AudioContext();
+      audioContextRef.current = audioContext;
+
+      const reader = response.body.getReader();
+      const chunks: Uint8Array[] = [];
+      let leftover = new Uint8Array(0);
+      let playhead = audioContext.currentTime;
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        // Keep whole 16 bit samples only, carry an odd trailing byte over
+        const bytes = new Uint8Array(leftover.byteLength + value.byteLength);
+        bytes.set(leftover);
+        bytes.set(value, leftover.byteLength);
+        const usable = bytes.byteLength - (bytes.byteLength % 2);
+        leftover = bytes.slice(usable);
+        if (usable === 0) continue;
+
+        const pcm = bytes.slice(0, usable);
+        chunks.push(pcm);
+
+        const samples = new Int16Array(pcm.buffer);
+        const buffer = audioContext.createBuffer(1, samples.length, sampleRate);
+        const channel = buffer.getChannelData(0);
+        for (let i = 0; i < samples.length; i++) channel[i] = samples[i] / 32768;
+
+        const source = audioContext.createBufferSource();
+        source.buffer = buffer;
+        source.connect(audioContext.destination);
+        playhead = Math.max(playhead, audioContext.currentTime);
+        source.start(playhead);
+        playhead += buffer.duration;
+
+        if (chunks.length === 1) {
+          setTimeToFirstAudio((performance.now() - startTime) / 1000);
+        }
+      }
+
+      setAudioUrl(URL.createObjectURL(buildWavBlob(chunks, sampleRate)));
+    } catch (err: any) {
+      if (err?.name !== "AbortError") {
+        console.error("Streaming TTS error:", err);
+        setError(err?.message || "Something went wrong.");
+      }
+    } finally {
+      setStreaming(false);
+    }
+  };
+
+  return {
+    streaming,
+    error,
+    audioUrl,
+    timeToFirstAudio,
+    streamText,
+    stop,
+  };
+};
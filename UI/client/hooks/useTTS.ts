@@ -31,6 +31,8 @@ interface UseTTSProcessorResult {
   ) => Promise<void>;
 }
 
+const API_BASE_URL = "http://127.0.0.1:8000";
+
 export const useTTSProcessor = (): UseTTSProcessorResult => {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -73,7 +75,9 @@ export const useTTSProcessor = (): UseTTSProcessorResult => {
         speakerID: speakerID,
       });
 
-      const rawAudioUrl = ttsResponse.data.audio_path;
+      // Every request gets its own audio ID, served by the API until it expires
+      const rawAudioId = ttsResponse.data.audio_id;
+      const rawAudioUrl = `${API_BASE_URL}${ttsResponse.data.audio_url}`;
       const processingTime = ttsResponse.data.processing_time;
 
       onProgress?.({
@@ -87,12 +91,12 @@ export const useTTSProcessor = (): UseTTSProcessorResult => {
       onProgress?.({ stage: "cleaning" });
 
       const cleanResponse = await axios.post("http://localhost:8000/api/clean_audio", {
-        file_path: rawAudioUrl,
+        file_path: rawAudioId,
       });
 
       if (cleanResponse.status === 200) {
-        const cleanedAudioUrl = "/Audios/cleaned_audio.wav";
-        const raw_audio_url = "/Audios/InitialInference.wav";
+        const cleanedAudioUrl = `${API_BASE_URL}${cleanResponse.data.audio_url}`;
+        const raw_audio_url = rawAudioUrl;
         const processingTime = cleanResponse.data.processing_time;
 
         const finalResult: TTSResult = {